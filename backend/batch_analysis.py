@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator
+
+from resume_scorer import analyze_resume_text, calculate_ats_scorecard, extract_text_from_file, prepare_batch_contexts
+from backend.src.resume_analysis.model_registry import WARM_UP_TEXT, warm_up_models
+from backend.src.resume_analysis.stage_graph import set_max_workers
+
+DEFAULT_CHUNK_SIZE = 4
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_batch_workers() -> int:
+    configured = os.getenv("RESUME_BATCH_WORKERS", "").strip()
+    if configured.isdigit():
+        return max(1, int(configured))
+    return max(1, os.cpu_count() or 1)
+
+
+def get_batch_stage_workers() -> int:
+    configured = os.getenv("RESUME_BATCH_STAGE_WORKERS", "").strip()
+    return max(1, int(configured)) if configured.isdigit() else 1
+
+
+def get_batch_chunk_size() -> int:
+    configured = os.getenv("RESUME_BATCH_CHUNK_SIZE", "").strip()
+    return max(1, int(configured)) if configured.isdigit() else DEFAULT_CHUNK_SIZE
+
+
+def get_batch_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = create_batch_pool(get_batch_workers(), get_batch_stage_workers())
+        return _POOL
+
+
+def create_batch_pool(workers: int, stage_workers: int = 1) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=warm_worker,
+        initargs=(stage_workers,),
+    )
+
+
+def shutdown_batch_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+
+
+def warm_worker(stage_workers: int = 1) -> None:
+    set_max_workers(stage_workers)
+    warm_up_models()
+    calculate_ats_scorecard(WARM_UP_TEXT)
+
+
+def analyze_batch_chunk(items: list[dict], job_description: str | None = None, fields: list[str] | None = None) -> list[dict]:
+    records: list[dict] = []
+    ready: list[tuple[dict, str]] = []
+    for item in items:
+        record = {"index": item["index"], "name": item.get("name")}
+        try:
+            text = _item_text(item).strip()
+        except Exception as exc:
+            records.append({**record, "status": "error", "error": str(exc)})
+            continue
+        if not text:
+            records.append({**record, "status": "error", "error": "Could not extract text from resume"})
+        else:
+            ready.append((record, text))
+
+    try:
+        contexts = prepare_batch_contexts([text for _, text in ready], job_description, fields)
+    except Exception:
+        contexts = [None] * len(ready)
+    for (record, text), context in zip(ready, contexts):
+        try:
+            result = analyze_resume_text(text, job_description, context=context, fields=fields)
+            records.append({**record, "status": "ok", "result": result})
+        except Exception as exc:
+            records.append({**record, "status": "error", "error": str(exc)})
+    return records
+
+
+def iter_batch_results(
+    items: Iterable[dict],
+    job_description: str | None = None,
+    fields: list[str] | None = None,
+    *,
+    pool: ProcessPoolExecutor | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[dict]:
+    pool = pool or get_batch_pool()
+    running: dict[Future, list[dict]] = {
+        pool.submit(analyze_batch_chunk, chunk, job_description, fields): chunk
+        for chunk in _chunks(items, chunk_size or get_batch_chunk_size())
+    }
+    try:
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = running.pop(future)
+                try:
+                    yield from future.result()
+                except BrokenProcessPool as exc:
+                    _discard_pool(pool)
+                    for item in chunk:
+                        yield {"index": item["index"], "name": item.get("name"), "status": "error", "error": str(exc)}
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def _chunks(items: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    chunk: list[dict] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _item_text(item: dict) -> str:
+    if item.get("text") is not None:
+        return item["text"]
+    if item.get("path"):
+        return extract_text_from_file(item["path"])
+    return _extract_uploaded_text(item["filename"], item["content"])
+
+
+def _extract_uploaded_text(filename: str, content: bytes) -> str:
+    suffix = os.path.splitext(filename or "")[1].lower()
+    handle, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(handle, "wb") as buffer:
+            buffer.write(content)
+        return extract_text_from_file(path)
+    finally:
+        os.unlink(path)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend.src.resume_analysis.encoder_backends import ENCODER_BACKENDS, PARITY_MIN_COSINE, load_sentence_encoder
+from backend.src.resume_analysis.semantic_utils import SENTENCE_MODEL_NAME, encoder_model_dir
+from quantized_skill_matching import load_sentences
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check encoder backends against torch embeddings and time them.")
+    parser.add_argument("--resumes", type=Path, default=None, help="Directory of .txt resumes to draw sentences from")
+    parser.add_argument("--model-dir", type=Path, default=encoder_model_dir())
+    parser.add_argument("--backends", default=",".join(ENCODER_BACKENDS))
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=512, help="Maximum number of sentences to encode")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def time_encoder(encoder, sentences: list[str], batch_size: int, repeat: int) -> tuple[np.ndarray, float]:
+    encoder.encode(sentences[:batch_size], batch_size=batch_size)
+    timings = []
+    vectors = np.zeros((0, 0), dtype=np.float32)
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        vectors = encoder.encode(sentences, normalize_embeddings=True, batch_size=batch_size)
+        timings.append((time.perf_counter() - started) * 1000)
+    return np.asarray(vectors, dtype=np.float32), statistics.median(timings)
+
+
+def run(args: argparse.Namespace) -> int:
+    sentences = load_sentences(args.resumes)[: args.limit]
+    backends = [item.strip() for item in args.backends.split(",") if item.strip()]
+    reference_encoder = load_sentence_encoder(SENTENCE_MODEL_NAME, args.model_dir, backend="torch", threads=args.threads, quantize=False)
+    reference, _ = time_encoder(reference_encoder, sentences, args.batch_size, 1)
+
+    rows = []
+    failed = False
+    for backend in backends:
+        for quantize in (False, True):
+            try:
+                encoder = load_sentence_encoder(
+                    SENTENCE_MODEL_NAME, args.model_dir, backend=backend, threads=args.threads, quantize=quantize
+                )
+            except Exception as exc:
+                rows.append({"model_id": f"{backend}{'-int8' if quantize else ''}", "error": str(exc)})
+                failed = True
+                continue
+            vectors, median_ms = time_encoder(encoder, sentences, args.batch_size, args.repeat)
+            cosines = np.sum(vectors * reference, axis=1)
+            parity = bool(cosines.min() >= PARITY_MIN_COSINE[quantize])
+            failed = failed or not parity
+            rows.append(
+                {
+                    "model_id": encoder.model_id,
+                    "min_cosine": round(float(cosines.min()), 5),
+                    "mean_cosine": round(float(cosines.mean()), 5),
+                    "max_abs_diff": round(float(np.abs(vectors - reference).max()), 5),
+                    "parity": parity,
+                    "median_ms": round(median_ms, 2),
+                    "ms_per_sentence": round(median_ms / len(sentences), 3),
+                }
+            )
+
+    if args.json:
+        print(json.dumps({"sentences": len(sentences), "threads": args.threads, "results": rows}, indent=2))
+    else:
+        print(f"sentences={len(sentences)} threads={args.threads or 'default'} batch_size={args.batch_size}")
+        for row in rows:
+            print("  ".join(f"{key}={value}" for key, value in row.items()))
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run(parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
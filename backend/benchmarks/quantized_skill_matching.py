@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend.src.resume_analysis.model_registry import WARM_UP_TEXT
+from backend.src.resume_analysis.nlp_pipeline import build_nlp_artifacts
+from backend.src.resume_analysis.semantic_utils import embedding_model_id, encode_texts
+from backend.src.resume_analysis.skill_intelligence import _skill_definitions
+from backend.src.resume_analysis.vector_store import STORAGE_KINDS, VectorStore
+
+QUESTION_BANK_DIR = ROOT_DIR / "data" / "questions"
+SEMANTIC_MATCH_THRESHOLD = 0.58
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare quantized skill-definition storage against float32.")
+    parser.add_argument("--resumes", type=Path, default=None, help="Directory of .txt resumes to draw sentences from")
+    parser.add_argument("--threshold", type=float, default=SEMANTIC_MATCH_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def load_sentences(resume_dir: Path | None) -> list[str]:
+    texts = [WARM_UP_TEXT]
+    if resume_dir is not None:
+        texts.extend(path.read_text(encoding="utf-8", errors="ignore") for path in sorted(resume_dir.rglob("*.txt")))
+    else:
+        for path in sorted(QUESTION_BANK_DIR.glob("*.json")):
+            data = json.loads(path.read_text(encoding="utf-8"))
+            questions = data.get("questions", []) if isinstance(data, dict) else data
+            texts.extend(str(item.get("question", "")) for item in questions if isinstance(item, dict))
+    sentences = [sentence for text in texts for sentence in build_nlp_artifacts(text).sentences]
+    return list(dict.fromkeys(sentence for sentence in sentences if sentence))
+
+
+def measure(store: VectorStore, queries: np.ndarray, repeat: int) -> tuple[np.ndarray, float]:
+    timings = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        scores = store.similarities(queries)
+        timings.append((time.perf_counter() - started) * 1000)
+    return scores, statistics.median(timings)
+
+
+def run(args: argparse.Namespace) -> int:
+    sentences = load_sentences(args.resumes)
+    definitions = [definition for _, definition in _skill_definitions()]
+    dense = encode_texts(definitions)
+    queries = encode_texts(sentences)
+
+    reference_store = VectorStore.from_dense(dense, "float32")
+    reference, _ = measure(reference_store, queries, 1)
+    reference_matches = {tuple(pair) for pair in np.argwhere(reference >= args.threshold)}
+    reference_top = reference.argmax(axis=1)
+
+    rows = []
+    for kind in STORAGE_KINDS:
+        store = VectorStore.from_dense(dense, kind)
+        scores, median_ms = measure(store, queries, args.repeat)
+        matches = {tuple(pair) for pair in np.argwhere(scores >= args.threshold)}
+        agreed = len(matches & reference_matches)
+        rows.append(
+            {
+                "storage": kind,
+                "bytes": store.nbytes,
+                "vs_float64": round(dense.astype(np.float64).nbytes / store.nbytes, 2),
+                "recall": round(agreed / len(reference_matches), 4) if reference_matches else 1.0,
+                "precision": round(agreed / len(matches), 4) if matches else 1.0,
+                "top1_agreement": round(float(np.mean(scores.argmax(axis=1) == reference_top)), 4),
+                "max_abs_error": float(np.abs(scores - reference).max()),
+                "median_ms": round(median_ms, 3),
+            }
+        )
+
+    summary = {
+        "model": embedding_model_id(),
+        "sentences": len(sentences),
+        "definitions": len(definitions),
+        "dimension": int(dense.shape[1]),
+        "threshold": args.threshold,
+        "reference_matches": len(reference_matches),
+        "results": rows,
+    }
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(
+        f"model={summary['model']} sentences={summary['sentences']} definitions={summary['definitions']} "
+        f"dimension={summary['dimension']} matches@{args.threshold}={summary['reference_matches']}"
+    )
+    columns = list(rows[0])
+    print("  ".join(f"{column:>14}" for column in columns))
+    for row in rows:
+        print("  ".join(f"{row[column]:>14.6g}" if isinstance(row[column], float) else f"{row[column]:>14}" for column in columns))
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run(parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
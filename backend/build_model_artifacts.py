@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend.src.resume_analysis.model_artifacts import ARTIFACTS, artifact_dir, build_artifact
+from backend.src.resume_analysis.model_registry import MODEL_MODULES
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Train the sklearn models once and write versioned artifacts.")
+    parser.add_argument("--output", type=Path, default=artifact_dir())
+    parser.add_argument("--only", default=None, help="Comma-separated artifact names to build")
+    parser.add_argument("--force", action="store_true", help="Retrain even when the training data is unchanged")
+    parser.add_argument("--keep-stale", action="store_true", help="Keep artifacts built from older training data")
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> int:
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
+    names = [item.strip() for item in args.only.split(",") if item.strip()] if args.only else sorted(ARTIFACTS)
+    unknown = sorted(set(names) - set(ARTIFACTS))
+    if unknown:
+        print(f"Unknown artifacts: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    for name in names:
+        manifest = build_artifact(ARTIFACTS[name], args.output, force=args.force, prune=not args.keep_stale)
+        print(
+            f"{name}: {manifest['file']} ({manifest['bytes'] / 1e6:.2f} MB, sha256 {manifest['sha256'][:12]})",
+            file=sys.stderr,
+        )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run(parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
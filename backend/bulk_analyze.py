@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+
+from batch_analysis import create_batch_pool, get_batch_workers, iter_batch_results
+from resume_scorer import analysis_field_names
+
+SUPPORTED_SUFFIXES = {".pdf", ".docx", ".txt"}
+SUMMARY_COLUMNS = ["path", "status", "ats_score", "predicted_role", "experience_level", "error"]
+SUMMARY_FIELDS = ("ats_score", "predicted_role", "experience_level")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Analyze a directory of PDF/DOCX/TXT resumes offline.")
+    parser.add_argument("input_dir", type=Path)
+    parser.add_argument("--output", type=Path, default=Path("bulk_analysis.jsonl"))
+    parser.add_argument("--summary", type=Path, default=None, help="Defaults to the output path with a .csv suffix")
+    parser.add_argument("--workers", type=int, default=get_batch_workers())
+    parser.add_argument("--stage-workers", type=int, default=1)
+    parser.add_argument("--job-description", type=Path, default=None, help="Text file with a shared job description")
+    parser.add_argument("--fields", default=None, help="Comma-separated top-level report keys to keep")
+    parser.add_argument("--retry-errors", action="store_true", help="Re-run resumes whose previous attempt failed")
+    parser.add_argument("--fsync-every", type=int, default=50)
+    return parser.parse_args(argv)
+
+
+def discover_resumes(input_dir: Path) -> list[Path]:
+    return sorted(path for path in input_dir.rglob("*") if path.is_file() and path.suffix.lower() in SUPPORTED_SUFFIXES)
+
+
+def load_checkpoint(output_path: Path, *, retry_errors: bool = False) -> set[str]:
+    if not output_path.exists():
+        return set()
+
+    completed: set[str] = set()
+    valid_bytes = 0
+    with output_path.open("rb") as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            valid_bytes += len(line)
+            if record.get("status") == "ok" or not retry_errors:
+                completed.add(record["path"])
+
+    if valid_bytes < output_path.stat().st_size:
+        with output_path.open("r+b") as handle:
+            handle.truncate(valid_bytes)
+    return completed
+
+
+def write_summary(output_path: Path, summary_path: Path) -> int:
+    latest: dict[str, dict] = {}
+    with output_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            result = record.get("result") or {}
+            latest[record["path"]] = {
+                "path": record["path"],
+                "status": record.get("status", ""),
+                **{name: result.get(name, "") for name in SUMMARY_FIELDS},
+                "error": record.get("error", ""),
+            }
+
+    with summary_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        writer.writerows(latest[path] for path in sorted(latest))
+    return len(latest)
+
+
+def run(args: argparse.Namespace) -> int:
+    input_dir = args.input_dir.resolve()
+    if not input_dir.is_dir():
+        print(f"Input directory not found: {input_dir}", file=sys.stderr)
+        return 2
+
+    fields = None
+    if args.fields:
+        fields = [field.strip() for field in args.fields.split(",") if field.strip()]
+        unknown = sorted(set(fields) - set(analysis_field_names()))
+        if unknown:
+            print(f"Unknown fields: {', '.join(unknown)}", file=sys.stderr)
+            return 2
+        fields = sorted(set(fields) | set(SUMMARY_FIELDS), key=analysis_field_names().index)
+
+    job_description = args.job_description.read_text(encoding="utf-8") if args.job_description else None
+    summary_path = args.summary or args.output.with_suffix(".csv")
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+
+    completed = load_checkpoint(args.output, retry_errors=args.retry_errors)
+    resumes = discover_resumes(input_dir)
+    items = []
+    for path in resumes:
+        relative = path.relative_to(input_dir).as_posix()
+        if relative not in completed:
+            items.append({"index": len(items), "name": relative, "path": str(path)})
+    print(f"{len(resumes)} resumes found, {len(resumes) - len(items)} already done, {len(items)} to analyze", file=sys.stderr)
+
+    if items:
+        pool = create_batch_pool(args.workers, args.stage_workers)
+        processed = failed = 0
+        try:
+            with args.output.open("a", encoding="utf-8") as handle:
+                for record in iter_batch_results(items, job_description, fields, pool=pool):
+                    record = {"path": record.pop("name"), **record}
+                    record.pop("index", None)
+                    handle.write(json.dumps(record) + "\n")
+                    processed += 1
+                    failed += record["status"] != "ok"
+                    if processed % max(1, args.fsync_every) == 0:
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                        print(f"{processed}/{len(items)} analyzed ({failed} failed)", file=sys.stderr)
+                handle.flush()
+                os.fsync(handle.fileno())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        print(f"{processed}/{len(items)} analyzed ({failed} failed)", file=sys.stderr)
+
+    if args.output.exists():
+        rows = write_summary(args.output, summary_path)
+        print(f"Wrote {rows} summary rows to {summary_path}", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run(parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
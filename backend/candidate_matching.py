@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+
+from resume_scorer import analyze_resume_text, build_job_description_profile, keyword_hit_matrix
+from backend.src.resume_analysis.context import AnalysisContext
+from backend.src.resume_analysis.document_store import (
+    StoredResume,
+    job_description_revision,
+    load_job_descriptions,
+    load_resumes,
+    load_skill_bitsets,
+    resume_id,
+    save_job_description,
+    save_resumes,
+)
+from backend.src.resume_analysis.evaluation import extract_skills
+from backend.src.resume_analysis.job_profiles import JobDescriptionProfile
+from backend.src.resume_analysis.nlp_pipeline import build_nlp_artifacts
+from backend.src.resume_analysis.result_cache import PIPELINE_VERSION
+from backend.src.resume_analysis.semantic_utils import embedding_model_id, encode_texts
+from backend.src.resume_analysis.search_index import SearchDocument, document_terms, index_documents
+from backend.src.resume_analysis.skill_bitsets import (
+    SkillBitMatrix,
+    canonical_skill,
+    pack_skills,
+    unpack_skills,
+    vocabulary_fingerprint,
+    word_count,
+)
+from backend.src.resume_analysis.skill_matcher import PhraseMatcher
+from backend.src.resume_analysis.timing import timed
+
+RANKING_WEIGHTS = {
+    "keyword_score": 0.5,
+    "semantic_score": 0.3,
+    "skill_overlap": 0.2,
+}
+SEARCH_FILTER_FIELDS = ("experience_level", "predicted_role")
+
+
+@dataclass
+class JobLibrary:
+    revision: tuple[int, int, str]
+    profiles: list[JobDescriptionProfile]
+    embeddings: np.ndarray
+    embedding_norms: np.ndarray
+    keyword_vocabulary: list[str]
+    keyword_matrix: sparse.csr_matrix
+    keyword_matcher: PhraseMatcher
+    skill_index: dict[str, int]
+    skill_matrix: sparse.csr_matrix
+
+
+@dataclass(frozen=True)
+class SkillCorpus:
+    matrix: SkillBitMatrix
+    rows: dict[str, int]
+    last_seq: int
+    fingerprint: str
+
+
+_library: JobLibrary | None = None
+_library_lock = threading.Lock()
+_skill_corpus: SkillCorpus | None = None
+_skill_corpus_lock = threading.Lock()
+
+
+def build_resume_profiles(texts: list[str]) -> list[StoredResume]:
+    cleaned = [str(text or "").strip() for text in texts]
+    if not cleaned:
+        return []
+    with timed("candidates.encode"):
+        embeddings = encode_texts(cleaned)
+    model_id = embedding_model_id()
+    with timed("candidates.skills"):
+        return [
+            StoredResume(
+                resume_id=resume_id(text),
+                text=text,
+                skills=extract_skills(text),
+                model_id=model_id,
+                embedding=np.asarray(embedding, dtype=float),
+                pipeline_version=PIPELINE_VERSION,
+            )
+            for text, embedding in zip(cleaned, embeddings)
+        ]
+
+
+def store_resumes(texts: list[str]) -> list[StoredResume]:
+    resumes = build_resume_profiles(texts)
+    save_resumes(resumes)
+    with timed("search_index.update"):
+        index_documents([_search_document(resume) for resume in resumes])
+    return resumes
+
+
+def _search_document(resume: StoredResume) -> SearchDocument:
+    context = AnalysisContext(resume.text)
+    analysis = analyze_resume_text(resume.text, context=context, fields=SEARCH_FILTER_FIELDS)
+    artifacts = context.memo("artifacts", lambda: build_nlp_artifacts(resume.text))
+    return SearchDocument(
+        resume_id=resume.resume_id,
+        terms=document_terms(artifacts, resume.skills),
+        experience_level=str(analysis.get("experience_level") or ""),
+        predicted_role=str(analysis.get("predicted_role") or ""),
+    )
+
+
+def stored_resumes(resume_ids: list[str]) -> tuple[dict[str, StoredResume], list[str]]:
+    found = load_resumes(resume_ids)
+    missing = [item for item in dict.fromkeys(resume_ids) if item not in found]
+    stale = [resume for resume in found.values() if not _resume_is_current(resume)]
+    if stale:
+        refreshed = build_resume_profiles([resume.text for resume in stale])
+        save_resumes(refreshed)
+        with timed("search_index.update"):
+            index_documents([_search_document(resume) for resume in refreshed])
+        found.update({resume.resume_id: resume for resume in refreshed})
+    return found, missing
+
+
+def rank_candidates(profile: JobDescriptionProfile, resumes: list[StoredResume], top_k: int = 10) -> list[dict]:
+    if not resumes:
+        return []
+
+    with timed("candidates.keywords"):
+        keyword_hits = keyword_hit_matrix([resume.text for resume in resumes], profile.keywords, profile.matcher)
+    with timed("candidates.similarity"):
+        similarities = _cosine_scores(np.vstack([resume.embedding for resume in resumes]), profile.embedding)
+    with timed("candidates.skills"):
+        skill_hits = _skill_hit_matrix(resumes, profile.skills)
+
+    keyword_scores = _percentages(keyword_hits)
+    semantic_scores = np.clip(similarities, 0.0, 1.0) * 100
+    skill_overlaps = _percentages(skill_hits)
+    match_scores = _match_scores(keyword_scores, semantic_scores, skill_overlaps)
+
+    ranked: list[dict] = []
+    for row in _top_k_rows(match_scores, top_k):
+        resume = resumes[row]
+        matched_keywords = [keyword for keyword, hit in zip(profile.keywords, keyword_hits[row]) if hit]
+        common_skills = [skill for skill, hit in zip(profile.skills, skill_hits[row]) if hit]
+        ranked.append(
+            {
+                "rank": len(ranked) + 1,
+                "index": int(row),
+                "resume_id": resume.resume_id,
+                "match_score": round(float(match_scores[row]), 2),
+                "breakdown": {
+                    "keyword_score": int(round(float(keyword_scores[row]))),
+                    "semantic_score": round(float(semantic_scores[row]), 2),
+                    "skill_overlap": round(float(skill_overlaps[row]), 2),
+                },
+                "matched_keywords": matched_keywords,
+                "missing_keywords": [keyword for keyword in profile.keywords if keyword not in matched_keywords],
+                "common_skills": sorted(common_skills),
+                "missing_skills": sorted(set(profile.skills) - set(common_skills))[:10],
+            }
+        )
+    return ranked
+
+
+def job_library() -> JobLibrary:
+    global _library
+    revision = (*job_description_revision(), embedding_model_id())
+    with _library_lock:
+        if _library is None or _library.revision != revision:
+            with timed("job_library.build"):
+                _library = _build_job_library(revision)
+        return _library
+
+
+def match_jobs(resume: StoredResume, top_k: int = 10) -> list[dict]:
+    library = job_library()
+    if not library.profiles:
+        return []
+
+    with timed("job_matches.keywords"):
+        keyword_hits = keyword_hit_matrix([resume.text], library.keyword_vocabulary, library.keyword_matcher)[0]
+        keyword_counts = library.keyword_matrix @ keyword_hits.astype(np.float64)
+        keyword_totals = np.diff(library.keyword_matrix.indptr)
+    with timed("job_matches.similarity"):
+        similarities = _cosine_scores(library.embeddings, resume.embedding, library.embedding_norms)
+    with timed("job_matches.skills"):
+        owned = np.zeros(len(library.skill_index))
+        owned[[library.skill_index[skill] for skill in resume.skills if skill in library.skill_index]] = 1.0
+        skill_counts = library.skill_matrix @ owned
+        skill_totals = np.diff(library.skill_matrix.indptr)
+
+    keyword_scores = _ratios(keyword_counts, keyword_totals)
+    semantic_scores = np.clip(similarities, 0.0, 1.0) * 100
+    skill_overlaps = _ratios(skill_counts, skill_totals)
+    match_scores = _match_scores(keyword_scores, semantic_scores, skill_overlaps)
+
+    matched_vocabulary = {keyword for keyword, hit in zip(library.keyword_vocabulary, keyword_hits) if hit}
+    owned_skills = set(resume.skills)
+    matches: list[dict] = []
+    for row in _top_k_rows(match_scores, top_k):
+        profile = library.profiles[row]
+        matches.append(
+            {
+                "rank": len(matches) + 1,
+                "jd_id": profile.jd_id,
+                "title": _first_line(profile.text),
+                "match_score": round(float(match_scores[row]), 2),
+                "breakdown": {
+                    "keyword_score": int(round(float(keyword_scores[row]))),
+                    "semantic_score": round(float(semantic_scores[row]), 2),
+                    "skill_overlap": round(float(skill_overlaps[row]), 2),
+                },
+                "matched_keywords": [keyword for keyword in profile.keywords if keyword.lower() in matched_vocabulary],
+                "missing_keywords": [
+                    keyword for keyword in profile.keywords if keyword.lower() not in matched_vocabulary
+                ],
+                "common_skills": sorted(set(profile.skills) & owned_skills),
+                "missing_skills": sorted(set(profile.skills) - owned_skills)[:10],
+            }
+        )
+    return matches
+
+
+def skill_corpus() -> SkillBitMatrix:
+    global _skill_corpus
+    with _skill_corpus_lock:
+        corpus = _skill_corpus
+        if corpus is None or corpus.fingerprint != vocabulary_fingerprint():
+            empty = SkillBitMatrix([], np.zeros((0, word_count()), dtype=np.uint64))
+            corpus = SkillCorpus(empty, {}, 0, vocabulary_fingerprint())
+        changes = load_skill_bitsets(corpus.last_seq)
+        if changes:
+            corpus = _apply_skill_changes(corpus, changes)
+        _skill_corpus = corpus
+        return corpus.matrix
+
+
+def _apply_skill_changes(corpus: SkillCorpus, changes: list[tuple[int, str, np.ndarray]]) -> SkillCorpus:
+    rows = dict(corpus.rows)
+    resume_ids = list(corpus.matrix.resume_ids)
+    updated: dict[int, np.ndarray] = {}
+    for _, stored_id, bits in changes:
+        row = rows.setdefault(stored_id, len(resume_ids))
+        if row == len(resume_ids):
+            resume_ids.append(stored_id)
+        updated[row] = bits
+    matrix = np.zeros((len(resume_ids), word_count()), dtype=np.uint64)
+    matrix[: len(corpus.matrix.bits)] = corpus.matrix.bits
+    for row, bits in updated.items():
+        matrix[row] = bits
+    return SkillCorpus(SkillBitMatrix(resume_ids, matrix), rows, changes[-1][0], corpus.fingerprint)
+
+
+def skill_query(query: str, limit: int = 50, offset: int = 0) -> dict:
+    corpus = skill_corpus()
+    with timed("skill_query.evaluate"):
+        rows = np.flatnonzero(corpus.evaluate(query))
+    return {
+        "total": int(len(rows)),
+        "corpus_size": len(corpus.resume_ids),
+        "resume_ids": [corpus.resume_ids[row] for row in rows[offset:offset + limit]],
+    }
+
+
+def skill_coverage(skills: list[str], top_k: int = 20) -> dict:
+    resolved = list(dict.fromkeys(skill for skill in map(canonical_skill, skills) if skill))
+    unknown = [skill for skill in skills if canonical_skill(skill) is None]
+    corpus = skill_corpus()
+    with timed("skill_coverage.popcount"):
+        coverage = corpus.coverage(resolved)
+    target = pack_skills(resolved)
+    return {
+        "skills": resolved,
+        "unknown_skills": unknown,
+        "corpus_size": len(corpus.resume_ids),
+        "mean_coverage": round(float(coverage.mean()), 2) if len(coverage) else 0.0,
+        "full_coverage": int(np.count_nonzero(coverage >= 100)) if resolved else 0,
+        "resumes": [
+            {
+                "resume_id": corpus.resume_ids[row],
+                "coverage": round(float(coverage[row]), 2),
+                "missing_skills": unpack_skills(target & ~corpus.bits[row]),
+            }
+            for row in _top_k_rows(coverage, top_k)
+        ],
+    }
+
+
+def _build_job_library(revision: tuple[int, int, str]) -> JobLibrary:
+    profiles = load_job_descriptions()
+    for position, profile in enumerate(profiles):
+        if profile.pipeline_version != PIPELINE_VERSION or profile.model_id != revision[2]:
+            profiles[position] = build_job_description_profile(profile.text)
+            save_job_description(profiles[position])
+
+    keyword_vocabulary = sorted({keyword.lower() for profile in profiles for keyword in profile.keywords})
+    skill_vocabulary = sorted({skill for profile in profiles for skill in profile.skills})
+    keyword_index = {keyword: position for position, keyword in enumerate(keyword_vocabulary)}
+    skill_index = {skill: position for position, skill in enumerate(skill_vocabulary)}
+    dimension = max((profile.embedding.shape[0] for profile in profiles), default=0)
+    embeddings = np.zeros((len(profiles), dimension))
+    for row, profile in enumerate(profiles):
+        if profile.embedding.shape[0] == dimension:
+            embeddings[row] = profile.embedding
+    return JobLibrary(
+        revision=revision,
+        profiles=profiles,
+        embeddings=embeddings,
+        embedding_norms=np.linalg.norm(embeddings, axis=1),
+        keyword_vocabulary=keyword_vocabulary,
+        keyword_matrix=_incidence_matrix(
+            [{keyword_index[keyword.lower()] for keyword in profile.keywords} for profile in profiles],
+            len(keyword_vocabulary),
+        ),
+        keyword_matcher=PhraseMatcher(keyword_vocabulary),
+        skill_index=skill_index,
+        skill_matrix=_incidence_matrix(
+            [{skill_index[skill] for skill in profile.skills} for profile in profiles],
+            len(skill_vocabulary),
+        ),
+    )
+
+
+def _incidence_matrix(rows: list[set[int]], width: int) -> sparse.csr_matrix:
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(row) for row in rows])
+    indices = np.fromiter((column for row in rows for column in sorted(row)), dtype=np.int64, count=int(indptr[-1]))
+    data = np.ones(len(indices))
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), width))
+
+
+def _first_line(text: str) -> str:
+    return next((line.strip() for line in text.splitlines() if line.strip()), "")[:120]
+
+
+def _resume_is_current(resume: StoredResume) -> bool:
+    return resume.pipeline_version == PIPELINE_VERSION and resume.model_id == embedding_model_id()
+
+
+def _cosine_scores(matrix: np.ndarray, vector: np.ndarray, row_norms: np.ndarray | None = None) -> np.ndarray:
+    if matrix.size == 0 or vector.size == 0 or matrix.shape[1] != vector.shape[0]:
+        return np.zeros(len(matrix))
+    row_norms = np.linalg.norm(matrix, axis=1) if row_norms is None else row_norms
+    denominators = row_norms * np.linalg.norm(vector)
+    dots = matrix @ vector
+    return np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators > 0)
+
+
+def _skill_hit_matrix(resumes: list[StoredResume], skills: list[str]) -> np.ndarray:
+    hits = np.zeros((len(resumes), len(skills)), dtype=bool)
+    for row, resume in enumerate(resumes):
+        owned = set(resume.skills)
+        hits[row] = [skill in owned for skill in skills]
+    return hits
+
+
+def _percentages(hits: np.ndarray) -> np.ndarray:
+    if hits.shape[1] == 0:
+        return np.zeros(len(hits))
+    return hits.sum(axis=1) / hits.shape[1] * 100
+
+
+def _ratios(counts: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    return np.divide(counts * 100, totals, out=np.zeros(len(counts)), where=totals > 0)
+
+
+def _match_scores(keyword_scores: np.ndarray, semantic_scores: np.ndarray, skill_overlaps: np.ndarray) -> np.ndarray:
+    return (
+        RANKING_WEIGHTS["keyword_score"] * keyword_scores
+        + RANKING_WEIGHTS["semantic_score"] * semantic_scores
+        + RANKING_WEIGHTS["skill_overlap"] * skill_overlaps
+    )
+
+
+def _top_k_rows(scores: np.ndarray, top_k: int) -> np.ndarray:
+    rows = np.arange(len(scores))
+    if top_k < len(scores):
+        rows = np.argpartition(-scores, top_k - 1)[:top_k]
+    return rows[np.lexsort((rows, -scores[rows]))]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend.src.resume_analysis.embedding_client import recv_frame, send_frame
+from backend.src.resume_analysis.semantic_utils import (
+    _load_sentence_transformer,
+    embedding_cache_stats,
+    embedding_server_socket,
+    encode_texts_local,
+    local_embedding_model_id,
+)
+
+DEFAULT_SOCKET_PATH = "/tmp/resume-embeddings.sock"
+
+
+class EmbeddingRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        while True:
+            try:
+                frame = recv_frame(self.request)
+            except OSError:
+                return
+            if frame is None:
+                return
+            try:
+                payload = json.loads(frame)
+                header, body = self.server.respond(payload)
+            except Exception as exc:
+                header, body = {"ok": False, "error": str(exc)}, None
+            try:
+                send_frame(self.request, json.dumps(header).encode("utf-8"))
+                if body is not None:
+                    send_frame(self.request, body)
+            except OSError:
+                return
+
+
+class EmbeddingServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, model_id: str, dimension: int) -> None:
+        self.model_id = model_id
+        self.dimension = dimension
+        super().__init__(path, EmbeddingRequestHandler)
+
+    def respond(self, payload: dict) -> tuple[dict, bytes | None]:
+        operation = payload.get("op")
+        if operation == "info":
+            return {"ok": True, "model_id": self.model_id, "dimension": self.dimension}, None
+        if operation == "stats":
+            return {"ok": True, "stats": embedding_cache_stats()}, None
+        if operation == "encode":
+            texts = [str(text) for text in payload.get("texts") or []]
+            vectors = encode_texts_local(texts) if texts else np.zeros((0, self.dimension))
+            vectors = np.ascontiguousarray(vectors, dtype="<f4")
+            if vectors.shape != (len(texts), self.dimension):
+                raise ValueError(f"Encoder returned {vectors.shape} vectors, expected ({len(texts)}, {self.dimension})")
+            return {"ok": True, "rows": len(texts), "dimension": self.dimension}, vectors.tobytes()
+        raise ValueError(f"Unknown operation: {operation}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve batched sentence embeddings to analysis workers over a Unix socket.")
+    parser.add_argument("--socket", default=embedding_server_socket() or DEFAULT_SOCKET_PATH)
+    parser.add_argument("--mode", type=lambda value: int(value, 8), default=0o660, help="Socket file permissions (octal)")
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> int:
+    model = _load_sentence_transformer()
+    if model is None:
+        print("sentence-transformers model is unavailable; workers will use their local fallback encoder", file=sys.stderr)
+        return 1
+
+    dimension = int(model.get_sentence_embedding_dimension())
+    encode_texts_local(["warm up"])
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)
+    with EmbeddingServer(args.socket, local_embedding_model_id(), dimension) as server:
+        os.chmod(args.socket, args.mode)
+        print(f"Serving {server.model_id} embeddings on {args.socket}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run(parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
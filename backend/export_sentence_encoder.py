@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend.src.resume_analysis.encoder_backends import (
+    ENCODER_CONFIG_FILE,
+    NUMPY_QUANTIZED_WEIGHTS_FILE,
+    NUMPY_WEIGHTS_FILE,
+    ONNX_MODEL_FILE,
+    ONNX_QUANTIZED_MODEL_FILE,
+    TOKENIZER_FILE,
+    quantize_onnx_model,
+)
+from backend.src.resume_analysis.semantic_utils import SENTENCE_MODEL_NAME, encoder_model_dir
+from backend.src.resume_analysis.vector_store import quantize_rows
+
+EXPORT_FORMATS = ("onnx", "numpy")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export the sentence encoder for the onnx and numpy embedding backends.")
+    parser.add_argument("--output", type=Path, default=encoder_model_dir())
+    parser.add_argument("--formats", default=",".join(EXPORT_FORMATS), help="Comma-separated subset of onnx,numpy")
+    parser.add_argument("--quantize", action="store_true", help="Also write int8 variants for EMBEDDING_QUANTIZE=1")
+    parser.add_argument("--opset", type=int, default=14)
+    return parser.parse_args(argv)
+
+
+def export_config(model, output: Path) -> None:
+    transformer = model[0].auto_model
+    config = {
+        "model_name": SENTENCE_MODEL_NAME,
+        "max_seq_length": int(model.max_seq_length),
+        "hidden_size": int(transformer.config.hidden_size),
+        "num_attention_heads": int(transformer.config.num_attention_heads),
+        "num_hidden_layers": int(transformer.config.num_hidden_layers),
+        "layer_norm_eps": float(transformer.config.layer_norm_eps),
+        "pad_token_id": int(model.tokenizer.pad_token_id or 0),
+    }
+    model.tokenizer.backend_tokenizer.save(str(output / TOKENIZER_FILE))
+    (output / ENCODER_CONFIG_FILE).write_text(json.dumps(config, indent=2), encoding="utf-8")
+
+
+def export_onnx(model, output: Path, *, opset: int, quantize: bool) -> list[Path]:
+    import torch
+
+    class LastHiddenState(torch.nn.Module):
+        def __init__(self, transformer) -> None:
+            super().__init__()
+            self.transformer = transformer
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.transformer(
+                input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids
+            ).last_hidden_state
+
+    sample = model.tokenizer(["export sample sentence"], return_tensors="pt")
+    inputs = ("input_ids", "attention_mask", "token_type_ids")
+    path = output / ONNX_MODEL_FILE
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with torch.no_grad():
+        torch.onnx.export(
+            LastHiddenState(model[0].auto_model).eval(),
+            tuple(sample[name] for name in inputs),
+            str(temp_path),
+            input_names=list(inputs),
+            output_names=["last_hidden_state"],
+            dynamic_axes={name: {0: "batch", 1: "sequence"} for name in (*inputs, "last_hidden_state")},
+            opset_version=opset,
+        )
+    os.replace(temp_path, path)
+    written = [path]
+    if quantize:
+        written.append(quantize_onnx_model(path, output / ONNX_QUANTIZED_MODEL_FILE))
+    return written
+
+
+def export_numpy(model, output: Path, *, quantize: bool) -> list[Path]:
+    state = {
+        name: tensor.detach().cpu().float().numpy()
+        for name, tensor in model[0].auto_model.state_dict().items()
+        if tensor.is_floating_point() and not name.startswith("pooler.")
+    }
+    written = [_save_npz(output / NUMPY_WEIGHTS_FILE, state)]
+    if quantize:
+        quantized: dict[str, np.ndarray] = {}
+        for name, values in state.items():
+            if name.endswith(".weight") and values.ndim == 2:
+                codes, scales = quantize_rows(values, "int8")
+                quantized[name] = codes
+                quantized[f"{name}.scale"] = scales
+            else:
+                quantized[name] = values
+        written.append(_save_npz(output / NUMPY_QUANTIZED_WEIGHTS_FILE, quantized))
+    return written
+
+
+def _save_npz(path: Path, arrays: dict[str, np.ndarray]) -> Path:
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with temp_path.open("wb") as handle:
+        np.savez(handle, **arrays)
+    os.replace(temp_path, path)
+    return path
+
+
+def run(args: argparse.Namespace) -> int:
+    from sentence_transformers import SentenceTransformer
+
+    formats = [item.strip() for item in args.formats.split(",") if item.strip()]
+    unknown = sorted(set(formats) - set(EXPORT_FORMATS))
+    if unknown:
+        print(f"Unknown export formats: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    model = SentenceTransformer(SENTENCE_MODEL_NAME, device="cpu")
+    args.output.mkdir(parents=True, exist_ok=True)
+    export_config(model, args.output)
+    written: list[Path] = []
+    if "onnx" in formats:
+        written.extend(export_onnx(model, args.output, opset=args.opset, quantize=args.quantize))
+    if "numpy" in formats:
+        written.extend(export_numpy(model, args.output, quantize=args.quantize))
+    for path in written:
+        print(f"Wrote {path} ({path.stat().st_size / 1e6:.1f} MB)", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run(parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
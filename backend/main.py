@@ -10,21 +10,54 @@ load_dotenv(Path(__file__).resolve().parent / ".env")
 import json
 import re
 import shutil
+import time
 
-from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
 from auth_store import authenticate_user, create_user, init_auth_db
 from routes.resume import router as resume_router
 from resume_generator import generate_resume_pdf
-from resume_scorer import analyze_resume_text, calculate_ats_score, calculate_ats_scorecard, extract_text_from_file
+from resume_scorer import (
+    analysis_field_names,
+    analyze_resume_text,
+    calculate_ats_score,
+    extract_text_from_file,
+    get_ats_scorecard,
+    get_llm_suggestions,
+    job_description_profile,
+    register_job_description,
+    stored_job_description,
+)
+from batch_analysis import iter_batch_results, shutdown_batch_pool
+from candidate_matching import (
+    build_resume_profiles,
+    match_jobs,
+    rank_candidates,
+    skill_coverage,
+    skill_query,
+    store_resumes,
+    stored_resumes,
+)
+from backend.src.resume_analysis.context import AnalysisContext
+from backend.src.resume_analysis.model_registry import model_registry_status, start_warm_up
+from backend.src.resume_analysis.result_cache import result_cache_stats
+from backend.src.resume_analysis.search_index import query_terms, search_documents
+from backend.src.resume_analysis.semantic_utils import embedding_cache_stats
 from backend.src.resume_analysis.suggestions import (
     generate_ats_improvement_suggestions,
     generate_skill_verification_evaluation,
-    generate_suggestions,
+)
+from backend.src.resume_analysis.timing import (
+    current_request_timings,
+    finish_request_timings,
+    format_server_timing,
+    start_request_timings,
+    summarize_timings,
+    timing_histograms,
 )
 
 app = FastAPI(title="Smart Interview Backend", version="1.1.0")
@@ -40,11 +73,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def add_server_timing_header(request: Request, call_next):
+    token = start_request_timings()
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+        entries = current_request_timings()
+    finally:
+        finish_request_timings(token)
+    response.headers["Server-Timing"] = format_server_timing(entries, (time.perf_counter() - started) * 1000)
+    return response
+
+
 init_auth_db()
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 app.include_router(resume_router)
 
 
+@app.on_event("startup")
+def start_model_warm_up() -> None:
+    start_warm_up()
+
+
+@app.on_event("shutdown")
+def stop_batch_pool() -> None:
+    shutdown_batch_pool()
+
+
 class ResumeGenerateRequest(BaseModel):
     name: str = Field(min_length=1)
     email: str = Field(min_length=1)
@@ -105,6 +162,29 @@ class ImproveResumeRequest(BaseModel):
 class ATSScoreRequest(BaseModel):
     resume_text: str = Field(min_length=1)
     job_description: str | None = None
+    jd_id: str | None = None
+
+
+class JobDescriptionRequest(BaseModel):
+    text: str = Field(min_length=1)
+
+
+class StoreResumesRequest(BaseModel):
+    texts: list[str] = Field(min_length=1)
+
+
+class SkillCoverageRequest(BaseModel):
+    skills: list[str] = Field(default_factory=list)
+    jd_id: str | None = None
+    top_k: int = Field(default=20, ge=1, le=1000)
+
+
+class RankCandidatesRequest(BaseModel):
+    job_description: str | None = None
+    jd_id: str | None = None
+    resume_texts: list[str] = Field(default_factory=list)
+    resume_ids: list[str] = Field(default_factory=list)
+    top_k: int = Field(default=10, ge=1, le=1000)
 
 
 def _save_uploaded_resume(file: UploadFile, *, error_prefix: str) -> str:
@@ -351,6 +431,40 @@ def _score_answer_with_keywords(answer: str, keywords: list[str], marks: float)
     }
 
 
+def _resolve_llm_suggestions(context: AnalysisContext) -> tuple[list[str], dict | None]:
+    outcome = get_llm_suggestions(context)
+    if "error" in outcome:
+        return [], {"error": "AI suggestions failed", "details": outcome["error"]}
+    return list(outcome["suggestions"]), None
+
+
+def _parse_fields(fields: str | None) -> list[str] | None:
+    if fields is None or not fields.strip():
+        return None
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(selected) - set(analysis_field_names()))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return selected
+
+
+def _resolve_job_description(job_description: str | None, jd_id: str | None) -> str | None:
+    if not jd_id:
+        return job_description or None
+    if job_description and job_description.strip():
+        raise HTTPException(status_code=400, detail="Provide either job_description or jd_id, not both")
+    profile = stored_job_description(jd_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown jd_id: {jd_id}")
+    return profile.text
+
+
+def _with_timings(payload: dict, include_timings: bool) -> dict:
+    if include_timings:
+        payload["_timings"] = summarize_timings(current_request_timings())
+    return payload
+
+
 def _template_map() -> dict[str, dict]:
     return {item["id"]: item for item in RESUME_TEMPLATE_CATALOG if item.get("id")}
 
@@ -360,6 +474,22 @@ def health() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready():
+    status = model_registry_status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
+@app.get("/metrics/timings")
+def stage_timings() -> dict:
+    return timing_histograms()
+
+
+@app.get("/metrics/analysis-cache")
+def analysis_cache_metrics() -> dict:
+    return {**result_cache_stats(), "embeddings": embedding_cache_stats()}
+
+
 @app.get("/resume-templates")
 @app.get("/api/resume-templates")
 def list_resume_templates() -> dict:
@@ -419,17 +549,165 @@ def generate_resume(payload: ResumeGenerateRequest):
     )
 
 
+@app.post("/job-descriptions")
+def create_job_description(payload: JobDescriptionRequest):
+    text = payload.text.strip()
+    if not text:
+        raise HTTPException(status_code=400, detail="Job description text is required")
+    try:
+        return register_job_description(text).summary()
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Job description analysis failed: {exc}") from exc
+
+
+@app.get("/job-descriptions/{jd_id}")
+def get_job_description(jd_id: str):
+    profile = stored_job_description(jd_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown jd_id: {jd_id}")
+    return {**profile.summary(), "text": profile.text}
+
+
+@app.post("/resumes")
+def create_resumes(payload: StoreResumesRequest):
+    texts = [text.strip() for text in payload.texts]
+    if not all(texts):
+        raise HTTPException(status_code=400, detail="Resume texts must not be empty")
+    try:
+        resumes = store_resumes(texts)
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Storing resumes failed: {exc}") from exc
+    return {"resumes": [{"resume_id": resume.resume_id, "skills": resume.skills} for resume in resumes]}
+
+
+@app.get("/search")
+def search_resumes(
+    q: str = Query(min_length=1),
+    experience_level: str | None = None,
+    predicted_role: str | None = None,
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+    include_timings: bool = False,
+):
+    try:
+        result = search_documents(
+            query_terms(q),
+            filters={"experience_level": experience_level, "predicted_role": predicted_role},
+            limit=page_size,
+            offset=(page - 1) * page_size,
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Resume search failed: {exc}") from exc
+    return _with_timings({"query": q, "page": page, "page_size": page_size, **result}, include_timings)
+
+
+@app.get("/skill-search")
+def search_resumes_by_skills(
+    q: str = Query(min_length=1),
+    limit: int = Query(default=50, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+):
+    try:
+        return skill_query(q, limit, offset)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/skill-coverage")
+def resume_skill_coverage(payload: SkillCoverageRequest):
+    skills = list(payload.skills)
+    if payload.jd_id:
+        profile = stored_job_description(payload.jd_id)
+        if profile is None:
+            raise HTTPException(status_code=404, detail=f"Unknown jd_id: {payload.jd_id}")
+        skills.extend(profile.skills)
+    if not skills:
+        raise HTTPException(status_code=400, detail="Provide skills or a jd_id with detected skills")
+    return skill_coverage(skills, payload.top_k)
+
+
+@app.get("/resumes/{resume_id}/job-matches")
+def resume_job_matches(resume_id: str, top_k: int = Query(default=10, ge=1, le=100), include_timings: bool = False):
+    found, missing = stored_resumes([resume_id])
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Unknown resume id: {resume_id}")
+    try:
+        matches = match_jobs(found[resume_id], top_k)
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Job matching failed: {exc}") from exc
+    return _with_timings({"resume_id": resume_id, "matches": matches}, include_timings)
+
+
+@app.post("/rank-candidates")
+def rank_candidates_endpoint(payload: RankCandidatesRequest, include_timings: bool = False):
+    job_description = _resolve_job_description(payload.job_description, payload.jd_id)
+    if not job_description or not job_description.strip():
+        raise HTTPException(status_code=400, detail="A job_description or jd_id is required")
+    if not payload.resume_texts and not payload.resume_ids:
+        raise HTTPException(status_code=400, detail="At least one resume text or resume id is required")
+
+    found, missing = stored_resumes(payload.resume_ids) if payload.resume_ids else ({}, [])
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Unknown resume ids: {', '.join(missing)}")
+    try:
+        profile = job_description_profile(job_description)
+        resumes = build_resume_profiles(payload.resume_texts) + [found[item] for item in payload.resume_ids]
+        ranked = rank_candidates(profile, resumes, payload.top_k)
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Candidate ranking failed: {exc}") from exc
+
+    return _with_timings(
+        {"jd_id": profile.jd_id, "total_candidates": len(resumes), "candidates": ranked},
+        include_timings,
+    )
+
+
 @app.post("/analyze-resume")
-def analyze_resume(file: UploadFile = File(...)):
+def analyze_resume(
+    file: UploadFile = File(...),
+    include_timings: bool = False,
+    fields: str | None = None,
+    jd_id: str | None = None,
+):
+    selected_fields = _parse_fields(fields)
+    job_description = _resolve_job_description(None, jd_id)
     try:
         text = _save_uploaded_resume(file, error_prefix="Resume analysis failed")
-        return analyze_resume_text(text)
+        return _with_timings(analyze_resume_text(text, job_description, fields=selected_fields), include_timings)
     except HTTPException:
         raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Resume analysis failed: {exc}") from exc
 
 
+@app.post("/analyze-resume/batch")
+def analyze_resume_batch(
+    files: list[UploadFile] = File(default=[]),
+    texts: list[str] = Form(default=[]),
+    job_description: str | None = Form(default=None),
+    jd_id: str | None = Form(default=None),
+    fields: str | None = None,
+):
+    selected_fields = _parse_fields(fields)
+    job_description = _resolve_job_description(job_description, jd_id)
+    items: list[dict] = []
+    for file in files:
+        suffix = Path(file.filename or "").suffix.lower()
+        if suffix not in {".pdf", ".docx", ".txt"}:
+            raise HTTPException(status_code=400, detail=f"Unsupported file type: {file.filename}")
+        items.append({"index": len(items), "name": Path(file.filename).name, "filename": file.filename, "content": file.file.read()})
+    for text in texts:
+        items.append({"index": len(items), "name": None, "text": text})
+    if not items:
+        raise HTTPException(status_code=400, detail="At least one resume file or text is required")
+
+    def stream():
+        for record in iter_batch_results(items, job_description, selected_fields):
+            yield json.dumps(record) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @app.post("/extract-resume-text")
 def extract_resume_text(file: UploadFile = File(...)):
     text = _save_uploaded_resume(file, error_prefix="Resume text extraction failed")
@@ -437,42 +715,40 @@ def extract_resume_text(file: UploadFile = File(...)):
 
 
 @app.post("/ats-score")
-def ats_score(payload: ATSScoreRequest):
+def ats_score(payload: ATSScoreRequest, include_timings: bool = False):
     resume_text = payload.resume_text.strip()
     if not resume_text:
         raise HTTPException(status_code=400, detail="Resume text is required")
+    job_description = _resolve_job_description(payload.job_description, payload.jd_id)
 
     suggestions_error: dict | None = None
     try:
-        result = calculate_ats_scorecard(resume_text, job_description=payload.job_description)
-        analysis = analyze_resume_text(resume_text, job_description=payload.job_description)
+        context = AnalysisContext(resume_text, job_description)
+        result = dict(get_ats_scorecard(context))
+        analysis = analyze_resume_text(resume_text, job_description=job_description, context=context)
         summary = (
             analysis.get("resume_summary", {}).get("summary_text")
             or analysis.get("final_report", {}).get("summary")
             or ""
         )
-        try:
-            result["suggestions"] = generate_ats_improvement_suggestions(resume_text)
-        except Exception as exc:
-            result["suggestions"] = []
-            suggestions_error = {
-                "error": "AI suggestions failed",
-                "details": str(exc),
-            }
+        result["suggestions"], suggestions_error = _resolve_llm_suggestions(context)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"ATS scoring failed: {exc}") from exc
 
-    return {
-        **result,
-        "score": result["ats_score"],
-        "summary": summary,
-        "analysis": analysis,
-        "suggestions_error": suggestions_error,
-    }
+    return _with_timings(
+        {
+            **result,
+            "score": result["ats_score"],
+            "summary": summary,
+            "analysis": analysis,
+            "suggestions_error": suggestions_error,
+        },
+        include_timings,
+    )
 
 
 @app.post("/ats-score-from-file")
-def ats_score_from_file(file: UploadFile = File(...)):
+def ats_score_from_file(file: UploadFile = File(...), include_timings: bool = False):
     text = _save_uploaded_resume(file, error_prefix="ATS file scoring failed")
     if not text.strip():
         raise HTTPException(
@@ -484,8 +760,9 @@ def ats_score_from_file(file: UploadFile = File(...)):
         )
 
     try:
-        result = calculate_ats_scorecard(text)
-        analysis = analyze_resume_text(text)
+        context = AnalysisContext(text)
+        result = dict(get_ats_scorecard(context))
+        analysis = analyze_resume_text(text, context=context)
         summary = (
             analysis.get("resume_summary", {}).get("summary_text")
             or analysis.get("final_report", {}).get("summary")
@@ -494,24 +771,19 @@ def ats_score_from_file(file: UploadFile = File(...)):
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"ATS file scoring failed: {exc}") from exc
 
-    suggestions_error: dict | None = None
-    try:
-        result["suggestions"] = generate_ats_improvement_suggestions(text)
-    except Exception as exc:
-        result["suggestions"] = []
-        suggestions_error = {
-            "error": "AI suggestions failed",
-            "details": str(exc),
-        }
-
-    return {
-        **result,
-        "score": result["ats_score"],
-        "resume_text": text,
-        "summary": summary,
-        "analysis": analysis,
-        "suggestions_error": suggestions_error,
-    }
+    result["suggestions"], suggestions_error = _resolve_llm_suggestions(context)
+
+    return _with_timings(
+        {
+            **result,
+            "score": result["ats_score"],
+            "resume_text": text,
+            "summary": summary,
+            "analysis": analysis,
+            "suggestions_error": suggestions_error,
+        },
+        include_timings,
+    )
 
 
 @app.post("/ats-suggestions")
@@ -571,10 +843,11 @@ def improve_resume(payload: ImproveResumeRequest):
             
     resume_text = "\n\n".join(parts)
     
-    analysis = analyze_resume_text(resume_text)
+    context = AnalysisContext(resume_text)
+    analysis = analyze_resume_text(resume_text, context=context)
     score = analysis.get("overall_score", 0)
     
-    suggestions = generate_suggestions(resume_text)
+    suggestions = _resolve_llm_suggestions(context)[0][:3]
     
     return {
         "score": score,
@@ -2,16 +2,42 @@ from __future__ import annotations
 
 import re
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
 
+import numpy as np
 from docx import Document
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
-from backend.src.resume_analysis import build_advanced_resume_report
+from backend.src.resume_analysis.context import AnalysisContext
+from backend.src.resume_analysis.document_store import load_job_description, save_job_description
+from backend.src.resume_analysis.evaluation import extract_skills
+from backend.src.resume_analysis.job_profiles import (
+    JobDescriptionProfile,
+    job_description_id,
+    lookup_profile,
+    lookup_profile_by_id,
+    remember_profile,
+)
+from backend.src.resume_analysis.nlp_pipeline import build_nlp_artifacts
 from backend.src.resume_analysis.normalizer import normalize_resume_schema
+from backend.src.resume_analysis.parser import parse_resumes
+from backend.src.resume_analysis.report import REPORT_FIELDS, REPORT_STAGES, compute_fields, select_fields
+from backend.src.resume_analysis.result_cache import (
+    PIPELINE_VERSION,
+    analysis_cache_key,
+    get_cached_result,
+    store_cached_result,
+)
+from backend.src.resume_analysis.semantic_utils import embedding_model_id, encode_texts
+from backend.src.resume_analysis.skill_matcher import PhraseMatcher, get_phrase_matcher
+from backend.src.resume_analysis.stage_graph import Stage, required_stages
+from backend.src.resume_analysis.timing import timed
 from backend.src.resume_parser.text_extractor import extract_text_from_pdf
 from backend.src.vulnerability_engine.gap_detector import detect_year_gaps
 from backend.src.vulnerability_engine.vulnerability_rules import detect_vulnerabilities
@@ -42,6 +68,24 @@ SECTION_PATTERNS = {
     "experience": [r"\bexperience\b", r"\bwork experience\b", r"\bemployment\b", r"\binternships?\b"],
 }
 
+SECTION_REGEXES = {
+    section: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags=re.IGNORECASE)
+    for section, patterns in SECTION_PATTERNS.items()
+}
+WORD_PATTERN = re.compile(r"\w+")
+NUMERIC_PATTERN = re.compile(r"\b\d+(?:\.\d+)?%?\b")
+BULLET_MARKERS = frozenset("-*•")
+
+
+@dataclass(frozen=True)
+class ATSTextView:
+    text: str
+    normalized: str
+    lines: list[str]
+    bullet_lines: list[str]
+    word_count: int
+    tokens: frozenset[str]
+
 
 def _extract_text_from_docx(path: str) -> str:
     doc = Document(path)
@@ -54,12 +98,13 @@ def _extract_text_from_txt(path: str) -> str:
 
 def extract_text_from_file(path: str) -> str:
     suffix = Path(path).suffix.lower()
-    if suffix == ".pdf":
-        return extract_text_from_pdf(path)
-    if suffix == ".docx":
-        return _extract_text_from_docx(path)
-    if suffix == ".txt":
-        return _extract_text_from_txt(path)
+    with timed(f"extract_text.{suffix.lstrip('.') or 'unknown'}"):
+        if suffix == ".pdf":
+            return extract_text_from_pdf(path)
+        if suffix == ".docx":
+            return _extract_text_from_docx(path)
+        if suffix == ".txt":
+            return _extract_text_from_txt(path)
     raise ValueError("Only PDF, DOCX, and TXT files are supported")
 
 
@@ -68,65 +113,236 @@ def calculate_ats_score(text: str, job_description: str | None = None) -> int:
     return int(scorecard.get("ats_score", 0))
 
 
-def analyze_resume_text(text: str, job_description: str | None = None) -> dict:
-    advanced = build_advanced_resume_report(text, job_description=job_description)
-    ats_scorecard = calculate_ats_scorecard(text, job_description=job_description)
+def get_ats_scorecard(context: AnalysisContext) -> dict:
+    return context.memo(
+        "ats_scorecard",
+        lambda: calculate_ats_scorecard(context.text, job_description=context.job_description),
+    )
+
+
+def get_llm_suggestions(context: AnalysisContext) -> dict:
+    return context.memo(
+        "llm_suggestions",
+        lambda: compute_fields(ANALYSIS_STAGES, [LLM_SUGGESTIONS_FIELD], context)["llm_suggestions"],
+    )
+
+
+def analyze_resume_text(
+    text: str,
+    job_description: str | None = None,
+    *,
+    context: AnalysisContext | None = None,
+    fields: Iterable[str] | None = None,
+) -> dict:
+    context = context or AnalysisContext(text, job_description)
+    selected = select_fields(ANALYSIS_FIELDS, fields)
+    with timed("analyze_resume_text"):
+        cache_key = analysis_cache_key(text, job_description)
+        with timed("analysis_cache.lookup"):
+            cached = get_cached_result(cache_key) or {"fields": {}, "context": {}}
+        context.seed(cached["context"])
+        cached_fields = cached["fields"]
+        missing = [field for field in selected if field.name not in cached_fields]
+        if missing:
+            cached_fields = {**cached_fields, **compute_fields(ANALYSIS_STAGES, missing, context)}
+            store_cached_result(
+                cache_key,
+                {
+                    "fields": _cacheable_fields(cached_fields, context),
+                    "context": {**cached["context"], **_cacheable_context(context)},
+                },
+            )
+        return {field.name: cached_fields[field.name] for field in selected}
+
+
+def prepare_batch_contexts(
+    texts: list[str],
+    job_description: str | None = None,
+    fields: Iterable[str] | None = None,
+) -> list[AnalysisContext]:
+    contexts = [AnalysisContext(text, job_description) for text in texts]
+    selected = select_fields(ANALYSIS_FIELDS, fields)
+    targets = {name for field in selected for name in field.requires}
+    if "parsed" not in required_stages(ANALYSIS_STAGES, targets, ("text", "job_description")):
+        return contexts
+
+    pending = [
+        context for context in contexts if get_cached_result(analysis_cache_key(context.text, job_description)) is None
+    ]
+    if not pending:
+        return contexts
+    with timed("batch.parse_resumes"):
+        artifacts = [build_nlp_artifacts(context.text) for context in pending]
+        parsed = parse_resumes([item.cleaned_text for item in artifacts])
+    for context, item, parsed_resume in zip(pending, artifacts, parsed):
+        context.seed({"artifacts": item, "parsed": parsed_resume})
+    return contexts
+
+
+def build_job_description_profile(job_description: str) -> JobDescriptionProfile:
+    text = str(job_description or "").strip()
+    with timed("job_description_profile.build"):
+        return JobDescriptionProfile(
+            jd_id=job_description_id(text),
+            text=text,
+            keywords=list(_cached_target_keywords(text)),
+            skills=extract_skills(text),
+            model_id=embedding_model_id(),
+            embedding=encode_texts([text])[0],
+            pipeline_version=PIPELINE_VERSION,
+        )
+
+
+def job_description_profile(job_description: str | None) -> JobDescriptionProfile | None:
+    text = str(job_description or "").strip()
+    if not text:
+        return None
+    profile = lookup_profile(text)
+    if profile is not None:
+        return profile
+    profile = load_job_description(job_description_id(text))
+    if profile is None or not _profile_is_current(profile):
+        profile = build_job_description_profile(text)
+    return remember_profile(profile)
+
+
+def register_job_description(job_description: str) -> JobDescriptionProfile:
+    profile = job_description_profile(job_description)
+    if profile is None:
+        raise ValueError("Job description text is required")
+    save_job_description(profile)
+    return profile
+
+
+def stored_job_description(jd_id: str) -> JobDescriptionProfile | None:
+    profile = lookup_profile_by_id(jd_id) or load_job_description(jd_id)
+    if profile is None:
+        return None
+    if not _profile_is_current(profile):
+        profile = build_job_description_profile(profile.text)
+        save_job_description(profile)
+    return remember_profile(profile)
+
+
+def _profile_is_current(profile: JobDescriptionProfile) -> bool:
+    return profile.pipeline_version == PIPELINE_VERSION and profile.model_id == embedding_model_id()
+
+
+def analysis_field_names() -> list[str]:
+    return [field.name for field in ANALYSIS_FIELDS]
+
+
+@lru_cache(maxsize=1)
+def _llm_dependent_fields() -> frozenset[str]:
+    return frozenset(
+        field.name
+        for field in ANALYSIS_FIELDS
+        if "llm_suggestions" in required_stages(ANALYSIS_STAGES, field.requires, ("text", "job_description"))
+    )
+
+
+def _cacheable_fields(fields: dict, context: AnalysisContext) -> dict:
+    llm_suggestions = context.results.get("llm_suggestions")
+    if llm_suggestions is None or "error" not in llm_suggestions:
+        return fields
+    return {name: value for name, value in fields.items() if name not in _llm_dependent_fields()}
+
 
-    parsed_data = advanced.get("parsed_data", {})
-    sections = parsed_data.get("sections", {})
-    structured_sections = parsed_data.get("structured_sections", [])
-    skills = advanced.get("skill_extraction", {}).get("detected_skills", [])
+def _cacheable_context(context: AnalysisContext) -> dict:
+    cacheable = {}
+    if "ats_scorecard" in context.results:
+        cacheable["ats_scorecard"] = context.results["ats_scorecard"]
+    llm_suggestions = context.results.get("llm_suggestions")
+    if llm_suggestions is not None and "error" not in llm_suggestions:
+        cacheable["llm_suggestions"] = llm_suggestions
+    return cacheable
+
+
+def _build_vulnerabilities(sections: dict[str, str], skill_data: dict) -> list:
     gaps = detect_year_gaps(sections.get("education", ""))
-    vulnerabilities = detect_vulnerabilities(sections, skills, gaps)
-
-    resume_score = advanced.get("resume_score", {})
-    score_breakdown = resume_score.get("breakdown", {})
-    completeness = advanced.get("section_completeness", {}).get("required", {})
-    evidence = advanced.get("skill_verification", {})
-    role_prediction = advanced.get("resume_profile_classification", {})
-    candidate_type = advanced.get("candidate_type_prediction", {})
+    return detect_vulnerabilities(sections, skill_data["detected_skills"], gaps)
+
+
+def _build_category_scores(completeness: dict, evidence: dict[str, dict], skill_data: dict) -> dict:
+    required = completeness.get("required", {})
     strong_or_moderate = sum(
         1 for item in evidence.values() if item.get("status") in {"Strong Evidence", "Moderate Evidence"}
     )
-    normalized_resume = normalize_resume_schema(
-        parsed_data=parsed_data,
-        sections=sections,
-        structured_sections=structured_sections,
-        skills=skills,
-        project_analysis=advanced.get("project_analysis", []),
-        raw_text=advanced.get("preprocessing", {}).get("cleaned_text", text),
-    )
-
     return {
-        "overall_score": int(ats_scorecard.get("ats_score", 0)),
-        "analysis_score": int(resume_score.get("total", 0)),
-        "ats_score": int(ats_scorecard.get("ats_score", 0)),
-        "ats_breakdown": ats_scorecard.get("breakdown", {}),
-        "breakdown": ats_scorecard.get("breakdown", {}),
-        "category_scores": {
-            "education": 100 if completeness.get("education") else 0,
-            "skills": min(100, strong_or_moderate * 10 + (20 if skills else 0)),
-            "projects": 100 if completeness.get("projects") else 0,
-            "experience": 100 if completeness.get("experience") else 0,
-        },
-        "skills": skills,
-        "sections": sections,
-        "structured_sections": structured_sections,
-        "normalized_resume": normalized_resume,
-        "predicted_role": role_prediction.get("predicted_profile", ""),
-        "experience_level": candidate_type.get("predicted_category", ""),
-        "role_scores": {
+        "education": 100 if required.get("education") else 0,
+        "skills": min(100, strong_or_moderate * 10 + (20 if skill_data["detected_skills"] else 0)),
+        "projects": 100 if required.get("projects") else 0,
+        "experience": 100 if required.get("experience") else 0,
+    }
+
+
+ANALYSIS_STAGES: list[Stage] = [
+    *(stage for stage in REPORT_STAGES if stage.name != "job_profile"),
+    Stage("job_profile", lambda job_description: job_description_profile(job_description), ("job_description",)),
+    Stage(
+        "ats_scorecard",
+        lambda text, job_description: calculate_ats_scorecard(text, job_description=job_description),
+        ("text", "job_description"),
+    ),
+    Stage("vulnerabilities", _build_vulnerabilities, ("sections", "skill_data")),
+    Stage(
+        "normalized_resume",
+        lambda parsed, sections, skill_data, projects, artifacts: normalize_resume_schema(
+            parsed_data=parsed,
+            sections=sections,
+            structured_sections=parsed.get("structured_sections", []),
+            skills=skill_data["detected_skills"],
+            project_analysis=projects,
+            raw_text=artifacts.cleaned_text,
+        ),
+        ("parsed", "sections", "skill_data", "projects", "artifacts"),
+    ),
+]
+
+LLM_SUGGESTIONS_FIELD = Stage("llm_suggestions", lambda llm_suggestions: llm_suggestions, ("llm_suggestions",))
+
+ANALYSIS_FIELDS: list[Stage] = [
+    Stage("overall_score", lambda ats_scorecard: int(ats_scorecard.get("ats_score", 0)), ("ats_scorecard",)),
+    Stage("analysis_score", lambda resume_score: int(resume_score.get("total", 0)), ("resume_score",)),
+    Stage("ats_score", lambda ats_scorecard: int(ats_scorecard.get("ats_score", 0)), ("ats_scorecard",)),
+    Stage("ats_breakdown", lambda ats_scorecard: ats_scorecard.get("breakdown", {}), ("ats_scorecard",)),
+    Stage("breakdown", lambda ats_scorecard: ats_scorecard.get("breakdown", {}), ("ats_scorecard",)),
+    Stage("category_scores", _build_category_scores, ("completeness", "evidence", "skill_data")),
+    Stage("skills", lambda skill_data: skill_data["detected_skills"], ("skill_data",)),
+    Stage("sections", lambda sections: sections, ("sections",)),
+    Stage("structured_sections", lambda parsed: parsed.get("structured_sections", []), ("parsed",)),
+    Stage("normalized_resume", lambda normalized_resume: normalized_resume, ("normalized_resume",)),
+    Stage(
+        "predicted_role",
+        lambda profile_classification: profile_classification.get("predicted_profile", ""),
+        ("profile_classification",),
+    ),
+    Stage(
+        "experience_level",
+        lambda candidate_type: candidate_type.get("predicted_category", ""),
+        ("candidate_type",),
+    ),
+    Stage(
+        "role_scores",
+        lambda profile_classification: {
             item.get("profile", ""): item.get("score", 0)
-            for item in role_prediction.get("scores", [])
+            for item in profile_classification.get("scores", [])
             if item.get("profile")
         },
-        "suggestions": advanced.get("improvement_suggestions", []),
-        "vulnerabilities": vulnerabilities,
-        **advanced,
-    }
+        ("profile_classification",),
+    ),
+    Stage("suggestions", lambda suggestions: suggestions, ("suggestions",)),
+    Stage("vulnerabilities", lambda vulnerabilities: vulnerabilities, ("vulnerabilities",)),
+    *REPORT_FIELDS,
+]
 
 
 def calculate_ats_scorecard(resume_text: str, job_description: str | None = None) -> dict:
+    with timed("ats_scorecard"):
+        return _calculate_ats_scorecard(resume_text, job_description)
+
+
+def _calculate_ats_scorecard(resume_text: str, job_description: str | None) -> dict:
     resume_text = str(resume_text or "").strip()
     if not resume_text:
         return {
@@ -143,11 +359,17 @@ def calculate_ats_scorecard(resume_text: str, job_description: str | None = None
             "keywords_used": [],
         }
 
-    keywords_used = _extract_target_keywords(job_description)
-    keyword_result = _score_keyword_matching(resume_text, keywords_used)
-    section_result = _score_section_completeness(resume_text)
-    content_result = _score_content_quality(resume_text)
-    formatting_result = _score_formatting(resume_text)
+    with timed("ats_scorecard.text_view"):
+        view = build_ats_text_view(resume_text)
+    with timed("ats_scorecard.keywords"):
+        keywords_used, matcher = _job_description_keywords(job_description)
+        keyword_result = _score_keyword_matching(view, keywords_used, matcher)
+    with timed("ats_scorecard.sections"):
+        section_result = _score_section_completeness(view)
+    with timed("ats_scorecard.content"):
+        content_result = _score_content_quality(view)
+    with timed("ats_scorecard.formatting"):
+        formatting_result = _score_formatting(view)
 
     ats_score = round(
         (keyword_result["score"] * 0.4)
@@ -179,6 +401,19 @@ def calculate_ats_scorecard(resume_text: str, job_description: str | None = None
     }
 
 
+def _job_description_keywords(job_description: str | None) -> tuple[list[str], PhraseMatcher]:
+    profile = lookup_profile(job_description)
+    if profile is not None:
+        return list(profile.keywords), profile.matcher
+    keywords = _cached_target_keywords(str(job_description or "").strip())
+    return list(keywords), get_phrase_matcher(tuple(keyword.lower() for keyword in keywords))
+
+
+@lru_cache(maxsize=256)
+def _cached_target_keywords(job_description: str) -> tuple[str, ...]:
+    return tuple(_extract_target_keywords(job_description))
+
+
 def _extract_target_keywords(job_description: str | None) -> list[str]:
     text = str(job_description or "").strip()
     if not text:
@@ -187,9 +422,7 @@ def _extract_target_keywords(job_description: str | None) -> list[str]:
     normalized = _normalize_text(text)
     candidates: set[str] = set()
 
-    for phrase in DEFAULT_ATS_KEYWORDS:
-        if _contains_phrase(normalized, phrase):
-            candidates.add(phrase)
+    candidates.update(get_phrase_matcher(tuple(DEFAULT_ATS_KEYWORDS)).matched_phrases(normalized))
 
     tokens = re.findall(r"[a-z][a-z+#./-]{1,}", normalized)
     for token in tokens:
@@ -205,13 +438,28 @@ def _extract_target_keywords(job_description: str | None) -> list[str]:
         if len(phrase) > 5:
             candidates.add(phrase)
 
-    prioritized = sorted(candidates, key=lambda item: (-_keyword_priority(item), item))
+    prioritized = sorted(candidates, key=_keyword_sort_key)
     return prioritized[:20] or sorted(DEFAULT_ATS_KEYWORDS)
 
 
-def _score_keyword_matching(resume_text: str, keywords: list[str]) -> dict:
-    normalized_resume = _normalize_text(resume_text)
-    matched_keywords = [keyword for keyword in keywords if _contains_phrase(normalized_resume, keyword)]
+def build_ats_text_view(resume_text: str) -> ATSTextView:
+    text = str(resume_text or "").strip()
+    normalized = _normalize_text(text)
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return ATSTextView(
+        text=text,
+        normalized=normalized,
+        lines=lines,
+        bullet_lines=[line for line in lines if line[0] in BULLET_MARKERS],
+        word_count=len(WORD_PATTERN.findall(text)),
+        tokens=frozenset(WORD_PATTERN.findall(normalized)),
+    )
+
+
+def _score_keyword_matching(view: ATSTextView, keywords: list[str], matcher: PhraseMatcher | None = None) -> dict:
+    matcher = matcher or get_phrase_matcher(tuple(keyword.lower() for keyword in keywords))
+    mentioned = matcher.matched_phrases(view.normalized)
+    matched_keywords = [keyword for keyword in keywords if keyword.lower() in mentioned]
     total_keywords = len(keywords)
     score = round((len(matched_keywords) / total_keywords) * 100) if total_keywords else 0
 
@@ -223,13 +471,12 @@ def _score_keyword_matching(resume_text: str, keywords: list[str]) -> dict:
     }
 
 
-def _score_section_completeness(resume_text: str) -> dict:
-    normalized_resume = _normalize_text(resume_text)
+def _score_section_completeness(view: ATSTextView) -> dict:
     present_sections = []
     missing_sections = []
 
-    for section, patterns in SECTION_PATTERNS.items():
-        if any(re.search(pattern, normalized_resume, flags=re.IGNORECASE) for pattern in patterns):
+    for section, pattern in SECTION_REGEXES.items():
+        if pattern.search(view.normalized):
             present_sections.append(section)
         else:
             missing_sections.append(section)
@@ -243,15 +490,13 @@ def _score_section_completeness(resume_text: str) -> dict:
     }
 
 
-def _score_content_quality(resume_text: str) -> dict:
-    normalized_resume = _normalize_text(resume_text)
-    resume_lines = [line.strip() for line in resume_text.splitlines() if line.strip()]
-    bullet_lines = [line for line in resume_lines if re.match(r"^[-*•]", line)]
+def _score_content_quality(view: ATSTextView) -> dict:
+    bullet_lines = view.bullet_lines
 
-    has_action_verbs = any(re.search(rf"\b{re.escape(verb)}\b", normalized_resume) for verb in ACTION_VERBS)
-    has_numeric_values = bool(re.search(r"\b\d+(?:\.\d+)?%?\b", resume_text))
+    has_action_verbs = not view.tokens.isdisjoint(ACTION_VERBS)
+    has_numeric_values = bool(NUMERIC_PATTERN.search(view.text))
     average_bullet_length = (
-        sum(len(re.findall(r"\w+", line)) for line in bullet_lines) / len(bullet_lines)
+        sum(len(WORD_PATTERN.findall(line)) for line in bullet_lines) / len(bullet_lines)
         if bullet_lines else 0.0
     )
 
@@ -274,11 +519,10 @@ def _score_content_quality(resume_text: str) -> dict:
     }
 
 
-def _score_formatting(resume_text: str) -> dict:
-    words = re.findall(r"\b\w+\b", resume_text)
-    word_count = len(words)
-    lines = [line.rstrip() for line in resume_text.splitlines() if line.strip()]
-    bullet_lines = [line for line in lines if re.match(r"^[-*•]", line.strip())]
+def _score_formatting(view: ATSTextView) -> dict:
+    word_count = view.word_count
+    lines = view.lines
+    bullet_lines = view.bullet_lines
     heading_lines = _extract_heading_lines(lines)
     consistent_headings = _has_consistent_headings(heading_lines)
 
@@ -359,6 +603,20 @@ def _build_ats_suggestions(
     return deduped[:8]
 
 
+def keyword_hit_matrix(
+    resume_texts: list[str],
+    keywords: list[str],
+    matcher: PhraseMatcher | None = None,
+) -> np.ndarray:
+    lowered = [keyword.lower() for keyword in keywords]
+    matcher = matcher or get_phrase_matcher(tuple(lowered))
+    hits = np.zeros((len(resume_texts), len(keywords)), dtype=bool)
+    for row, text in enumerate(resume_texts):
+        mentioned = matcher.matched_phrases(_normalize_text(text))
+        hits[row] = [keyword in mentioned for keyword in lowered]
+    return hits
+
+
 def _normalize_text(text: str) -> str:
     normalized = str(text or "").lower()
     normalized = normalized.replace("&", " and ")
@@ -367,11 +625,6 @@ def _normalize_text(text: str) -> str:
     return normalized.strip()
 
 
-def _contains_phrase(text: str, phrase: str) -> bool:
-    pattern = rf"(?<![a-z0-9]){re.escape(phrase.lower()).replace(r'\\ ', r'\\s+')}(?![a-z0-9])"
-    return bool(re.search(pattern, text, flags=re.IGNORECASE))
-
-
 def _keyword_priority(keyword: str) -> tuple[int, int]:
     priority = 0
     if keyword in DEFAULT_ATS_KEYWORDS:
@@ -381,6 +634,11 @@ def _keyword_priority(keyword: str) -> tuple[int, int]:
     return priority, len(keyword)
 
 
+def _keyword_sort_key(keyword: str) -> tuple[int, int, str]:
+    priority, length = _keyword_priority(keyword)
+    return -priority, -length, keyword
+
+
 def _extract_heading_lines(lines: list[str]) -> list[str]:
     headings: list[str] = []
     for line in lines:
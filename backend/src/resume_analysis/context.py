@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class AnalysisContext:
+    text: str
+    job_description: str | None = None
+    results: dict[str, Any] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _key_locks: dict[str, threading.Lock] = field(default_factory=dict, repr=False)
+
+    def memo(self, name: str, factory: Callable[[], Any]) -> Any:
+        if name in self.results:
+            return self.results[name]
+        with self._lock_for(name):
+            if name not in self.results:
+                self.results[name] = factory()
+        return self.results[name]
+
+    def seed(self, values: dict[str, Any]) -> None:
+        for name, value in values.items():
+            self.results.setdefault(name, value)
+
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(name, threading.Lock())
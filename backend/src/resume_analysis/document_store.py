@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .job_profiles import JobDescriptionProfile
+from .skill_bitsets import pack_skills, vocabulary_fingerprint
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "document_store.db"
+SQL_VARIABLE_CHUNK = 500
+
+_ready: set[str] = set()
+
+
+@dataclass
+class StoredResume:
+    resume_id: str
+    text: str
+    skills: list[str]
+    model_id: str
+    embedding: np.ndarray
+    pipeline_version: str
+
+
+def save_job_description(profile: JobDescriptionProfile) -> None:
+    with connect() as conn:
+        conn.execute(
+            """
+            INSERT INTO job_descriptions
+                (jd_id, text, keywords, skills, model_id, embedding, pipeline_version, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(jd_id) DO UPDATE SET
+                keywords = excluded.keywords,
+                skills = excluded.skills,
+                model_id = excluded.model_id,
+                embedding = excluded.embedding,
+                pipeline_version = excluded.pipeline_version
+            """,
+            (
+                profile.jd_id,
+                profile.text,
+                json.dumps(profile.keywords),
+                json.dumps(profile.skills),
+                profile.model_id,
+                np.ascontiguousarray(profile.embedding, dtype="<f8").tobytes(),
+                profile.pipeline_version,
+                time.time(),
+            ),
+        )
+        conn.commit()
+
+
+def load_job_description(jd_id: str) -> JobDescriptionProfile | None:
+    try:
+        with connect() as conn:
+            row = conn.execute(
+                """
+                SELECT jd_id, text, keywords, skills, model_id, embedding, pipeline_version
+                FROM job_descriptions WHERE jd_id = ?
+                """,
+                (jd_id,),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return _job_description_from_row(row) if row is not None else None
+
+
+def load_job_descriptions() -> list[JobDescriptionProfile]:
+    with connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT jd_id, text, keywords, skills, model_id, embedding, pipeline_version
+            FROM job_descriptions ORDER BY rowid
+            """
+        ).fetchall()
+    return [_job_description_from_row(row) for row in rows]
+
+
+def job_description_revision() -> tuple[int, int]:
+    with connect() as conn:
+        count, last_row = conn.execute("SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM job_descriptions").fetchone()
+    return int(count), int(last_row)
+
+
+def resume_id(text: str) -> str:
+    return hashlib.sha256(str(text or "").strip().encode("utf-8")).hexdigest()[:16]
+
+
+def save_resumes(resumes: list[StoredResume]) -> None:
+    now = time.time()
+    with connect() as conn:
+        conn.executemany(
+            """
+            INSERT INTO resumes (resume_id, text, skills, model_id, embedding, pipeline_version, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(resume_id) DO UPDATE SET
+                skills = excluded.skills,
+                model_id = excluded.model_id,
+                embedding = excluded.embedding,
+                pipeline_version = excluded.pipeline_version
+            """,
+            [
+                (
+                    resume.resume_id,
+                    resume.text,
+                    json.dumps(resume.skills),
+                    resume.model_id,
+                    np.ascontiguousarray(resume.embedding, dtype="<f8").tobytes(),
+                    resume.pipeline_version,
+                    now,
+                )
+                for resume in resumes
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO resume_skill_bits (resume_id, vocabulary, bits) VALUES (?, ?, ?)",
+            [
+                (resume.resume_id, vocabulary_fingerprint(), pack_skills(resume.skills).astype("<u8").tobytes())
+                for resume in resumes
+            ],
+        )
+        conn.commit()
+
+
+def load_resumes(resume_ids: list[str]) -> dict[str, StoredResume]:
+    found: dict[str, StoredResume] = {}
+    unique_ids = list(dict.fromkeys(resume_ids))
+    with connect() as conn:
+        for start in range(0, len(unique_ids), SQL_VARIABLE_CHUNK):
+            chunk = unique_ids[start:start + SQL_VARIABLE_CHUNK]
+            rows = conn.execute(
+                f"""
+                SELECT resume_id, text, skills, model_id, embedding, pipeline_version
+                FROM resumes WHERE resume_id IN ({", ".join("?" for _ in chunk)})
+                """,
+                chunk,
+            ).fetchall()
+            for row in rows:
+                found[row[0]] = StoredResume(
+                    resume_id=row[0],
+                    text=row[1],
+                    skills=json.loads(row[2]),
+                    model_id=row[3],
+                    embedding=np.frombuffer(row[4], dtype="<f8").copy(),
+                    pipeline_version=row[5],
+                )
+    return found
+
+
+def load_skill_bitsets(after_seq: int = 0) -> list[tuple[int, str, np.ndarray]]:
+    with connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT b.seq, b.resume_id, b.vocabulary, b.bits, r.skills
+            FROM resume_skill_bits b JOIN resumes r ON r.resume_id = b.resume_id
+            WHERE b.seq > ? ORDER BY b.seq
+            """,
+            (after_seq,),
+        ).fetchall()
+    fingerprint = vocabulary_fingerprint()
+    return [
+        (
+            seq,
+            resume_id,
+            np.frombuffer(bits, dtype="<u8").astype(np.uint64)
+            if vocabulary == fingerprint
+            else pack_skills(json.loads(skills)),
+        )
+        for seq, resume_id, vocabulary, bits, skills in rows
+    ]
+
+
+def _job_description_from_row(row: tuple) -> JobDescriptionProfile:
+    return JobDescriptionProfile(
+        jd_id=row[0],
+        text=row[1],
+        keywords=json.loads(row[2]),
+        skills=json.loads(row[3]),
+        model_id=row[4],
+        embedding=np.frombuffer(row[5], dtype="<f8").copy(),
+        pipeline_version=row[6],
+    )
+
+
+def _db_path() -> Path:
+    configured = os.getenv("DOCUMENT_STORE_DB", "").strip()
+    return Path(configured) if configured else DEFAULT_DB_PATH
+
+
+def connect() -> sqlite3.Connection:
+    path = _db_path()
+    conn = sqlite3.connect(path, timeout=5)
+    if str(path) not in _ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_descriptions (
+                jd_id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                keywords TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                pipeline_version TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS resumes (
+                resume_id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                pipeline_version TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS resume_skill_bits (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                resume_id TEXT NOT NULL UNIQUE,
+                vocabulary TEXT NOT NULL,
+                bits BLOB NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        _ready.add(str(path))
+    return conn
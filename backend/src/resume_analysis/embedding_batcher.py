@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 3.0
+
+
+@dataclass
+class _EncodeRequest:
+    texts: list[str]
+    future: Future = field(default_factory=Future)
+
+
+class EmbeddingBatcher:
+    def __init__(
+        self,
+        encode: Callable[[list[str]], np.ndarray],
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        name: str = "embedding-batcher",
+    ) -> None:
+        self.encode_batch = encode
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: queue.Queue[_EncodeRequest | None] = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.stats = {"batches": 0, "requests": 0, "texts": 0, "unique_texts": 0, "largest_batch": 0}
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: list[str]) -> Future:
+        request = _EncodeRequest(list(texts))
+        if not request.texts:
+            request.future.set_result(np.zeros((0, 0), dtype=np.float32))
+        else:
+            self._queue.put(request)
+        return request.future
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return self.submit(texts).result()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def snapshot(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["avg_batch_texts"] = round(stats["texts"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["max_batch_size"] = self.max_batch_size
+        stats["max_wait_ms"] = self.max_wait * 1000
+        return stats
+
+    def _run(self) -> None:
+        carry: _EncodeRequest | None = None
+        stopping = False
+        while not stopping:
+            first = carry if carry is not None else self._queue.get()
+            carry = None
+            if first is None:
+                return
+            batch = [first]
+            size = len(first.texts)
+            deadline = time.perf_counter() + self.max_wait
+            while size < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                if size + len(item.texts) > self.max_batch_size:
+                    carry = item
+                    break
+                batch.append(item)
+                size += len(item.texts)
+            self._dispatch(batch)
+        if carry is not None:
+            self._dispatch([carry])
+
+    def _dispatch(self, batch: list[_EncodeRequest]) -> None:
+        unique = list(dict.fromkeys(text for request in batch for text in request.texts))
+        try:
+            vectors = np.asarray(self.encode_batch(unique))
+        except Exception as exc:
+            for request in batch:
+                request.future.set_exception(exc)
+            return
+
+        positions = {text: index for index, text in enumerate(unique)}
+        for request in batch:
+            request.future.set_result(vectors[[positions[text] for text in request.texts]])
+        with self._stats_lock:
+            self.stats["batches"] += 1
+            self.stats["requests"] += len(batch)
+            self.stats["texts"] += sum(len(request.texts) for request in batch)
+            self.stats["unique_texts"] += len(unique)
+            self.stats["largest_batch"] = max(self.stats["largest_batch"], len(unique))
+
+
+def batching_enabled() -> bool:
+    return os.getenv("EMBEDDING_BATCHING", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def batcher_settings_from_env() -> dict:
+    size = os.getenv("EMBEDDING_BATCH_MAX_SIZE", "").strip()
+    wait = os.getenv("EMBEDDING_BATCH_WAIT_MS", "").strip()
+    try:
+        max_wait_ms = float(wait) if wait else DEFAULT_MAX_WAIT_MS
+    except ValueError:
+        max_wait_ms = DEFAULT_MAX_WAIT_MS
+    return {
+        "max_batch_size": int(size) if size.isdigit() else DEFAULT_MAX_BATCH_SIZE,
+        "max_wait_ms": max_wait_ms,
+    }
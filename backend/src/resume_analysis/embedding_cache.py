@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from .vector_store import dequantize_rows, quantize_rows
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+KEY_BYTES = 16
+DEFAULT_MEMORY_ENTRIES = 20000
+DEFAULT_SPILL_MAX_BYTES = 512 * 1024 * 1024
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()[:KEY_BYTES]
+
+
+class SentenceEmbeddingCache:
+    def __init__(
+        self,
+        dimension: int,
+        *,
+        memory_entries: int,
+        kind: str = "float32",
+        spill_path: Path | None = None,
+        spill_max_bytes: int = 0,
+    ) -> None:
+        self.dimension = dimension
+        self.kind = kind
+        self.memory_entries = memory_entries
+        self.spill_path = spill_path if fcntl is not None and spill_max_bytes > 0 else None
+        self.spill_max_bytes = spill_max_bytes
+        self.record_dtype = np.dtype(
+            [("key", f"V{KEY_BYTES}"), ("scale", "<f4"), ("codes", np.dtype(kind).newbyteorder("<"), (dimension,))]
+        )
+        self._memory: OrderedDict[bytes, tuple[np.ndarray, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._spill_index: dict[bytes, int] = {}
+        self._spill_map: mmap.mmap | None = None
+        self._spill_records = 0
+        self.stats = {"memory_hits": 0, "spill_hits": 0, "misses": 0, "spilled": 0}
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        found: dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = self._decode(*entry)
+            self.stats["memory_hits"] += len(found)
+
+            missing = [key for key in keys if key not in found]
+            if missing and self.spill_path is not None:
+                self._refresh_spill()
+                for key in missing:
+                    record = self._spill_index.get(key)
+                    if record is None:
+                        continue
+                    row = self._spill_rows()[record]
+                    entry = (np.array(row["codes"]), float(row["scale"]))
+                    found[key] = self._decode(*entry)
+                    self._remember(key, entry)
+                    self.stats["spill_hits"] += 1
+            self.stats["misses"] += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: dict[bytes, np.ndarray]) -> dict[bytes, np.ndarray]:
+        if not items:
+            return {}
+        codes, scales = quantize_rows(np.asarray(list(items.values()), dtype=np.float32), self.kind)
+        scales = scales if scales is not None else np.ones(len(codes), dtype=np.float32)
+        entries = {key: (codes[index], float(scales[index])) for index, key in enumerate(items)}
+        with self._lock:
+            for key, entry in entries.items():
+                self._remember(key, entry)
+            if self.spill_path is not None:
+                self._append_spill({key: entry for key, entry in entries.items() if key not in self._spill_index})
+        return {key: self._decode(*entry) for key, entry in entries.items()}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                **self.stats,
+                "dimension": self.dimension,
+                "storage": self.kind,
+                "memory_bytes": sum(codes.nbytes + 4 for codes, _ in self._memory.values()),
+                "memory_entries": len(self._memory),
+                "memory_limit_entries": self.memory_entries,
+                "spill_path": str(self.spill_path) if self.spill_path else None,
+                "spill_entries": len(self._spill_index),
+            }
+
+    def _decode(self, codes: np.ndarray, scale: float) -> np.ndarray:
+        return dequantize_rows(codes[None, :], np.array([scale], dtype=np.float32) if self.kind == "int8" else None)[0]
+
+    def _remember(self, key: bytes, entry: tuple[np.ndarray, float]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _spill_rows(self) -> np.ndarray:
+        return np.frombuffer(self._spill_map, dtype=self.record_dtype, count=self._spill_records)
+
+    def _refresh_spill(self) -> None:
+        try:
+            size = self.spill_path.stat().st_size
+        except OSError:
+            return
+        records = size // self.record_dtype.itemsize
+        if records <= self._spill_records:
+            return
+        if self._spill_map is not None:
+            self._spill_map.close()
+        with self.spill_path.open("rb") as handle:
+            self._spill_map = mmap.mmap(handle.fileno(), records * self.record_dtype.itemsize, access=mmap.ACCESS_READ)
+        keys = np.frombuffer(self._spill_map, dtype=self.record_dtype, count=records)["key"]
+        for index in range(self._spill_records, records):
+            self._spill_index.setdefault(keys[index].tobytes(), index)
+        self._spill_records = records
+
+    def _append_spill(self, items: dict[bytes, tuple[np.ndarray, float]]) -> None:
+        if not items:
+            return
+        records = np.zeros(len(items), dtype=self.record_dtype)
+        for index, (key, (codes, scale)) in enumerate(items.items()):
+            records[index]["key"] = np.void(key)
+            records[index]["scale"] = scale
+            records[index]["codes"] = codes
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.spill_path.open("ab") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    size = os.fstat(handle.fileno()).st_size
+                    torn = size % self.record_dtype.itemsize
+                    if torn:
+                        os.ftruncate(handle.fileno(), size - torn)
+                        size -= torn
+                    if size + records.nbytes > self.spill_max_bytes:
+                        return
+                    handle.write(records.tobytes())
+                    handle.flush()
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            return
+        self.stats["spilled"] += len(items)
+        self._refresh_spill()
+
+
+def memory_entries_from_env() -> int:
+    configured = os.getenv("EMBEDDING_CACHE_ENTRIES", "").strip()
+    return int(configured) if configured.isdigit() else DEFAULT_MEMORY_ENTRIES
+
+
+def spill_max_bytes_from_env() -> int:
+    configured = os.getenv("EMBEDDING_SPILL_MAX_BYTES", "").strip()
+    return int(configured) if configured.isdigit() else DEFAULT_SPILL_MAX_BYTES
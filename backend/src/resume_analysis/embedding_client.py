@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import socket
+import struct
+import threading
+import time
+
+import numpy as np
+
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 256 * 1024 * 1024
+RETRY_AFTER_SECONDS = 5.0
+
+
+def send_frame(sock: socket.socket, payload: bytes) -> None:
+    sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> bytes | None:
+    header = _recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise OSError(f"Embedding frame of {length} bytes exceeds the limit")
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        raise OSError("Embedding connection closed mid-frame")
+    return payload
+
+
+def _recv_exact(sock: socket.socket, length: int) -> bytes | None:
+    chunks = bytearray()
+    while len(chunks) < length:
+        chunk = sock.recv(min(length - len(chunks), 1024 * 1024))
+        if not chunk:
+            if chunks:
+                raise OSError("Embedding connection closed mid-frame")
+            return None
+        chunks.extend(chunk)
+    return bytes(chunks)
+
+
+class EmbeddingClient:
+    def __init__(self, path: str, *, timeout: float = 30.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.model_id: str | None = None
+        self.dimension: int | None = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._unavailable_until = 0.0
+        self.stats = {"requests": 0, "texts": 0, "failures": 0}
+
+    def available_model_id(self) -> str | None:
+        model_id = self.model_id
+        if model_id is not None:
+            return model_id
+        with self._lock:
+            if time.monotonic() < self._unavailable_until:
+                return None
+        try:
+            info, _ = self._request({"op": "info"})
+        except OSError:
+            return None
+        model_id = info.get("model_id")
+        with self._lock:
+            self.model_id = model_id
+            self.dimension = info.get("dimension")
+        return model_id
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        header, body = self._request({"op": "encode", "texts": list(texts)})
+        rows, dimension = header["rows"], header["dimension"]
+        if rows != len(texts) or len(body) != rows * dimension * 4:
+            error = OSError(f"Embedding server sent {len(body)} bytes for {rows}x{dimension} vectors")
+            self._reset(error)
+            raise error
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["texts"] += len(texts)
+        return np.frombuffer(body, dtype="<f4").reshape(rows, dimension)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.stats, "socket": self.path, "model_id": self.model_id, "dimension": self.dimension}
+
+    def _request(self, payload: dict) -> tuple[dict, bytes]:
+        try:
+            sock = self._connection()
+            send_frame(sock, json.dumps(payload).encode("utf-8"))
+            header_frame = recv_frame(sock)
+            if header_frame is None:
+                raise OSError("Embedding server closed the connection")
+            header = json.loads(header_frame)
+            if not header.get("ok"):
+                raise OSError(header.get("error") or "Embedding server error")
+            body = recv_frame(sock) if header.get("rows") is not None else b""
+            return header, body or b""
+        except (OSError, ValueError) as exc:
+            self._reset(exc)
+            raise OSError(str(exc)) from exc
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                raise
+            self._local.sock = sock
+        return sock
+
+    def _reset(self, exc: Exception) -> None:
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+        with self._lock:
+            self.stats["failures"] += 1
+            self._unavailable_until = time.monotonic() + RETRY_AFTER_SECONDS
+            self.model_id = None
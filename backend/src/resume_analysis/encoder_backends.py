@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+import os
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from pathlib import Path
+
+import numpy as np
+from scipy.special import erf
+
+from .vector_store import dequantize_rows
+
+ENCODER_BACKENDS = ("torch", "onnx", "numpy")
+DEFAULT_ENCODER_BACKEND = "torch"
+ENCODER_CONFIG_FILE = "encoder_config.json"
+TOKENIZER_FILE = "tokenizer.json"
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_QUANTIZED_MODEL_FILE = "model.int8.onnx"
+NUMPY_WEIGHTS_FILE = "weights.npz"
+NUMPY_QUANTIZED_WEIGHTS_FILE = "weights.int8.npz"
+ATTENTION_MASK_VALUE = -1e9
+PARITY_MIN_COSINE = {False: 0.999, True: 0.98}
+
+
+def encoder_backend_from_env() -> str:
+    configured = os.getenv("EMBEDDING_BACKEND", "").strip().lower()
+    return configured if configured in ENCODER_BACKENDS else DEFAULT_ENCODER_BACKEND
+
+
+def encoder_threads_from_env() -> int | None:
+    configured = os.getenv("EMBEDDING_THREADS", "").strip()
+    return int(configured) if configured.isdigit() and int(configured) > 0 else None
+
+
+def quantization_enabled() -> bool:
+    return os.getenv("EMBEDDING_QUANTIZE", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def load_sentence_encoder(
+    model_name: str,
+    model_dir: Path,
+    *,
+    backend: str | None = None,
+    threads: int | None = None,
+    quantize: bool | None = None,
+):
+    backend = backend or encoder_backend_from_env()
+    threads = threads if threads is not None else encoder_threads_from_env()
+    quantize = quantization_enabled() if quantize is None else quantize
+    if backend == "onnx":
+        return OnnxSentenceEncoder(model_name, model_dir, threads=threads, quantize=quantize)
+    if backend == "numpy":
+        return NumpySentenceEncoder(model_name, model_dir, threads=threads, quantize=quantize)
+    return TorchSentenceEncoder(model_name, threads=threads, quantize=quantize)
+
+
+class TorchSentenceEncoder:
+    def __init__(self, model_name: str, *, threads: int | None = None, quantize: bool = False) -> None:
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        if threads:
+            torch.set_num_threads(threads)
+        model = SentenceTransformer(model_name, local_files_only=True)
+        if quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model = model
+        self.model_id = f"{model_name}-torch-int8" if quantize else model_name
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return int(self.model.get_sentence_embedding_dimension())
+
+    def encode(self, texts: list[str], normalize_embeddings: bool = True, batch_size: int = 32) -> np.ndarray:
+        vectors = self.model.encode(texts, normalize_embeddings=normalize_embeddings, batch_size=batch_size)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+class _TransformerSentenceEncoder(ABC):
+    backend = ""
+
+    def __init__(self, model_name: str, model_dir: Path, *, threads: int | None, quantize: bool) -> None:
+        from tokenizers import Tokenizer
+
+        self.model_dir = Path(model_dir)
+        self.config = json.loads((self.model_dir / ENCODER_CONFIG_FILE).read_text(encoding="utf-8"))
+        self.threads = threads
+        self.tokenizer = Tokenizer.from_file(str(self.model_dir / TOKENIZER_FILE))
+        self.tokenizer.enable_truncation(int(self.config["max_seq_length"]))
+        self.tokenizer.enable_padding(pad_id=int(self.config.get("pad_token_id", 0)))
+        suffix = f"{self.backend}-int8" if quantize else self.backend
+        self.model_id = f"{model_name}-{suffix}"
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return int(self.config["hidden_size"])
+
+    def encode(self, texts: list[str], normalize_embeddings: bool = True, batch_size: int = 32) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.get_sentence_embedding_dimension()), dtype=np.float32)
+        order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+        for start in range(0, len(order), max(1, batch_size)):
+            chunk = order[start:start + batch_size]
+            encodings = self.tokenizer.encode_batch([texts[index] for index in chunk])
+            input_ids = np.asarray([encoding.ids for encoding in encodings], dtype=np.int64)
+            attention_mask = np.asarray([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+            token_type_ids = np.asarray([encoding.type_ids for encoding in encodings], dtype=np.int64)
+            hidden = self._forward(input_ids, attention_mask, token_type_ids)
+            weights = attention_mask[:, :, None].astype(np.float32)
+            vectors[chunk] = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+        if normalize_embeddings:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors /= np.clip(norms, 1e-12, None)
+        return vectors
+
+    @abstractmethod
+    def _forward(self, input_ids: np.ndarray, attention_mask: np.ndarray, token_type_ids: np.ndarray) -> np.ndarray:
+        ...
+
+
+class OnnxSentenceEncoder(_TransformerSentenceEncoder):
+    backend = "onnx"
+
+    def __init__(self, model_name: str, model_dir: Path, *, threads: int | None = None, quantize: bool = False) -> None:
+        import onnxruntime
+
+        super().__init__(model_name, model_dir, threads=threads, quantize=quantize)
+        path = self.model_dir / ONNX_MODEL_FILE
+        if quantize:
+            path = quantize_onnx_model(path, self.model_dir / ONNX_QUANTIZED_MODEL_FILE)
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+        self.input_names = {item.name for item in self.session.get_inputs()}
+
+    def _forward(self, input_ids: np.ndarray, attention_mask: np.ndarray, token_type_ids: np.ndarray) -> np.ndarray:
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask, "token_type_ids": token_type_ids}
+        outputs = self.session.run(None, {name: value for name, value in feeds.items() if name in self.input_names})
+        return np.asarray(outputs[0], dtype=np.float32)
+
+
+class NumpySentenceEncoder(_TransformerSentenceEncoder):
+    backend = "numpy"
+
+    def __init__(self, model_name: str, model_dir: Path, *, threads: int | None = None, quantize: bool = False) -> None:
+        super().__init__(model_name, model_dir, threads=threads, quantize=quantize)
+        path = self.model_dir / (NUMPY_QUANTIZED_WEIGHTS_FILE if quantize else NUMPY_WEIGHTS_FILE)
+        with np.load(path) as archive:
+            self.weights = _load_bert_weights({name: archive[name] for name in archive.files})
+        self.heads = int(self.config["num_attention_heads"])
+        self.layers = int(self.config["num_hidden_layers"])
+        self.eps = float(self.config.get("layer_norm_eps", 1e-12))
+
+    def _forward(self, input_ids: np.ndarray, attention_mask: np.ndarray, token_type_ids: np.ndarray) -> np.ndarray:
+        with self._thread_limit():
+            return bert_forward(self.weights, input_ids, attention_mask, token_type_ids, self.heads, self.layers, self.eps)
+
+    def _thread_limit(self):
+        if not self.threads:
+            return nullcontext()
+        from threadpoolctl import threadpool_limits
+
+        return threadpool_limits(limits=self.threads, user_api="blas")
+
+
+def bert_forward(
+    weights: dict[str, np.ndarray],
+    input_ids: np.ndarray,
+    attention_mask: np.ndarray,
+    token_type_ids: np.ndarray,
+    heads: int,
+    layers: int,
+    eps: float,
+) -> np.ndarray:
+    batch, length = input_ids.shape
+    x = (
+        weights["embeddings.word_embeddings.weight"][input_ids]
+        + weights["embeddings.position_embeddings.weight"][:length][None, :, :]
+        + weights["embeddings.token_type_embeddings.weight"][token_type_ids]
+    )
+    x = _layer_norm(x, weights, "embeddings.LayerNorm", eps)
+    hidden = x.shape[-1]
+    head_size = hidden // heads
+    mask_bias = ((1.0 - attention_mask[:, None, None, :].astype(np.float32)) * ATTENTION_MASK_VALUE).astype(np.float32)
+
+    for index in range(layers):
+        prefix = f"encoder.layer.{index}."
+
+        def split_heads(values: np.ndarray) -> np.ndarray:
+            return values.reshape(batch, length, heads, head_size).transpose(0, 2, 1, 3)
+
+        query = split_heads(_linear(x, weights, prefix + "attention.self.query"))
+        key = split_heads(_linear(x, weights, prefix + "attention.self.key"))
+        value = split_heads(_linear(x, weights, prefix + "attention.self.value"))
+        scores = query @ key.transpose(0, 1, 3, 2) / np.float32(np.sqrt(head_size)) + mask_bias
+        scores -= scores.max(axis=-1, keepdims=True)
+        probs = np.exp(scores)
+        probs /= probs.sum(axis=-1, keepdims=True)
+        context = (probs @ value).transpose(0, 2, 1, 3).reshape(batch, length, hidden)
+
+        attention = _linear(context, weights, prefix + "attention.output.dense")
+        x = _layer_norm(attention + x, weights, prefix + "attention.output.LayerNorm", eps)
+        intermediate = _gelu(_linear(x, weights, prefix + "intermediate.dense"))
+        output = _linear(intermediate, weights, prefix + "output.dense")
+        x = _layer_norm(output + x, weights, prefix + "output.LayerNorm", eps)
+    return x
+
+
+def quantize_onnx_model(source: Path, target: Path) -> Path:
+    if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+        return target
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    quantize_dynamic(str(source), str(temp_path), weight_type=QuantType.QInt8)
+    os.replace(temp_path, target)
+    return target
+
+
+def _load_bert_weights(archive: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    weights: dict[str, np.ndarray] = {}
+    for name, values in archive.items():
+        if name.endswith(".scale"):
+            continue
+        scales = archive.get(f"{name}.scale")
+        values = dequantize_rows(values, scales) if scales is not None else np.asarray(values, dtype=np.float32)
+        if name.endswith(".weight") and values.ndim == 2 and "embeddings" not in name:
+            values = np.ascontiguousarray(values.T)
+        weights[name] = values
+    return weights
+
+
+def _linear(x: np.ndarray, weights: dict[str, np.ndarray], name: str) -> np.ndarray:
+    return x @ weights[f"{name}.weight"] + weights[f"{name}.bias"]
+
+
+def _layer_norm(x: np.ndarray, weights: dict[str, np.ndarray], name: str, eps: float) -> np.ndarray:
+    mean = x.mean(axis=-1, keepdims=True)
+    variance = ((x - mean) ** 2).mean(axis=-1, keepdims=True)
+    return (x - mean) / np.sqrt(variance + eps) * weights[f"{name}.weight"] + weights[f"{name}.bias"]
+
+
+def _gelu(x: np.ndarray) -> np.ndarray:
+    return (0.5 * x * (1.0 + erf(x / np.float32(np.sqrt(2.0))))).astype(np.float32)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import re
-
-from .skill_catalog import CERTIFICATION_HINTS, JOB_TITLE_HINTS, SKILL_ALIASES, SKILL_TAXONOMY
+from .skill_catalog import CERTIFICATION_HINTS, JOB_TITLE_HINTS
+from .skill_matcher import get_skill_matcher, skill_taxonomy_entries
 
 
 def extract_entities(text: str, sections: dict[str, str], doc: object | None = None) -> dict:
@@ -30,12 +29,10 @@ def extract_entities(text: str, sections: dict[str, str], doc: object | None = N
                     if title in lowered:
                         entities["job_titles"].append(value)
 
-    full_text = text.lower()
-    for category in SKILL_TAXONOMY.values():
-        for raw_skill in category:
-            skill = SKILL_ALIASES.get(raw_skill, raw_skill)
-            if _contains_phrase(full_text, skill):
-                entities["skills"].append(_display(skill))
+    mentioned = get_skill_matcher().matched_phrases(text.lower())
+    for _, skill, _ in skill_taxonomy_entries():
+        if skill in mentioned:
+            entities["skills"].append(_display(skill))
 
     for line in text.splitlines():
         lowered = line.lower()
@@ -69,11 +66,6 @@ def extract_entities(text: str, sections: dict[str, str], doc: object | None = N
     return {key: _dedupe(values) for key, values in entities.items()}
 
 
-def _contains_phrase(text: str, phrase: str) -> bool:
-    pattern = rf"(?<![A-Za-z0-9]){re.escape(phrase).replace(r'\\ ', r'\\s+')}(?![A-Za-z0-9])"
-    return bool(re.search(pattern, text, flags=re.IGNORECASE))
-
-
 def _display(skill: str) -> str:
     if skill in {"c++", "c#", "sql", "aws", "gcp", "nlp", "oop", "ci/cd"}:
         return skill.upper()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
-from .semantic_utils import cosine_similarity, encode_texts
+from .job_profiles import JobDescriptionProfile, lookup_profile
+from .semantic_utils import cosine_similarity, embedding_model_id, encode_texts
 from .skill_catalog import SKILL_ALIASES, SKILL_TAXONOMY
+from .skill_matcher import get_skill_matcher
 
 WEIGHTS = {
     "Skills": 30.0,
@@ -59,17 +62,16 @@ def extract_skills(text: str) -> list[str]:
     if not normalized_text:
         return []
 
-    found: set[str] = set()
-    for skill in _all_known_skills():
-        canonical = SKILL_ALIASES.get(skill, skill)
-        pattern = r"(?<![a-z0-9])" + re.escape(skill) + r"(?![a-z0-9])"
-        if re.search(pattern, normalized_text):
-            found.add(canonical)
+    known_skills = _all_known_skills()
+    mentioned = get_skill_matcher().matched_phrases(normalized_text)
+    return sorted({SKILL_ALIASES.get(skill, skill) for skill in mentioned if skill in known_skills})
 
-    return sorted(found)
 
-
-def compute_jd_similarity(resume_text: str, job_description: str | None = None) -> dict:
+def compute_jd_similarity(
+    resume_text: str,
+    job_description: str | None = None,
+    job_profile: JobDescriptionProfile | None = None,
+) -> dict:
     if not job_description or not str(job_description).strip():
         return {
             "score": 0.0,
@@ -83,11 +85,17 @@ def compute_jd_similarity(resume_text: str, job_description: str | None = None)
 
     cleaned_resume = str(resume_text or "").strip()
     cleaned_jd = str(job_description or "").strip()
-    vectors = encode_texts([cleaned_resume, cleaned_jd])
-    similarity = cosine_similarity(vectors[0], vectors[1]) if len(vectors) >= 2 else 0.0
+    profile = job_profile or lookup_profile(cleaned_jd)
+    if profile is not None and profile.model_id == embedding_model_id():
+        vectors = encode_texts([cleaned_resume])
+        similarity = cosine_similarity(vectors[0], profile.embedding) if len(vectors) else 0.0
+        jd_skills = list(profile.skills)
+    else:
+        vectors = encode_texts([cleaned_resume, cleaned_jd])
+        similarity = cosine_similarity(vectors[0], vectors[1]) if len(vectors) >= 2 else 0.0
+        jd_skills = extract_skills(cleaned_jd)
 
     resume_skills = extract_skills(cleaned_resume)
-    jd_skills = extract_skills(cleaned_jd)
     common_skills = sorted(set(resume_skills) & set(jd_skills))
     missing_skills = sorted(set(jd_skills) - set(resume_skills))
     overlap = (len(common_skills) / len(jd_skills)) if jd_skills else 0.0
@@ -199,6 +207,7 @@ def compute_resume_score(
     career_timeline: dict | None = None,
     candidate_type: dict | None = None,
     ml_strength: dict | None = None,
+    job_profile: JobDescriptionProfile | None = None,
 ) -> dict:
     if isinstance(resume_or_contact, str):
         resume_text = resume_or_contact
@@ -227,7 +236,7 @@ def compute_resume_score(
         if project_analysis else 0.0
     )
     years_experience = float(career_timeline.get("total_years_experience", 0.0))
-    jd_match = compute_jd_similarity(resume_text, job_description)
+    jd_match = compute_jd_similarity(resume_text, job_description, job_profile)
 
     raw_skills = (
         min(skill_count, 12) * 3.0
@@ -407,12 +416,13 @@ def generate_improvement_suggestions(
     return deduped[:12]
 
 
-def _all_known_skills() -> set[str]:
+@lru_cache(maxsize=1)
+def _all_known_skills() -> frozenset[str]:
     skills: set[str] = set(SKILL_ALIASES.keys())
     skills.update(SKILL_ALIASES.values())
     for category in SKILL_TAXONOMY.values():
         skills.update(item.lower() for item in category.keys())
-    return skills
+    return frozenset(skills)
 
 
 def _normalize_text(text: str) -> str:
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+from .skill_catalog import CONCEPT_DEFINITIONS, IDEAL_PROFILE_TEXT, SKILL_TAXONOMY
+
+QUESTION_BANK_DIR = Path(__file__).resolve().parents[3] / "data" / "questions"
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+NGRAM_RANGE = (1, 2)
+
+
+@dataclass(frozen=True)
+class TfidfEncoder:
+    fingerprint: str
+    vocabulary: dict[str, int]
+    idf: np.ndarray
+
+    @property
+    def dimension(self) -> int:
+        return len(self.vocabulary)
+
+    def transform(self, texts: list[str]) -> sparse.csr_matrix:
+        indptr = [0]
+        indices: list[int] = []
+        values: list[float] = []
+        for text in texts:
+            counts = Counter(
+                self.vocabulary[term] for term in _analyze(text) if term in self.vocabulary
+            )
+            row = sorted(counts.items())
+            weights = np.array([count * self.idf[index] for index, count in row], dtype=float)
+            norm = float(np.linalg.norm(weights)) if row else 0.0
+            indices.extend(index for index, _ in row)
+            values.extend((weights / norm).tolist() if norm else weights.tolist())
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (np.asarray(values, dtype=float), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(texts), self.dimension),
+        )
+
+
+def build_fallback_corpus() -> list[str]:
+    corpus = [definition for category in SKILL_TAXONOMY.values() for definition in category.values()]
+    corpus.extend(IDEAL_PROFILE_TEXT.values())
+    corpus.extend(CONCEPT_DEFINITIONS.values())
+    for path in sorted(QUESTION_BANK_DIR.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        questions = data.get("questions", []) if isinstance(data, dict) else data
+        for item in questions:
+            if not isinstance(item, dict):
+                continue
+            keywords = " ".join(str(keyword) for keyword in item.get("keywords", []))
+            corpus.append(f"{item.get('question', '')} {keywords}".strip())
+    return [text for text in corpus if text]
+
+
+def load_or_fit_tfidf_encoder(cache_dir: Path) -> TfidfEncoder:
+    corpus = build_fallback_corpus()
+    fingerprint = hashlib.sha256(json.dumps([NGRAM_RANGE, corpus]).encode("utf-8")).hexdigest()[:16]
+    path = cache_dir / f"tfidf-fallback-{fingerprint}.json"
+    if path.exists():
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return TfidfEncoder(
+                fingerprint,
+                {term: index for index, term in enumerate(payload["terms"])},
+                np.asarray(payload["idf"], dtype=float),
+            )
+        except (OSError, ValueError, KeyError):
+            pass
+
+    encoder = fit_tfidf_encoder(corpus, fingerprint)
+    terms = sorted(encoder.vocabulary, key=encoder.vocabulary.get)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps({"terms": terms, "idf": encoder.idf.tolist()}), encoding="utf-8")
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+    return encoder
+
+
+def fit_tfidf_encoder(corpus: list[str], fingerprint: str) -> TfidfEncoder:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(ngram_range=NGRAM_RANGE, min_df=1)
+    vectorizer.fit(corpus)
+    vocabulary = {term: int(index) for term, index in vectorizer.vocabulary_.items()}
+    return TfidfEncoder(fingerprint, vocabulary, np.asarray(vectorizer.idf_, dtype=float))
+
+
+def _analyze(text: str) -> list[str]:
+    tokens = TOKEN_PATTERN.findall(str(text or "").lower())
+    terms = list(tokens)
+    for size in range(max(2, NGRAM_RANGE[0]), NGRAM_RANGE[1] + 1):
+        terms.extend(" ".join(tokens[index:index + size]) for index in range(len(tokens) - size + 1))
+    return terms
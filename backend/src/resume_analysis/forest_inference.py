@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+PARITY_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class FlatForest:
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    max_depth: int
+
+    @property
+    def n_estimators(self) -> int:
+        return len(self.roots)
+
+    def predict(self, rows) -> np.ndarray:
+        features = np.atleast_2d(np.asarray(rows, dtype=np.float32)).astype(np.float64)
+        nodes = np.repeat(self.roots[:, None], len(features), axis=1)
+        row_index = np.arange(len(features))[None, :]
+        for _ in range(self.max_depth):
+            go_left = features[row_index, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value[nodes].sum(axis=0) / self.n_estimators
+
+
+def export_forest(model) -> FlatForest:
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        node_ids = np.arange(tree.node_count, dtype=np.int32)
+        is_leaf = tree.children_left < 0
+        features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+        thresholds.append(np.where(is_leaf, 0.0, tree.threshold).astype(np.float64))
+        lefts.append(np.where(is_leaf, node_ids, tree.children_left).astype(np.int32) + offset)
+        rights.append(np.where(is_leaf, node_ids, tree.children_right).astype(np.int32) + offset)
+        values.append(np.asarray(tree.value[:, 0, 0], dtype=np.float64))
+        roots.append(offset)
+        offset += tree.node_count
+        max_depth = max(max_depth, int(tree.max_depth))
+    return FlatForest(
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        left=np.concatenate(lefts),
+        right=np.concatenate(rights),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.int32),
+        max_depth=max_depth,
+    )
+
+
+def forest_matches(model, forest: FlatForest, rows) -> bool:
+    expected = np.asarray(model.predict(np.asarray(rows, dtype=float)), dtype=np.float64)
+    return bool(np.all(np.abs(forest.predict(rows) - expected) <= PARITY_TOLERANCE))
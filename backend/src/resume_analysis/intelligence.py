@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import math
 import re
-from functools import lru_cache
 
+from .forest_inference import export_forest, forest_matches
+from .model_artifacts import artifact_spec, load_artifact
+from .model_registry import registered_model
 from .semantic_utils import rank_similarity
-from .skill_catalog import IDEAL_PROFILE_TEXT, JOB_TITLE_HINTS, SKILL_TAXONOMY
+from .skill_catalog import CONCEPT_DEFINITIONS, IDEAL_PROFILE_TEXT, JOB_TITLE_HINTS, SKILL_TAXONOMY
 
 COMPLEXITY_COMPONENTS: dict[str, list[str]] = {
     "REST APIs": ["rest api", "restful", "endpoint", "api gateway"],
@@ -181,15 +183,7 @@ def build_knowledge_graph(candidate_name: str, skills: list[str], projects: list
 
 
 def infer_related_concepts(sentences: list[str], detected_skills: list[str]) -> list[dict]:
-    concept_definitions = {
-        "Backend Engineering": "designing backend services, APIs, database backed systems, and server side architecture",
-        "System Design": "designing scalable architectures, distributed systems, and reliable technical platforms",
-        "Microservices": "building independently deployable services, APIs, and service based platforms",
-        "Deployment / DevOps": "deploying applications, containerizing services, and managing cloud environments",
-        "Data Science": "analyzing data, building predictive models, and training machine learning systems",
-    }
-
-    ranked = rank_similarity(" ".join(sentences[:20]), concept_definitions)
+    ranked = rank_similarity(" ".join(sentences[:20]), CONCEPT_DEFINITIONS, name="concept_definitions")
     existing = {skill.lower() for skill in detected_skills}
     concepts = []
     for item in ranked:
@@ -311,7 +305,7 @@ def estimate_ml_resume_strength(
 
 
 def compare_resume_to_profiles(text: str) -> list[dict]:
-    results = rank_similarity(text, IDEAL_PROFILE_TEXT)
+    results = rank_similarity(text, IDEAL_PROFILE_TEXT, name="ideal_profiles")
     normalized = []
     if not results:
         return normalized
@@ -447,10 +441,7 @@ def predict_candidate_type(text: str, sections: dict[str, str], timeline: dict)
     }
 
 
-@lru_cache(maxsize=1)
-def _get_strength_regressor():
-    from sklearn.ensemble import RandomForestRegressor
-
+def _strength_training_data() -> tuple[list[list[float]], list[float]]:
     training_rows = []
     training_targets = []
     for skill_count in (3, 6, 10, 14):
@@ -485,11 +476,30 @@ def _get_strength_regressor():
                 ])
                 training_targets.append(target)
 
+    return training_rows, training_targets
+
+
+def _train_strength_regressor(training_data: tuple[list[list[float]], list[float]]):
+    from sklearn.ensemble import RandomForestRegressor
+
+    training_rows, training_targets = training_data
     model = RandomForestRegressor(n_estimators=120, random_state=42)
     model.fit(training_rows, training_targets)
     return model
 
 
+STRENGTH_REGRESSOR = artifact_spec("strength_regressor", _strength_training_data, _train_strength_regressor)
+
+
+@registered_model("strength_regressor")
+def _get_strength_regressor():
+    model = load_artifact(STRENGTH_REGRESSOR)
+    forest = export_forest(model)
+    training_rows, _ = _strength_training_data()
+    probe_rows = [[value * scale for value in row] for row in training_rows for scale in (0.5, 1.0, 1.5)]
+    return forest if forest_matches(model, forest, probe_rows) else model
+
+
 def _extract_date_range(text: str) -> tuple[int | None, int | None] | None:
     match = re.search(r"(20\d{2}|19\d{2})\s*(?:-|to|–)\s*(present|current|20\d{2}|19\d{2})", text.lower())
     if not match:
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from .skill_matcher import PhraseMatcher, get_phrase_matcher
+
+MAX_PROFILES_IN_MEMORY = 256
+
+
+@dataclass
+class JobDescriptionProfile:
+    jd_id: str
+    text: str
+    keywords: list[str]
+    skills: list[str]
+    model_id: str
+    embedding: np.ndarray
+    pipeline_version: str
+
+    @cached_property
+    def matcher(self) -> PhraseMatcher:
+        return get_phrase_matcher(tuple(keyword.lower() for keyword in self.keywords))
+
+    def summary(self) -> dict:
+        return {
+            "jd_id": self.jd_id,
+            "keywords": self.keywords,
+            "skills": self.skills,
+            "model_id": self.model_id,
+            "pipeline_version": self.pipeline_version,
+        }
+
+
+_profiles: OrderedDict[str, JobDescriptionProfile] = OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+def job_description_id(text: str) -> str:
+    return hashlib.sha256(str(text or "").strip().encode("utf-8")).hexdigest()[:16]
+
+
+def lookup_profile(text: str | None) -> JobDescriptionProfile | None:
+    if not text or not str(text).strip():
+        return None
+    return lookup_profile_by_id(job_description_id(text))
+
+
+def lookup_profile_by_id(jd_id: str) -> JobDescriptionProfile | None:
+    with _profiles_lock:
+        profile = _profiles.get(jd_id)
+        if profile is not None:
+            _profiles.move_to_end(jd_id)
+        return profile
+
+
+def remember_profile(profile: JobDescriptionProfile) -> JobDescriptionProfile:
+    with _profiles_lock:
+        _profiles[profile.jd_id] = profile
+        _profiles.move_to_end(profile.jd_id)
+        while len(_profiles) > MAX_PROFILES_IN_MEMORY:
+            _profiles.popitem(last=False)
+    return profile
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import numpy as np
+
+from .model_artifacts import artifact_spec, load_artifact
+from .model_registry import registered_model
 
 
 SECTION_TRAINING_DATA: list[tuple[str, str]] = [
@@ -42,22 +45,35 @@ CANDIDATE_TYPE_TRAINING_DATA: list[tuple[str, str]] = [
 
 
 def predict_section_labels(blocks: list[str]) -> list[dict]:
+    return predict_section_labels_batch([blocks])[0]
+
+
+def predict_section_labels_batch(documents: list[list[str]]) -> list[list[dict]]:
     classifier = get_section_classifier()
-    labels = classifier.predict(blocks) if blocks else []
-    probabilities = classifier.predict_proba(blocks) if blocks else []
+    flat = [block for blocks in documents for block in blocks]
+    probabilities = _predict_probabilities(classifier, flat)
+    best = probabilities.argmax(axis=1) if len(flat) else np.zeros(0, dtype=int)
     results = []
-    for index, block in enumerate(blocks):
-        label = str(labels[index])
-        confidence = float(max(probabilities[index])) if len(probabilities) > index else 0.0
-        results.append({"text": block, "label": label, "confidence": round(confidence, 4)})
+    offset = 0
+    for blocks in documents:
+        results.append(
+            [
+                {
+                    "text": block,
+                    "label": str(classifier.classes_[best[offset + index]]),
+                    "confidence": round(float(probabilities[offset + index, best[offset + index]]), 4),
+                }
+                for index, block in enumerate(blocks)
+            ]
+        )
+        offset += len(blocks)
     return results
 
 
 def classify_resume_profile(text: str) -> dict:
     classifier = get_profile_classifier()
     labels = [str(item) for item in classifier.classes_]
-    probabilities = classifier.predict_proba([text])[0]
-    predicted = str(classifier.predict([text])[0])
+    probabilities = _predict_probabilities(classifier, [text])[0]
     ranked = sorted(
         [{"profile": labels[idx], "score": round(float(score) * 100, 2)} for idx, score in enumerate(probabilities)],
         key=lambda item: item["score"],
@@ -69,7 +85,7 @@ def classify_resume_profile(text: str) -> dict:
         reverse=True,
     )
     return {
-        "predicted_profile": predicted,
+        "predicted_profile": labels[int(probabilities.argmax())],
         "confidence": ranked[0]["score"] if ranked else 0.0,
         "scores": ranked,
         "probabilities": probability_ranked,
@@ -79,22 +95,26 @@ def classify_resume_profile(text: str) -> dict:
 def classify_candidate_type(text: str) -> dict:
     classifier = get_candidate_type_classifier()
     labels = [str(item) for item in classifier.classes_]
-    probabilities = classifier.predict_proba([text])[0]
-    predicted = str(classifier.predict([text])[0])
+    probabilities = _predict_probabilities(classifier, [text])[0]
     ranked = sorted(
         [{"category": labels[idx], "probability": round(float(score), 4)} for idx, score in enumerate(probabilities)],
         key=lambda item: item["probability"],
         reverse=True,
     )
     return {
-        "predicted_category": predicted,
+        "predicted_category": labels[int(probabilities.argmax())],
         "confidence": ranked[0]["probability"] if ranked else 0.0,
         "scores": ranked,
     }
 
 
-@lru_cache(maxsize=1)
-def get_section_classifier():
+def _predict_probabilities(classifier, texts: list[str]) -> np.ndarray:
+    if not texts:
+        return np.zeros((0, len(classifier.classes_)), dtype=float)
+    return np.asarray(classifier.predict_proba(texts), dtype=float)
+
+
+def _train_text_classifier(training_data: list[tuple[str, str]]):
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.linear_model import LogisticRegression
     from sklearn.pipeline import Pipeline
@@ -105,43 +125,29 @@ def get_section_classifier():
             ("clf", LogisticRegression(max_iter=1000, random_state=42)),
         ]
     )
-    x_train = [item[0] for item in SECTION_TRAINING_DATA]
-    y_train = [item[1] for item in SECTION_TRAINING_DATA]
+    x_train = [item[0] for item in training_data]
+    y_train = [item[1] for item in training_data]
     model.fit(x_train, y_train)
     return model
 
 
-@lru_cache(maxsize=1)
-def get_profile_classifier():
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.linear_model import LogisticRegression
-    from sklearn.pipeline import Pipeline
+SECTION_CLASSIFIER = artifact_spec("section_classifier", lambda: SECTION_TRAINING_DATA, _train_text_classifier)
+PROFILE_CLASSIFIER = artifact_spec("profile_classifier", lambda: PROFILE_TRAINING_DATA, _train_text_classifier)
+CANDIDATE_TYPE_CLASSIFIER = artifact_spec(
+    "candidate_type_classifier", lambda: CANDIDATE_TYPE_TRAINING_DATA, _train_text_classifier
+)
 
-    model = Pipeline(
-        [
-            ("tfidf", TfidfVectorizer(ngram_range=(1, 2), min_df=1)),
-            ("clf", LogisticRegression(max_iter=1000, random_state=42)),
-        ]
-    )
-    x_train = [item[0] for item in PROFILE_TRAINING_DATA]
-    y_train = [item[1] for item in PROFILE_TRAINING_DATA]
-    model.fit(x_train, y_train)
-    return model
 
+@registered_model("section_classifier")
+def get_section_classifier():
+    return load_artifact(SECTION_CLASSIFIER)
 
-@lru_cache(maxsize=1)
-def get_candidate_type_classifier():
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.linear_model import LogisticRegression
-    from sklearn.pipeline import Pipeline
 
-    model = Pipeline(
-        [
-            ("tfidf", TfidfVectorizer(ngram_range=(1, 2), min_df=1)),
-            ("clf", LogisticRegression(max_iter=1000, random_state=42)),
-        ]
-    )
-    x_train = [item[0] for item in CANDIDATE_TYPE_TRAINING_DATA]
-    y_train = [item[1] for item in CANDIDATE_TYPE_TRAINING_DATA]
-    model.fit(x_train, y_train)
-    return model
+@registered_model("profile_classifier")
+def get_profile_classifier():
+    return load_artifact(PROFILE_CLASSIFIER)
+
+
+@registered_model("candidate_type_classifier")
+def get_candidate_type_classifier():
+    return load_artifact(CANDIDATE_TYPE_CLASSIFIER)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+ARTIFACT_FORMAT_VERSION = 1
+DEFAULT_ARTIFACT_DIR = Path(__file__).resolve().parents[2] / "model_artifacts"
+
+
+@dataclass(frozen=True)
+class ArtifactSpec:
+    name: str
+    training_data: Callable[[], Any]
+    train: Callable[[Any], Any]
+
+
+ARTIFACTS: dict[str, ArtifactSpec] = {}
+
+
+def artifact_spec(name: str, training_data: Callable[[], Any], train: Callable[[Any], Any]) -> ArtifactSpec:
+    spec = ArtifactSpec(name, training_data, train)
+    ARTIFACTS[name] = spec
+    return spec
+
+
+def artifact_dir() -> Path:
+    configured = os.getenv("MODEL_ARTIFACT_DIR", "").strip()
+    return Path(configured) if configured else DEFAULT_ARTIFACT_DIR
+
+
+def training_hash(spec: ArtifactSpec, data: Any) -> str:
+    import sklearn
+
+    try:
+        trainer = inspect.getsource(spec.train)
+    except (OSError, TypeError):
+        trainer = spec.train.__qualname__
+    material = json.dumps(
+        {
+            "format": ARTIFACT_FORMAT_VERSION,
+            "name": spec.name,
+            "sklearn": sklearn.__version__,
+            "trainer": trainer,
+            "data": data,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def load_artifact(spec: ArtifactSpec, directory: Path | None = None) -> Any:
+    directory = directory or artifact_dir()
+    data = spec.training_data()
+    digest = training_hash(spec, data)
+    model = _read_artifact(directory, spec.name, digest)
+    if model is not None:
+        return model
+
+    model = spec.train(data)
+    try:
+        _write_artifact(directory, spec.name, digest, model)
+    except OSError:
+        pass
+    return model
+
+
+def build_artifact(spec: ArtifactSpec, directory: Path, *, force: bool = False, prune: bool = True) -> dict:
+    data = spec.training_data()
+    digest = training_hash(spec, data)
+    _, manifest_path = _artifact_paths(directory, spec.name, digest)
+    if force or _read_artifact(directory, spec.name, digest) is None:
+        _write_artifact(directory, spec.name, digest, spec.train(data))
+    if prune:
+        for path in directory.glob(f"{spec.name}-*"):
+            if not path.name.startswith(f"{spec.name}-{digest[:16]}."):
+                path.unlink(missing_ok=True)
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def _artifact_paths(directory: Path, name: str, digest: str) -> tuple[Path, Path]:
+    stem = f"{name}-{digest[:16]}"
+    return directory / f"{stem}.joblib", directory / f"{stem}.json"
+
+
+def _read_artifact(directory: Path, name: str, digest: str) -> Any:
+    import joblib
+
+    path, manifest_path = _artifact_paths(directory, name, digest)
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("training_hash") != digest or manifest.get("sha256") != _file_sha256(path):
+            return None
+        return joblib.load(path, mmap_mode="r")
+    except Exception:
+        return None
+
+
+def _write_artifact(directory: Path, name: str, digest: str, model: Any) -> None:
+    import joblib
+    import sklearn
+
+    path, manifest_path = _artifact_paths(directory, name, digest)
+    directory.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    joblib.dump(model, temp_path)
+    os.replace(temp_path, path)
+    manifest = {
+        "name": name,
+        "version": ARTIFACT_FORMAT_VERSION,
+        "training_hash": digest,
+        "sklearn_version": sklearn.__version__,
+        "file": path.name,
+        "bytes": path.stat().st_size,
+        "sha256": _file_sha256(path),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    temp_manifest = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    temp_manifest.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(temp_manifest, manifest_path)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+MODEL_MODULES = (
+    "backend.src.resume_analysis.nlp_pipeline",
+    "backend.src.resume_analysis.semantic_utils",
+    "backend.src.resume_analysis.ml_models",
+    "backend.src.resume_analysis.intelligence",
+)
+
+WARM_UP_TEXT = (
+    "Jane Doe\njane@example.com\nSUMMARY\nBackend engineer building Python and FastAPI services.\n"
+    "SKILLS\nPython, SQL, Docker, AWS, React\nEXPERIENCE\nSoftware Engineer 2021 - 2024\n"
+    "Developed REST APIs and improved latency by 30%.\nPROJECTS\nResume Analyzer - NLP pipeline with spaCy.\n"
+    "EDUCATION\nB.Tech Computer Science 2017 - 2021\n"
+)
+WARM_UP_FIELDS = ("overview", "analysis", "final_report", "legacy_resume_similarity_analysis")
+WARM_UP_MODES = ("background", "blocking", "off")
+WARM_UP_RETRY_SECONDS = 30.0
+
+
+@dataclass
+class _ModelSlot:
+    name: str
+    loader: Callable[[], Any]
+    defer_when: Callable[[], bool] | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    state: str = "not_loaded"
+    value: Any = None
+    load_ms: float | None = None
+    error: str | None = None
+
+
+_MODELS: dict[str, _ModelSlot] = {}
+_WARM_UP_LOCK = threading.Lock()
+_warm_up_state: dict[str, Any] = {"state": "not_started", "duration_ms": None, "error": None}
+_warm_up_retry_lock = threading.Lock()
+_warm_up_retry_at = 0.0
+
+
+def registered_model(
+    name: str, *, defer_when: Callable[[], bool] | None = None
+) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    def decorator(loader: Callable[[], T]) -> Callable[[], T]:
+        slot = _MODELS.setdefault(name, _ModelSlot(name, loader, defer_when))
+
+        @functools.wraps(loader)
+        def get_model() -> T:
+            if slot.state == "ready":
+                return slot.value
+            return _load_slot(slot)
+
+        return get_model
+
+    return decorator
+
+
+def load_all_models() -> None:
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+    for slot in list(_MODELS.values()):
+        if slot.defer_when is not None and slot.state == "not_loaded" and slot.defer_when():
+            slot.state = "deferred"
+            continue
+        try:
+            _load_slot(slot)
+        except Exception:
+            continue
+
+
+def warm_up_mode() -> str:
+    configured = os.getenv("MODEL_WARMUP", "background").strip().lower()
+    return configured if configured in WARM_UP_MODES else "background"
+
+
+def start_warm_up() -> None:
+    mode = warm_up_mode()
+    if mode == "blocking":
+        warm_up_models()
+    elif mode == "background":
+        threading.Thread(target=warm_up_models, name="model-warm-up", daemon=True).start()
+
+
+def warm_up_models() -> None:
+    global _warm_up_retry_at
+    from .report import build_advanced_resume_report
+
+    with _WARM_UP_LOCK:
+        if _warm_up_state["state"] == "ready":
+            return
+        _warm_up_state.update(state="running", error=None)
+        started = time.perf_counter()
+        try:
+            load_all_models()
+            failed = sorted(slot.name for slot in _MODELS.values() if slot.state == "failed")
+            if failed:
+                raise RuntimeError(f"Models failed to load: {', '.join(failed)}")
+            build_advanced_resume_report(WARM_UP_TEXT, fields=WARM_UP_FIELDS)
+        except Exception as exc:
+            with _warm_up_retry_lock:
+                _warm_up_retry_at = time.monotonic() + WARM_UP_RETRY_SECONDS
+            _warm_up_state.update(state="failed", error=str(exc))
+        else:
+            _warm_up_state["state"] = "ready"
+        _warm_up_state["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+
+def model_registry_status() -> dict:
+    mode = warm_up_mode()
+    if mode != "off":
+        _retry_failed_warm_up()
+    models = {
+        name: {
+            "state": slot.state,
+            "available": slot.value is not None,
+            "load_ms": slot.load_ms,
+            "error": slot.error,
+        }
+        for name, slot in sorted(_MODELS.items())
+    }
+    warm_up = {**_warm_up_state, "mode": mode}
+    slots_ready = all(slot.state in {"ready", "deferred"} for slot in _MODELS.values())
+    return {
+        "ready": slots_ready if mode == "off" else warm_up["state"] == "ready" and slots_ready,
+        "warm_up": warm_up,
+        "models": models,
+    }
+
+
+def _retry_failed_warm_up() -> None:
+    global _warm_up_retry_at
+    with _warm_up_retry_lock:
+        if _warm_up_state["state"] != "failed" or time.monotonic() < _warm_up_retry_at:
+            return
+        _warm_up_retry_at = time.monotonic() + WARM_UP_RETRY_SECONDS
+    threading.Thread(target=warm_up_models, name="model-warm-up-retry", daemon=True).start()
+
+
+def _load_slot(slot: _ModelSlot) -> Any:
+    with slot.lock:
+        if slot.state == "ready":
+            return slot.value
+        slot.state = "loading"
+        started = time.perf_counter()
+        try:
+            value = slot.loader()
+        except Exception as exc:
+            slot.state = "failed"
+            slot.error = str(exc)
+            slot.load_ms = round((time.perf_counter() - started) * 1000, 2)
+            raise
+        slot.value = value
+        slot.error = None
+        slot.load_ms = round((time.perf_counter() - started) * 1000, 2)
+        slot.state = "ready"
+        return value
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 import re
 
+from .model_registry import registered_model
 from .text_processing import clean_resume_text, fallback_sentence_split, fallback_tokenize
 
 
@@ -68,6 +69,7 @@ def build_nlp_artifacts(text: str) -> NLPArtifacts:
     )
 
 
+@registered_model("spacy_pipeline")
 def _load_spacy_pipeline():
     try:
         import spacy
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 
-from .ml_models import predict_section_labels
+from .ml_models import predict_section_labels_batch
 from .text_processing import clean_resume_text
 
 HEADER_HINTS = {
@@ -25,18 +25,22 @@ HEADER_HINTS = {
 
 
 def parse_resume(text: str) -> dict:
-    clean = clean_resume_text(text)
-    contact = extract_contact_info(clean)
-    blocks = split_resume_blocks(clean)
-    predicted = predict_section_labels(blocks)
-    sections = build_sections(blocks, predicted)
-    structured_sections = build_structured_sections(blocks, predicted)
-    return {
-        **contact,
-        "sections": sections,
-        "structured_sections": structured_sections,
-        "section_predictions": predicted,
-    }
+    return parse_resumes([text])[0]
+
+
+def parse_resumes(texts: list[str]) -> list[dict]:
+    cleaned = [clean_resume_text(text) for text in texts]
+    documents = [split_resume_blocks(clean) for clean in cleaned]
+    predictions = predict_section_labels_batch(documents)
+    return [
+        {
+            **extract_contact_info(clean),
+            "sections": build_sections(blocks, predicted),
+            "structured_sections": build_structured_sections(blocks, predicted),
+            "section_predictions": predicted,
+        }
+        for clean, blocks, predicted in zip(cleaned, documents, predictions)
+    ]
 
 
 def extract_contact_info(text: str) -> dict[str, str]:
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from typing import Iterable
+
+from .context import AnalysisContext
 from .entities import extract_entities
 from .evaluation import (
     analyze_writing_quality,
@@ -21,7 +24,8 @@ from .intelligence import (
     predict_candidate_type,
     score_resume_roles,
 )
-from .nlp_pipeline import build_nlp_artifacts
+from .job_profiles import lookup_profile
+from .nlp_pipeline import NLPArtifacts, build_nlp_artifacts
 from .parser import parse_resume
 from .skill_intelligence import (
     analyze_skill_strength,
@@ -31,49 +35,41 @@ from .skill_intelligence import (
     profile_similarity_analysis,
     suggest_interview_topics,
 )
-from .suggestions import generate_resume_analysis_suggestions
+from .stage_graph import Stage, run_stage_graph
+from .suggestions import capture_suggestions, generate_resume_analysis_suggestions
 from .summarization import generate_resume_summary
 
 
-def build_advanced_resume_report(text: str, job_description: str | None = None) -> dict:
-    artifacts = build_nlp_artifacts(text)
-    parsed = parse_resume(artifacts.cleaned_text)
-    sections = parsed.get("sections", {})
+def build_advanced_resume_report(
+    text: str,
+    job_description: str | None = None,
+    *,
+    context: AnalysisContext | None = None,
+    fields: Iterable[str] | None = None,
+) -> dict:
+    context = context or AnalysisContext(text, job_description)
+    return compute_fields(REPORT_STAGES, select_fields(REPORT_FIELDS, fields), context)
 
-    entities = extract_entities(artifacts.cleaned_text, sections, artifacts.doc)
-    skill_data = extract_skills_with_semantics(artifacts.sentences, sections, artifacts.doc)
-    evidence = build_skill_evidence(skill_data["detected_skills"], sections, skill_data["contextual_usage"])
-    strength = analyze_skill_strength(skill_data["frequencies"])
 
+def _build_projects(sections: dict[str, str], skill_data: dict) -> list[dict]:
     raw_projects = extract_projects(sections.get("projects", ""), skill_data["detected_skills"])
-    projects = estimate_project_complexity(raw_projects)
-
-    contact_validation = validate_contact_info(parsed)
-    completeness = section_completeness(sections)
-    achievements = detect_achievements(artifacts.sentences)
-    writing_quality = analyze_writing_quality(artifacts.sentences)
-    density = keyword_density(artifacts.filtered_tokens, sum(skill_data["frequencies"].values()))
-    interview_topics = suggest_interview_topics(skill_data["detected_skills"])
-    summary = generate_resume_summary(artifacts.sentences)
-    related_concepts = infer_related_concepts(artifacts.sentences, skill_data["detected_skills"])
-    career_timeline = extract_career_timeline(sections, entities, artifacts.doc)
-    profile_classification = score_resume_roles(
-        sections=sections,
-        skills=skill_data["detected_skills"],
-        projects=projects,
-        summary_text=summary["summary_text"],
-        timeline=career_timeline,
-    )
-    similarity_scores = compare_resume_to_profiles(artifacts.cleaned_text)
-    legacy_similarity_scores = profile_similarity_analysis(artifacts.cleaned_text)
-    candidate_type = predict_candidate_type(artifacts.cleaned_text, sections, career_timeline)
-    adaptive_analysis = build_adaptive_analysis(candidate_type, career_timeline, achievements, projects, sections)
+    return estimate_project_complexity(raw_projects)
+
 
+def _build_ml_strength(
+    skill_data: dict,
+    projects: list[dict],
+    density: dict,
+    achievements: dict,
+    career_timeline: dict,
+    evidence: dict[str, dict],
+    completeness: dict,
+) -> dict:
     avg_project_complexity = (
         sum(project.get("complexity_score", 0.0) for project in projects) / max(len(projects), 1)
         if projects else 0.0
     )
-    ml_strength = estimate_ml_resume_strength(
+    return estimate_ml_resume_strength(
         skill_count=len(skill_data["detected_skills"]),
         project_count=len(projects),
         avg_project_complexity=avg_project_complexity,
@@ -84,139 +80,342 @@ def build_advanced_resume_report(text: str, job_description: str | None = None)
         completeness_score=completeness["score"],
     )
 
-    resume_score = compute_resume_score(
-        contact_validation,
-        completeness,
-        evidence,
-        writing_quality,
-        achievements,
-        resume_text=artifacts.cleaned_text,
-        job_description=job_description,
-        skill_count=len(skill_data["detected_skills"]),
-        project_analysis=projects,
-        career_timeline=career_timeline,
-        candidate_type=candidate_type,
-        ml_strength=ml_strength,
-    )
 
-    rule_based_suggestions = generate_improvement_suggestions(
-        contact_validation,
-        completeness,
-        evidence,
-        writing_quality,
-        achievements,
-        similarity_scores,
-        score_breakdown=resume_score["breakdown"],
-        project_analysis=projects,
-        adaptive_analysis=adaptive_analysis,
-        jd_match_score=resume_score.get("jd_match_score", 0.0),
-        jd_missing_skills=resume_score.get("jd_missing_skills", []),
+def _build_llm_suggestions(
+    artifacts: NLPArtifacts,
+    profile_classification: dict,
+    candidate_type: dict,
+    skill_data: dict,
+    projects: list[dict],
+    entities: dict,
+    weaknesses: list[dict],
+    rule_based_suggestions: list[str],
+) -> dict:
+    return capture_suggestions(
+        generate_resume_analysis_suggestions,
+        resume_text=artifacts.cleaned_text,
         predicted_role=profile_classification.get("predicted_profile", ""),
-        sections=sections,
+        experience_level=candidate_type.get("predicted_category", ""),
+        skills=skill_data["detected_skills"],
+        projects=projects,
         certifications=entities.get("certifications", []),
+        weaknesses=weaknesses,
+        fallback_suggestions=rule_based_suggestions,
     )
 
-    try:
-        suggestions = generate_resume_analysis_suggestions(
-            resume_text=artifacts.cleaned_text,
-            predicted_role=profile_classification.get("predicted_profile", ""),
-            experience_level=candidate_type.get("predicted_category", ""),
+
+REPORT_STAGES: list[Stage] = [
+    Stage("artifacts", lambda text: build_nlp_artifacts(text), ("text",)),
+    Stage("job_profile", lambda job_description: lookup_profile(job_description), ("job_description",)),
+    Stage("parsed", lambda artifacts: parse_resume(artifacts.cleaned_text), ("artifacts",)),
+    Stage("sections", lambda parsed: parsed.get("sections", {}), ("parsed",)),
+    Stage(
+        "entities",
+        lambda artifacts, sections: extract_entities(artifacts.cleaned_text, sections, artifacts.doc),
+        ("artifacts", "sections"),
+    ),
+    Stage(
+        "skill_data",
+        lambda artifacts, sections: extract_skills_with_semantics(artifacts.sentences, sections, artifacts.doc),
+        ("artifacts", "sections"),
+    ),
+    Stage(
+        "evidence",
+        lambda skill_data, sections: build_skill_evidence(skill_data["detected_skills"], sections, skill_data["contextual_usage"]),
+        ("skill_data", "sections"),
+    ),
+    Stage("strength", lambda skill_data: analyze_skill_strength(skill_data["frequencies"]), ("skill_data",)),
+    Stage("projects", _build_projects, ("sections", "skill_data")),
+    Stage("contact_validation", lambda parsed: validate_contact_info(parsed), ("parsed",)),
+    Stage("completeness", lambda sections: section_completeness(sections), ("sections",)),
+    Stage("achievements", lambda artifacts: detect_achievements(artifacts.sentences), ("artifacts",)),
+    Stage("writing_quality", lambda artifacts: analyze_writing_quality(artifacts.sentences), ("artifacts",)),
+    Stage(
+        "density",
+        lambda artifacts, skill_data: keyword_density(artifacts.filtered_tokens, sum(skill_data["frequencies"].values())),
+        ("artifacts", "skill_data"),
+    ),
+    Stage("interview_topics", lambda skill_data: suggest_interview_topics(skill_data["detected_skills"]), ("skill_data",)),
+    Stage("summary", lambda artifacts: generate_resume_summary(artifacts.sentences), ("artifacts",)),
+    Stage(
+        "related_concepts",
+        lambda artifacts, skill_data: infer_related_concepts(artifacts.sentences, skill_data["detected_skills"]),
+        ("artifacts", "skill_data"),
+    ),
+    Stage(
+        "career_timeline",
+        lambda sections, entities, artifacts: extract_career_timeline(sections, entities, artifacts.doc),
+        ("sections", "entities", "artifacts"),
+    ),
+    Stage(
+        "profile_classification",
+        lambda sections, skill_data, projects, summary, career_timeline: score_resume_roles(
+            sections=sections,
             skills=skill_data["detected_skills"],
             projects=projects,
+            summary_text=summary["summary_text"],
+            timeline=career_timeline,
+        ),
+        ("sections", "skill_data", "projects", "summary", "career_timeline"),
+    ),
+    Stage("similarity_scores", lambda artifacts: compare_resume_to_profiles(artifacts.cleaned_text), ("artifacts",)),
+    Stage("legacy_similarity_scores", lambda artifacts: profile_similarity_analysis(artifacts.cleaned_text), ("artifacts",)),
+    Stage(
+        "candidate_type",
+        lambda artifacts, sections, career_timeline: predict_candidate_type(artifacts.cleaned_text, sections, career_timeline),
+        ("artifacts", "sections", "career_timeline"),
+    ),
+    Stage(
+        "adaptive_analysis",
+        lambda candidate_type, career_timeline, achievements, projects, sections: build_adaptive_analysis(
+            candidate_type, career_timeline, achievements, projects, sections
+        ),
+        ("candidate_type", "career_timeline", "achievements", "projects", "sections"),
+    ),
+    Stage(
+        "ml_strength",
+        _build_ml_strength,
+        ("skill_data", "projects", "density", "achievements", "career_timeline", "evidence", "completeness"),
+    ),
+    Stage(
+        "resume_score",
+        lambda contact_validation, completeness, evidence, writing_quality, achievements, artifacts, job_description,
+        job_profile, skill_data, projects, career_timeline, candidate_type, ml_strength: compute_resume_score(
+            contact_validation,
+            completeness,
+            evidence,
+            writing_quality,
+            achievements,
+            resume_text=artifacts.cleaned_text,
+            job_description=job_description,
+            skill_count=len(skill_data["detected_skills"]),
+            project_analysis=projects,
+            career_timeline=career_timeline,
+            candidate_type=candidate_type,
+            ml_strength=ml_strength,
+            job_profile=job_profile,
+        ),
+        (
+            "contact_validation", "completeness", "evidence", "writing_quality", "achievements", "artifacts",
+            "job_description", "job_profile", "skill_data", "projects", "career_timeline", "candidate_type",
+            "ml_strength",
+        ),
+    ),
+    Stage(
+        "rule_based_suggestions",
+        lambda contact_validation, completeness, evidence, writing_quality, achievements, similarity_scores,
+        resume_score, projects, adaptive_analysis, profile_classification, sections, entities: generate_improvement_suggestions(
+            contact_validation,
+            completeness,
+            evidence,
+            writing_quality,
+            achievements,
+            similarity_scores,
+            score_breakdown=resume_score["breakdown"],
+            project_analysis=projects,
+            adaptive_analysis=adaptive_analysis,
+            jd_match_score=resume_score.get("jd_match_score", 0.0),
+            jd_missing_skills=resume_score.get("jd_missing_skills", []),
+            predicted_role=profile_classification.get("predicted_profile", ""),
+            sections=sections,
             certifications=entities.get("certifications", []),
-            weaknesses=build_weaknesses(completeness, evidence, density, projects, sections),
-            fallback_suggestions=rule_based_suggestions,
-        )
-    except Exception:
-        suggestions = rule_based_suggestions
-
-    knowledge_graph = build_knowledge_graph(parsed.get("name", ""), skill_data["detected_skills"], projects, entities)
-
-    visualization = build_visualization_payload(
-        skill_data["categorized_skills"],
-        resume_score,
-        completeness,
-        strength,
-        evidence,
-        profile_classification,
-        similarity_scores,
-        projects,
-        candidate_type,
-    )
-    overview = build_overview(resume_score, profile_classification, skill_data, projects, density, candidate_type, ml_strength)
-    strengths = build_strengths(skill_data, evidence, completeness, related_concepts)
-    weaknesses = build_weaknesses(completeness, evidence, density, projects, sections)
-    analysis = build_analysis_payload(
-        skill_data,
-        evidence,
-        projects,
-        entities,
-        profile_classification,
-        similarity_scores,
-        visualization,
-        sections,
-        related_concepts,
-        career_timeline,
-        candidate_type,
-        adaptive_analysis,
-        knowledge_graph,
-    )
+        ),
+        (
+            "contact_validation", "completeness", "evidence", "writing_quality", "achievements", "similarity_scores",
+            "resume_score", "projects", "adaptive_analysis", "profile_classification", "sections", "entities",
+        ),
+    ),
+    Stage(
+        "weaknesses",
+        lambda completeness, evidence, density, projects, sections: build_weaknesses(completeness, evidence, density, projects, sections),
+        ("completeness", "evidence", "density", "projects", "sections"),
+    ),
+    Stage(
+        "llm_suggestions",
+        _build_llm_suggestions,
+        (
+            "artifacts", "profile_classification", "candidate_type", "skill_data", "projects", "entities",
+            "weaknesses", "rule_based_suggestions",
+        ),
+    ),
+    Stage(
+        "suggestions",
+        lambda llm_suggestions, rule_based_suggestions: (
+            rule_based_suggestions if "error" in llm_suggestions else llm_suggestions["suggestions"]
+        ),
+        ("llm_suggestions", "rule_based_suggestions"),
+    ),
+    Stage(
+        "knowledge_graph",
+        lambda parsed, skill_data, projects, entities: build_knowledge_graph(
+            parsed.get("name", ""), skill_data["detected_skills"], projects, entities
+        ),
+        ("parsed", "skill_data", "projects", "entities"),
+    ),
+    Stage(
+        "visualization",
+        lambda skill_data, resume_score, completeness, strength, evidence, profile_classification, similarity_scores,
+        projects, candidate_type: build_visualization_payload(
+            skill_data["categorized_skills"],
+            resume_score,
+            completeness,
+            strength,
+            evidence,
+            profile_classification,
+            similarity_scores,
+            projects,
+            candidate_type,
+        ),
+        (
+            "skill_data", "resume_score", "completeness", "strength", "evidence", "profile_classification",
+            "similarity_scores", "projects", "candidate_type",
+        ),
+    ),
+    Stage(
+        "overview",
+        lambda resume_score, profile_classification, skill_data, projects, density, candidate_type, ml_strength: build_overview(
+            resume_score, profile_classification, skill_data, projects, density, candidate_type, ml_strength
+        ),
+        ("resume_score", "profile_classification", "skill_data", "projects", "density", "candidate_type", "ml_strength"),
+    ),
+    Stage(
+        "strengths",
+        lambda skill_data, evidence, completeness, related_concepts: build_strengths(skill_data, evidence, completeness, related_concepts),
+        ("skill_data", "evidence", "completeness", "related_concepts"),
+    ),
+    Stage(
+        "analysis",
+        lambda skill_data, evidence, projects, entities, profile_classification, similarity_scores, visualization,
+        sections, related_concepts, career_timeline, candidate_type, adaptive_analysis, knowledge_graph: build_analysis_payload(
+            skill_data,
+            evidence,
+            projects,
+            entities,
+            profile_classification,
+            similarity_scores,
+            visualization,
+            sections,
+            related_concepts,
+            career_timeline,
+            candidate_type,
+            adaptive_analysis,
+            knowledge_graph,
+        ),
+        (
+            "skill_data", "evidence", "projects", "entities", "profile_classification", "similarity_scores",
+            "visualization", "sections", "related_concepts", "career_timeline", "candidate_type",
+            "adaptive_analysis", "knowledge_graph",
+        ),
+    ),
+]
 
+
+def _preprocessing_payload(artifacts: NLPArtifacts) -> dict:
     return {
-        "overview": overview,
-        "strengths": strengths,
-        "weaknesses": weaknesses,
-        "analysis": analysis,
-        "recommendations": suggestions,
-        "preprocessing": {
-            "engine": artifacts.engine,
-            "cleaned_text": artifacts.cleaned_text,
-            "tokens": artifacts.tokens[:200],
-            "filtered_tokens": artifacts.filtered_tokens[:200],
-            "lemmas": artifacts.lemmas[:200],
-            "sentences": artifacts.sentences[:50],
-            "pos_tags": artifacts.pos_tags[:120],
-            "token_count": len(artifacts.tokens),
-        },
-        "parsed_data": parsed,
-        "entities": entities,
-        "skill_extraction": {
+        "engine": artifacts.engine,
+        "cleaned_text": artifacts.cleaned_text,
+        "tokens": artifacts.tokens[:200],
+        "filtered_tokens": artifacts.filtered_tokens[:200],
+        "lemmas": artifacts.lemmas[:200],
+        "sentences": artifacts.sentences[:50],
+        "pos_tags": artifacts.pos_tags[:120],
+        "token_count": len(artifacts.tokens),
+    }
+
+
+def _final_report_payload(
+    resume_score: dict,
+    profile_classification: dict,
+    similarity_scores: list[dict],
+    summary: dict,
+    candidate_type: dict,
+) -> dict:
+    return {
+        "resume_score": resume_score["total"],
+        "predicted_profile": profile_classification["predicted_profile"],
+        "best_profile_match": similarity_scores[0] if similarity_scores else None,
+        "summary": summary["summary_text"],
+        "candidate_type": candidate_type["predicted_category"],
+    }
+
+
+def _passthrough(name: str, stage: str | None = None) -> Stage:
+    stage = stage or name
+    return Stage(name, lambda **values: values[stage], (stage,))
+
+
+REPORT_FIELDS: list[Stage] = [
+    _passthrough("overview"),
+    _passthrough("strengths"),
+    _passthrough("weaknesses"),
+    _passthrough("analysis"),
+    _passthrough("recommendations", "suggestions"),
+    Stage("preprocessing", _preprocessing_payload, ("artifacts",)),
+    _passthrough("parsed_data", "parsed"),
+    _passthrough("entities"),
+    Stage(
+        "skill_extraction",
+        lambda skill_data, related_concepts: {
             "detected_skills": skill_data["detected_skills"],
             "categorized_skills": skill_data["categorized_skills"],
             "contextual_usage": skill_data["contextual_usage"],
             "related_concepts": related_concepts,
             "semantic_matching_enabled": True,
         },
-        "skill_verification": evidence,
-        "skill_strength_analysis": strength,
-        "project_analysis": projects,
-        "project_complexity_analysis": projects,
-        "achievement_detection": achievements,
-        "contact_validation": contact_validation,
-        "section_completeness": completeness,
-        "writing_quality": writing_quality,
-        "resume_profile_classification": profile_classification,
-        "resume_similarity_analysis": similarity_scores,
-        "legacy_resume_similarity_analysis": legacy_similarity_scores,
-        "resume_score": resume_score,
-        "keyword_density": density,
-        "interview_preparation_topics": interview_topics,
-        "resume_summary": summary,
-        "career_timeline": career_timeline,
-        "knowledge_graph": knowledge_graph,
-        "candidate_type_prediction": candidate_type,
-        "adaptive_analysis": adaptive_analysis,
-        "ml_resume_strength": ml_strength,
-        "improvement_suggestions": suggestions,
-        "visualization": visualization,
-        "final_report": {
-            "resume_score": resume_score["total"],
-            "predicted_profile": profile_classification["predicted_profile"],
-            "best_profile_match": similarity_scores[0] if similarity_scores else None,
-            "summary": summary["summary_text"],
-            "candidate_type": candidate_type["predicted_category"],
-        },
-    }
+        ("skill_data", "related_concepts"),
+    ),
+    _passthrough("skill_verification", "evidence"),
+    _passthrough("skill_strength_analysis", "strength"),
+    _passthrough("project_analysis", "projects"),
+    _passthrough("project_complexity_analysis", "projects"),
+    _passthrough("achievement_detection", "achievements"),
+    _passthrough("contact_validation"),
+    _passthrough("section_completeness", "completeness"),
+    _passthrough("writing_quality"),
+    _passthrough("resume_profile_classification", "profile_classification"),
+    _passthrough("resume_similarity_analysis", "similarity_scores"),
+    _passthrough("legacy_resume_similarity_analysis", "legacy_similarity_scores"),
+    _passthrough("resume_score"),
+    _passthrough("keyword_density", "density"),
+    _passthrough("interview_preparation_topics", "interview_topics"),
+    _passthrough("resume_summary", "summary"),
+    _passthrough("career_timeline"),
+    _passthrough("knowledge_graph"),
+    _passthrough("candidate_type_prediction", "candidate_type"),
+    _passthrough("adaptive_analysis"),
+    _passthrough("ml_resume_strength", "ml_strength"),
+    _passthrough("improvement_suggestions", "suggestions"),
+    _passthrough("visualization"),
+    Stage(
+        "final_report",
+        _final_report_payload,
+        ("resume_score", "profile_classification", "similarity_scores", "summary", "candidate_type"),
+    ),
+]
+
+
+def select_fields(available: list[Stage], fields: Iterable[str] | None = None) -> list[Stage]:
+    if fields is None:
+        return list(available)
+    requested = set(fields)
+    unknown = requested - {field.name for field in available}
+    if unknown:
+        raise ValueError(f"Unknown report fields: {', '.join(sorted(unknown))}")
+    return [field for field in available if field.name in requested]
+
+
+def compute_fields(
+    stages: list[Stage],
+    fields: list[Stage],
+    context: AnalysisContext,
+    *,
+    namespace: str = "report",
+) -> dict:
+    initial = {**context.results, "text": context.text, "job_description": context.job_description}
+    targets = {name for field in fields for name in field.requires}
+    results = run_stage_graph(stages, initial, targets=targets, namespace=namespace)
+    context.seed(results)
+    return {field.name: field.func(**{name: results[name] for name in field.requires}) for field in fields}
 
 
 def build_overview(
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+PIPELINE_VERSION = "2026.10.5"
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "analysis_cache.db"
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_MAX_ENTRIES = 20000
+_PRUNE_EVERY_WRITES = 200
+
+_memory: OrderedDict[str, bytes] = OrderedDict()
+_memory_bytes = 0
+_memory_lock = threading.Lock()
+_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+_disk_ready: set[str] = set()
+
+
+def analysis_cache_key(text: str, job_description: str | None = None, *, namespace: str = "analysis") -> str:
+    material = json.dumps([namespace, PIPELINE_VERSION, str(text or ""), str(job_description or "")])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def get_cached_result(key: str) -> dict | None:
+    if not _cache_enabled():
+        return None
+
+    with _memory_lock:
+        payload = _memory.get(key)
+        if payload is not None:
+            _memory.move_to_end(key)
+            _stats["memory_hits"] += 1
+    if payload is not None:
+        return _decode(payload)
+
+    payload = _disk_get(key)
+    if payload is None:
+        with _memory_lock:
+            _stats["misses"] += 1
+        return None
+
+    _memory_put(key, payload)
+    with _memory_lock:
+        _stats["disk_hits"] += 1
+    return _decode(payload)
+
+
+def store_cached_result(key: str, result: dict) -> None:
+    if not _cache_enabled():
+        return
+    try:
+        payload = zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8"), 3)
+    except (TypeError, ValueError):
+        return
+    _memory_put(key, payload)
+    with _memory_lock:
+        _stats["writes"] += 1
+        prune = _stats["writes"] % _PRUNE_EVERY_WRITES == 0
+    _disk_put(key, payload, prune=prune)
+
+
+def result_cache_stats() -> dict:
+    with _memory_lock:
+        stats = dict(_stats)
+        stats["memory_entries"] = len(_memory)
+        stats["memory_bytes"] = _memory_bytes
+    stats["memory_limit_bytes"] = _memory_limit_bytes()
+    stats["pipeline_version"] = PIPELINE_VERSION
+    stats["enabled"] = _cache_enabled()
+    return stats
+
+
+def clear_result_cache(*, include_disk: bool = False) -> None:
+    global _memory_bytes
+    with _memory_lock:
+        _memory.clear()
+        _memory_bytes = 0
+    if include_disk:
+        try:
+            with _connect() as conn:
+                conn.execute("DELETE FROM analysis_cache")
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("ANALYSIS_CACHE_ENABLED", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _memory_limit_bytes() -> int:
+    configured = os.getenv("ANALYSIS_CACHE_MEMORY_BYTES", "").strip()
+    return int(configured) if configured.isdigit() else DEFAULT_MEMORY_BYTES
+
+
+def _memory_put(key: str, payload: bytes) -> None:
+    global _memory_bytes
+    limit = _memory_limit_bytes()
+    if len(payload) > limit:
+        return
+    with _memory_lock:
+        previous = _memory.pop(key, None)
+        if previous is not None:
+            _memory_bytes -= len(previous)
+        _memory[key] = payload
+        _memory_bytes += len(payload)
+        while _memory_bytes > limit and _memory:
+            _, evicted = _memory.popitem(last=False)
+            _memory_bytes -= len(evicted)
+
+
+def _decode(payload: bytes) -> dict:
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+def _db_path() -> Path:
+    configured = os.getenv("ANALYSIS_CACHE_DB", "").strip()
+    return Path(configured) if configured else DEFAULT_DB_PATH
+
+
+def _connect() -> sqlite3.Connection:
+    path = _db_path()
+    conn = sqlite3.connect(path, timeout=5)
+    if str(path) not in _disk_ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed ON analysis_cache (accessed_at)")
+        conn.commit()
+        _disk_ready.add(str(path))
+    return conn
+
+
+def _disk_get(key: str) -> bytes | None:
+    try:
+        with _connect() as conn:
+            row = conn.execute("SELECT payload FROM analysis_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE analysis_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            return bytes(row[0])
+    except sqlite3.Error:
+        return None
+
+
+def _disk_put(key: str, payload: bytes, *, prune: bool = False) -> None:
+    now = time.time()
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, payload, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now, now),
+            )
+            if prune:
+                _disk_prune(conn)
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def _disk_prune(conn: sqlite3.Connection) -> None:
+    configured = os.getenv("ANALYSIS_CACHE_DISK_MAX_ENTRIES", "").strip()
+    max_entries = int(configured) if configured.isdigit() else DEFAULT_DISK_MAX_ENTRIES
+    conn.execute(
+        """
+        DELETE FROM analysis_cache
+        WHERE key NOT IN (SELECT key FROM analysis_cache ORDER BY accessed_at DESC LIMIT ?)
+        """,
+        (max_entries,),
+    )
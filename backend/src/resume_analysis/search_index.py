@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from .document_store import connect
+from .evaluation import extract_skills
+from .nlp_pipeline import NLPArtifacts, build_nlp_artifacts
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+SKILL_TERM_PREFIX = "skill:"
+FILTER_COLUMNS = ("experience_level", "predicted_role")
+DEFAULT_CACHE_POSTINGS = 20_000_000
+
+_ready: set[str] = set()
+_caches: dict[str, "_SearchCache"] = {}
+_caches_lock = threading.Lock()
+
+
+@dataclass
+class SearchDocument:
+    resume_id: str
+    terms: list[str]
+    experience_level: str = ""
+    predicted_role: str = ""
+
+
+def document_terms(artifacts: NLPArtifacts, skills: list[str]) -> list[str]:
+    return [*artifacts.lemmas, *(f"{SKILL_TERM_PREFIX}{skill}" for skill in skills)]
+
+
+def query_terms(query: str) -> list[str]:
+    text = str(query or "").strip()
+    if not text:
+        return []
+    return list(dict.fromkeys(document_terms(build_nlp_artifacts(text), extract_skills(text))))
+
+
+def index_documents(documents: list[SearchDocument]) -> None:
+    with connect() as conn:
+        _ensure_schema(conn)
+        now = time.time()
+        for document in documents:
+            counts = Counter(document.terms)
+            row = conn.execute(
+                "SELECT doc_id FROM search_documents WHERE resume_id = ?",
+                (document.resume_id,),
+            ).fetchone()
+            if row is not None:
+                _remove_document(conn, row[0])
+            doc_id = conn.execute(
+                """
+                INSERT INTO search_documents (resume_id, length, experience_level, predicted_role, indexed_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (document.resume_id, len(document.terms), document.experience_level, document.predicted_role, now),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO search_terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                [(term,) for term in counts],
+            )
+            conn.executemany(
+                "INSERT INTO search_postings (term_id, doc_id, tf) SELECT term_id, ?, ? FROM search_terms WHERE term = ?",
+                [(doc_id, tf, term) for term, tf in counts.items()],
+            )
+            conn.execute(
+                "UPDATE search_stats SET doc_count = doc_count + 1, total_length = total_length + ? WHERE id = 0",
+                (len(document.terms),),
+            )
+        conn.commit()
+
+
+def remove_documents(resume_ids: list[str]) -> None:
+    with connect() as conn:
+        _ensure_schema(conn)
+        for resume_id in resume_ids:
+            row = conn.execute("SELECT doc_id FROM search_documents WHERE resume_id = ?", (resume_id,)).fetchone()
+            if row is not None:
+                _remove_document(conn, row[0])
+        conn.commit()
+
+
+def search_documents(
+    terms: list[str],
+    *,
+    filters: dict[str, str | None] | None = None,
+    limit: int = 10,
+    offset: int = 0,
+) -> dict:
+    terms = list(dict.fromkeys(terms))
+    with connect() as conn:
+        _ensure_schema(conn)
+        cache = _search_cache(conn)
+        with cache.lock:
+            cache.refresh(conn)
+            if not terms or not cache.doc_count:
+                return {"total": 0, "results": []}
+            known = conn.execute(
+                f"SELECT term_id, df FROM search_terms WHERE term IN ({_placeholders(len(terms))}) AND df > 0",
+                terms,
+            ).fetchall()
+            scores = np.zeros(cache.size)
+            norms = BM25_K1 * (1 - BM25_B + BM25_B * cache.lengths[: cache.size] / (cache.total_length / cache.doc_count))
+            for term_id, df in known:
+                doc_ids, tfs = cache.postings(conn, term_id)
+                idf = math.log(1 + (cache.doc_count - df + 0.5) / (df + 0.5))
+                contributions = idf * tfs * (BM25_K1 + 1) / (tfs + norms[doc_ids])
+                scores += np.bincount(doc_ids, weights=contributions, minlength=cache.size)
+            mask = cache.live[: cache.size] & (scores > 0)
+            for column, value in (filters or {}).items():
+                if column in FILTER_COLUMNS and value:
+                    code = cache.codes[column].get(str(value).lower(), -1)
+                    mask &= cache.filter_codes[column][: cache.size] == code
+            candidates = np.flatnonzero(mask)
+            page = _top_rows(candidates, scores, offset + limit)[offset:]
+            return {
+                "total": int(len(candidates)),
+                "results": [
+                    {
+                        "resume_id": cache.resume_ids[doc_id],
+                        "score": round(float(scores[doc_id]), 4),
+                        "experience_level": cache.values["experience_level"][doc_id],
+                        "predicted_role": cache.values["predicted_role"][doc_id],
+                    }
+                    for doc_id in page
+                ],
+            }
+
+
+class _SearchCache:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.postings_cache: OrderedDict[int, tuple[np.ndarray, np.ndarray, int]] = OrderedDict()
+        self.cached_postings = 0
+        self.deletion_seq = 0
+        self.size = 0
+        self.doc_count = 0
+        self.total_length = 0
+        self.lengths = np.zeros(0)
+        self.live = np.zeros(0, dtype=bool)
+        self.resume_ids: list[str] = []
+        self.values: dict[str, list[str]] = {column: [] for column in FILTER_COLUMNS}
+        self.codes: dict[str, dict[str, int]] = {column: {} for column in FILTER_COLUMNS}
+        self.filter_codes = {column: np.zeros(0, dtype=np.int32) for column in FILTER_COLUMNS}
+
+    def refresh(self, conn: sqlite3.Connection) -> None:
+        doc_count, total_length = conn.execute("SELECT doc_count, total_length FROM search_stats WHERE id = 0").fetchone()
+        rows = conn.execute(
+            """
+            SELECT doc_id, resume_id, length, experience_level, predicted_role
+            FROM search_documents WHERE doc_id >= ? ORDER BY doc_id
+            """,
+            (self.size,),
+        ).fetchall()
+        if rows:
+            self._grow(rows[-1][0] + 1)
+            for doc_id, resume_id, length, experience_level, predicted_role in rows:
+                self.lengths[doc_id] = length
+                self.live[doc_id] = True
+                self.resume_ids[doc_id] = resume_id
+                for column, value in zip(FILTER_COLUMNS, (experience_level, predicted_role)):
+                    self.values[column][doc_id] = value
+                    codes = self.codes[column]
+                    self.filter_codes[column][doc_id] = codes.setdefault(value.lower(), len(codes))
+        deletions = conn.execute(
+            "SELECT seq, doc_id FROM search_deletions WHERE seq > ? ORDER BY seq",
+            (self.deletion_seq,),
+        ).fetchall()
+        for seq, doc_id in deletions:
+            if doc_id < self.size:
+                self.live[doc_id] = False
+            self.deletion_seq = seq
+        self.doc_count, self.total_length = doc_count, total_length
+
+    def postings(self, conn: sqlite3.Connection, term_id: int) -> tuple[np.ndarray, np.ndarray]:
+        doc_ids, tfs, loaded_until = self.postings_cache.pop(term_id, (np.zeros(0, dtype=np.int64), np.zeros(0), 0))
+        self.cached_postings -= len(doc_ids)
+        if loaded_until < self.size:
+            rows = conn.execute(
+                "SELECT doc_id, tf FROM search_postings WHERE term_id = ? AND doc_id >= ? AND doc_id < ?",
+                (term_id, loaded_until, self.size),
+            ).fetchall()
+            if rows:
+                delta = np.array(rows, dtype=np.int64)
+                doc_ids = np.concatenate([doc_ids, delta[:, 0]])
+                tfs = np.concatenate([tfs, delta[:, 1].astype(float)])
+            loaded_until = self.size
+        self.postings_cache[term_id] = (doc_ids, tfs, loaded_until)
+        self.cached_postings += len(doc_ids)
+        budget = search_cache_postings()
+        while self.cached_postings > budget and len(self.postings_cache) > 1:
+            _, (evicted, _, _) = self.postings_cache.popitem(last=False)
+            self.cached_postings -= len(evicted)
+        return doc_ids, tfs
+
+    def _grow(self, size: int) -> None:
+        if size <= self.size:
+            return
+        capacity = len(self.lengths)
+        if size > capacity:
+            capacity = max(size, capacity * 2)
+            self.lengths = np.concatenate([self.lengths, np.zeros(capacity - len(self.lengths))])
+            self.live = np.concatenate([self.live, np.zeros(capacity - len(self.live), dtype=bool)])
+            for column in FILTER_COLUMNS:
+                codes = self.filter_codes[column]
+                self.filter_codes[column] = np.concatenate([codes, np.full(capacity - len(codes), -1, dtype=np.int32)])
+        self.live[self.size:size] = False
+        self.resume_ids.extend([""] * (size - self.size))
+        for column in FILTER_COLUMNS:
+            self.values[column].extend([""] * (size - self.size))
+            self.filter_codes[column][self.size:size] = -1
+        self.size = size
+
+
+def search_cache_postings() -> int:
+    configured = os.getenv("SEARCH_CACHE_POSTINGS", "").strip()
+    return int(configured) if configured.isdigit() else DEFAULT_CACHE_POSTINGS
+
+
+def _search_cache(conn: sqlite3.Connection) -> _SearchCache:
+    path = conn.execute("PRAGMA database_list").fetchone()[2]
+    with _caches_lock:
+        return _caches.setdefault(path, _SearchCache())
+
+
+def _top_rows(candidates: np.ndarray, scores: np.ndarray, count: int) -> np.ndarray:
+    if count < len(candidates):
+        candidates = candidates[np.argpartition(-scores[candidates], count - 1)[:count]]
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def _placeholders(count: int) -> str:
+    return ", ".join("?" for _ in range(count))
+
+
+def _remove_document(conn: sqlite3.Connection, doc_id: int) -> None:
+    conn.execute(
+        """
+        UPDATE search_terms SET df = df - 1
+        WHERE term_id IN (SELECT term_id FROM search_postings WHERE doc_id = ?)
+        """,
+        (doc_id,),
+    )
+    conn.execute("DELETE FROM search_postings WHERE doc_id = ?", (doc_id,))
+    length = conn.execute("SELECT length FROM search_documents WHERE doc_id = ?", (doc_id,)).fetchone()[0]
+    conn.execute("DELETE FROM search_documents WHERE doc_id = ?", (doc_id,))
+    conn.execute(
+        "UPDATE search_stats SET doc_count = doc_count - 1, total_length = total_length - ? WHERE id = 0",
+        (length,),
+    )
+    conn.execute("INSERT INTO search_deletions (doc_id) VALUES (?)", (doc_id,))
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    path = conn.execute("PRAGMA database_list").fetchone()[2]
+    if path in _ready:
+        return
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS search_documents (
+            doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id TEXT NOT NULL UNIQUE,
+            length INTEGER NOT NULL,
+            experience_level TEXT NOT NULL DEFAULT '',
+            predicted_role TEXT NOT NULL DEFAULT '',
+            indexed_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS search_terms (
+            term_id INTEGER PRIMARY KEY,
+            term TEXT NOT NULL UNIQUE,
+            df INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS search_postings (
+            term_id INTEGER NOT NULL,
+            doc_id INTEGER NOT NULL,
+            tf INTEGER NOT NULL,
+            PRIMARY KEY (term_id, doc_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS search_postings_doc ON search_postings (doc_id);
+        CREATE TABLE IF NOT EXISTS search_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            doc_count INTEGER NOT NULL,
+            total_length INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO search_stats (id, doc_count, total_length) VALUES (0, 0, 0);
+        CREATE TABLE IF NOT EXISTS search_deletions (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            doc_id INTEGER NOT NULL
+        );
+        """
+    )
+    _ready.add(path)
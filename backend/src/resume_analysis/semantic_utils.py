@@ -1,37 +1,174 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from functools import lru_cache
+from pathlib import Path
 
 import numpy as np
+from scipy import sparse
 
+from .embedding_batcher import EmbeddingBatcher, batcher_settings_from_env, batching_enabled
+from .embedding_client import EmbeddingClient
+from .encoder_backends import load_sentence_encoder
+from .embedding_cache import SentenceEmbeddingCache, memory_entries_from_env, spill_max_bytes_from_env, text_key
+from .fallback_encoder import TfidfEncoder, load_or_fit_tfidf_encoder
+from .model_registry import registered_model
+from .vector_store import VectorStore, storage_kind_from_env
 
-@lru_cache(maxsize=1)
+SENTENCE_MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_EMBEDDING_DIR = Path(__file__).resolve().parents[2] / "embedding_cache"
+
+
+def encoder_model_dir() -> Path:
+    configured = os.getenv("EMBEDDING_MODEL_DIR", "").strip()
+    return Path(configured) if configured else embedding_cache_dir() / "encoders" / SENTENCE_MODEL_NAME
+
+
+def embedding_server_socket() -> str | None:
+    configured = os.getenv("EMBEDDING_SERVER_SOCKET", "").strip()
+    return configured or None
+
+
+@registered_model("sentence_transformer", defer_when=lambda: embedding_server_socket() is not None)
 def _load_sentence_transformer():
     try:
-        from sentence_transformers import SentenceTransformer
-
-        return SentenceTransformer("all-MiniLM-L6-v2", local_files_only=True)
+        return load_sentence_encoder(SENTENCE_MODEL_NAME, encoder_model_dir())
     except Exception:
         return None
 
 
+@registered_model("tfidf_fallback_encoder")
+def _load_fallback_encoder() -> TfidfEncoder:
+    return load_or_fit_tfidf_encoder(embedding_cache_dir())
+
+
+def embedding_model_id() -> str:
+    path = embedding_server_socket()
+    if path is not None:
+        model_id = _embedding_client(path).available_model_id()
+        if model_id is not None:
+            return model_id
+    return local_embedding_model_id()
+
+
+def local_embedding_model_id() -> str:
+    model = _load_sentence_transformer()
+    if model is not None:
+        return model.model_id
+    return f"tfidf-{_load_fallback_encoder().fingerprint}"
+
+
+def embedding_cache_dir() -> Path:
+    configured = os.getenv("EMBEDDING_CACHE_DIR", "").strip()
+    return Path(configured) if configured else DEFAULT_EMBEDDING_DIR
+
+
+def precomputed_embeddings(name: str, texts: list[str]) -> VectorStore:
+    if not texts:
+        return VectorStore("float32", np.zeros((0, 0), dtype=np.float32))
+    return _load_precomputed_embeddings(name, embedding_model_id(), storage_kind_from_env(), tuple(texts))
+
+
 def encode_texts(texts: list[str]) -> np.ndarray:
     if not texts:
         return np.zeros((0, 0), dtype=float)
 
-    model = _load_sentence_transformer()
-    if model is not None:
+    client = _remote_client()
+    if client is not None:
         try:
-            vectors = model.encode(texts, normalize_embeddings=True)
-            return np.asarray(vectors, dtype=float)
-        except Exception:
+            return np.asarray(client.encode(texts), dtype=float)
+        except OSError:
             pass
+    return encode_texts_local(texts)
+
+
+def encode_texts_local(texts: list[str]) -> np.ndarray:
+    if not texts:
+        return np.zeros((0, 0), dtype=float)
+
+    model = _load_sentence_transformer()
+    if model is not None:
+        return _encode_with_cache(model, texts)
+    return encode_texts_sparse(texts).toarray()
+
+
+def encode_texts_sparse(texts: list[str]) -> sparse.csr_matrix:
+    return _load_fallback_encoder().transform(texts)
+
+
+def embedding_cache_stats() -> dict:
+    client = _remote_client()
+    if client is not None:
+        return {"enabled": False, "server": client.snapshot()}
+    model = _load_sentence_transformer()
+    if model is None:
+        return {"enabled": False}
+    stats = {"enabled": True, **_sentence_cache(model.model_id, _model_dimension(model)).snapshot()}
+    if batching_enabled():
+        stats["batcher"] = _embedding_batcher(model.model_id).snapshot()
+    return stats
+
+
+def _remote_client() -> EmbeddingClient | None:
+    path = embedding_server_socket()
+    if path is None:
+        return None
+    client = _embedding_client(path)
+    return client if client.available_model_id() is not None else None
+
+
+@lru_cache(maxsize=4)
+def _embedding_client(path: str) -> EmbeddingClient:
+    return EmbeddingClient(path)
+
+
+def _encode_with_cache(model, texts: list[str]) -> np.ndarray:
+    cache = _sentence_cache(model.model_id, _model_dimension(model))
+    keys = [text_key(text) for text in texts]
+    found = cache.get_many(list(dict.fromkeys(keys)))
+    missing = {key: text for key, text in zip(keys, texts) if key not in found}
+    if missing:
+        vectors = _encode_sentences(model, list(missing.values()))
+        found.update(cache.put_many(dict(zip(missing, vectors))))
+    return np.asarray([found[key] for key in keys], dtype=float)
 
-    from sklearn.feature_extraction.text import TfidfVectorizer
 
-    vectorizer = TfidfVectorizer(ngram_range=(1, 2), min_df=1)
-    matrix = vectorizer.fit_transform(texts).toarray()
-    return _normalize_rows(np.asarray(matrix, dtype=float))
+def _encode_sentences(model, texts: list[str]) -> np.ndarray:
+    if batching_enabled():
+        return _embedding_batcher(model.model_id).encode(texts)
+    return np.asarray(model.encode(texts, normalize_embeddings=True), dtype=np.float32)
+
+
+@lru_cache(maxsize=4)
+def _embedding_batcher(model_id: str) -> EmbeddingBatcher:
+    model = _load_sentence_transformer()
+    settings = batcher_settings_from_env()
+    return EmbeddingBatcher(
+        lambda texts: np.asarray(
+            model.encode(texts, normalize_embeddings=True, batch_size=settings["max_batch_size"]),
+            dtype=np.float32,
+        ),
+        name=f"embedding-batcher-{model_id}",
+        **settings,
+    )
+
+
+def _model_dimension(model) -> int:
+    return int(model.get_sentence_embedding_dimension())
+
+
+@lru_cache(maxsize=4)
+def _sentence_cache(model_id: str, dimension: int) -> SentenceEmbeddingCache:
+    kind = storage_kind_from_env()
+    return SentenceEmbeddingCache(
+        dimension,
+        memory_entries=memory_entries_from_env(),
+        kind=kind,
+        spill_path=embedding_cache_dir() / f"sentences-{model_id}-{dimension}.{kind}",
+        spill_max_bytes=spill_max_bytes_from_env(),
+    )
 
 
 def cosine_similarity(vec_a: np.ndarray, vec_b: np.ndarray) -> float:
@@ -43,7 +180,15 @@ def cosine_similarity(vec_a: np.ndarray, vec_b: np.ndarray) -> float:
     return float(np.dot(vec_a, vec_b) / denominator)
 
 
-def rank_similarity(query: str, candidates: dict[str, str]) -> list[dict]:
+def rank_similarity(query: str, candidates: dict[str, str], *, name: str | None = None) -> list[dict]:
+    if name is not None:
+        scores = precomputed_embeddings(name, list(candidates.values())).similarities(encode_texts([query]))
+        results = [
+            {"label": label, "score": round(float(score), 4)}
+            for label, score in zip(candidates.keys(), scores[0] if len(scores) else [])
+        ]
+        return sorted(results, key=lambda item: item["score"], reverse=True)
+
     texts = [query] + list(candidates.values())
     vectors = encode_texts(texts)
     query_vector = vectors[0]
@@ -54,9 +199,21 @@ def rank_similarity(query: str, candidates: dict[str, str]) -> list[dict]:
     return sorted(results, key=lambda item: item["score"], reverse=True)
 
 
-def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
-    if matrix.size == 0:
-        return matrix
-    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
-    norms[norms == 0.0] = 1.0
-    return matrix / norms
+@lru_cache(maxsize=16)
+def _load_precomputed_embeddings(name: str, model_id: str, kind: str, texts: tuple[str, ...]) -> VectorStore:
+    digest = hashlib.sha256(json.dumps([model_id, list(texts)]).encode("utf-8")).hexdigest()[:16]
+    path = embedding_cache_dir() / f"{name}-{model_id}-{digest}.{kind}.npy"
+    if path.exists():
+        try:
+            return VectorStore.load(path, kind)
+        except (OSError, ValueError):
+            pass
+
+    store = VectorStore.from_dense(encode_texts(list(texts)), kind)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        store.save(path)
+        return VectorStore.load(path, kind)
+    except (OSError, ValueError):
+        return store
+
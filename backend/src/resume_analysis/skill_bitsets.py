@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .skill_catalog import SKILL_ALIASES, SKILL_TAXONOMY
+
+WORD_BITS = 64
+QUERY_TOKEN_PATTERN = re.compile(r'\(|\)|"[^"]+"|[^\s()]+')
+QUERY_OPERATORS = {"and", "or", "not"}
+
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+@lru_cache(maxsize=1)
+def skill_vocabulary() -> tuple[str, ...]:
+    skills: set[str] = set(SKILL_ALIASES.values())
+    for category in SKILL_TAXONOMY.values():
+        skills.update(SKILL_ALIASES.get(item.lower(), item.lower()) for item in category)
+    return tuple(sorted(skills))
+
+
+@lru_cache(maxsize=1)
+def vocabulary_fingerprint() -> str:
+    return hashlib.sha256("\n".join(skill_vocabulary()).encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def _skill_positions() -> dict[str, int]:
+    return {skill: position for position, skill in enumerate(skill_vocabulary())}
+
+
+def word_count() -> int:
+    return (len(skill_vocabulary()) + WORD_BITS - 1) // WORD_BITS
+
+
+def canonical_skill(name: str) -> str | None:
+    lowered = " ".join(str(name or "").lower().split())
+    skill = SKILL_ALIASES.get(lowered, lowered)
+    return skill if skill in _skill_positions() else None
+
+
+def pack_skills(skills: list[str]) -> np.ndarray:
+    row = np.zeros(word_count(), dtype=np.uint64)
+    positions = _skill_positions()
+    for skill in skills:
+        position = positions.get(SKILL_ALIASES.get(skill, skill))
+        if position is not None:
+            row[position // WORD_BITS] |= np.uint64(1) << np.uint64(position % WORD_BITS)
+    return row
+
+
+def unpack_skills(row: np.ndarray) -> list[str]:
+    vocabulary = skill_vocabulary()
+    bits = np.unpackbits(np.ascontiguousarray(row, dtype="<u8").view(np.uint8), bitorder="little")
+    return [vocabulary[position] for position in np.flatnonzero(bits[: len(vocabulary)])]
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).astype(np.int64).sum(axis=-1)
+    as_bytes = np.ascontiguousarray(words).view(np.uint8).reshape(*words.shape[:-1], -1)
+    return _BYTE_POPCOUNT[as_bytes].astype(np.int64).sum(axis=-1)
+
+
+@dataclass(frozen=True)
+class SkillBitMatrix:
+    resume_ids: list[str]
+    bits: np.ndarray
+
+    def has_skill(self, skill: str) -> np.ndarray:
+        position = _skill_positions()[skill]
+        word = self.bits[:, position // WORD_BITS]
+        return (word >> np.uint64(position % WORD_BITS)) & np.uint64(1) == 1
+
+    def coverage(self, skills: list[str]) -> np.ndarray:
+        target = pack_skills(skills)
+        total = int(popcount(target))
+        if not total or not len(self.bits):
+            return np.zeros(len(self.bits))
+        return popcount(self.bits & target) / total * 100
+
+    def evaluate(self, query: str) -> np.ndarray:
+        parser = _QueryParser(_tokenize_query(query), self)
+        mask = parser.expression()
+        if parser.position != len(parser.tokens):
+            raise ValueError(f"Unexpected token in skill query: {parser.tokens[parser.position]}")
+        return mask
+
+
+def _tokenize_query(query: str) -> list[str]:
+    tokens: list[str] = []
+    words: list[str] = []
+    for token in QUERY_TOKEN_PATTERN.findall(str(query or "")):
+        if token in {"(", ")"} or token.lower() in QUERY_OPERATORS or token.startswith('"'):
+            if words:
+                tokens.append(" ".join(words))
+                words = []
+            tokens.append(token.strip('"') if token.startswith('"') else token)
+        else:
+            words.append(token)
+    if words:
+        tokens.append(" ".join(words))
+    if not tokens:
+        raise ValueError("Skill query is empty")
+    return tokens
+
+
+class _QueryParser:
+    def __init__(self, tokens: list[str], matrix: SkillBitMatrix) -> None:
+        self.tokens = tokens
+        self.matrix = matrix
+        self.position = 0
+
+    def expression(self) -> np.ndarray:
+        mask = self.term()
+        while self._accept("or"):
+            mask = mask | self.term()
+        return mask
+
+    def term(self) -> np.ndarray:
+        mask = self.factor()
+        while self._accept("and"):
+            mask = mask & self.factor()
+        return mask
+
+    def factor(self) -> np.ndarray:
+        if self._accept("not"):
+            return ~self.factor()
+        if self._accept("("):
+            mask = self.expression()
+            if not self._accept(")"):
+                raise ValueError("Unbalanced parentheses in skill query")
+            return mask
+        if self.position >= len(self.tokens):
+            raise ValueError("Skill query ends unexpectedly")
+        token = self.tokens[self.position]
+        if token == ")" or token.lower() in QUERY_OPERATORS:
+            raise ValueError(f"Unexpected token in skill query: {token}")
+        self.position += 1
+        skill = canonical_skill(token)
+        if skill is None:
+            raise ValueError(f"Unknown skill: {token}")
+        return self.matrix.has_skill(skill)
+
+    def _accept(self, token: str) -> bool:
+        if self.position < len(self.tokens) and self.tokens[self.position].lower() == token:
+            self.position += 1
+            return True
+        return False
@@ -138,6 +138,14 @@ IDEAL_PROFILE_TEXT: dict[str, str] = {
     "DevOps Engineer": "Focuses on cloud platforms, Linux, Docker, Kubernetes, CI/CD pipelines, observability, automation, and infrastructure as code.",
 }
 
+CONCEPT_DEFINITIONS: dict[str, str] = {
+    "Backend Engineering": "designing backend services, APIs, database backed systems, and server side architecture",
+    "System Design": "designing scalable architectures, distributed systems, and reliable technical platforms",
+    "Microservices": "building independently deployable services, APIs, and service based platforms",
+    "Deployment / DevOps": "deploying applications, containerizing services, and managing cloud environments",
+    "Data Science": "analyzing data, building predictive models, and training machine learning systems",
+}
+
 INTERVIEW_TOPIC_MAP: dict[str, list[str]] = {
     "java": ["Java OOP concepts", "Collections, concurrency, and JVM basics"],
     "python": ["Python internals and data structures", "API design and code readability"],
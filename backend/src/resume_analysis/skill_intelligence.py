@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
-from .semantic_utils import cosine_similarity, encode_texts
-from .skill_catalog import IDEAL_PROFILE_TEXT, INTERVIEW_TOPIC_MAP, SKILL_ALIASES, SKILL_TAXONOMY, TECH_PATTERN_ALIASES
+import numpy as np
+
+from .semantic_utils import encode_texts, precomputed_embeddings
+from .skill_catalog import IDEAL_PROFILE_TEXT, INTERVIEW_TOPIC_MAP, SKILL_TAXONOMY
+from .skill_matcher import get_skill_matcher, skill_taxonomy_entries
 
 
 ACTION_WORDS = {
@@ -29,15 +33,16 @@ def extract_skills_with_semantics(sentences: list[str], sections: dict[str, str]
         lowered = sentence.lower()
         location = _detect_sentence_location(sentence, sections)
         sentence_doc = sentence_docs.get(sentence.lower())
-        for category, skills in SKILL_TAXONOMY.items():
-            for raw_skill in skills:
-                skill = SKILL_ALIASES.get(raw_skill, raw_skill)
-                if _contains_phrase(lowered, skill):
-                    _update_match(direct_matches, skill, category, sentence, location, "direct", sentence_doc=sentence_doc)
+        bounded, present = get_skill_matcher().scan(lowered)
+        if not present:
+            continue
+        for category, skill, alias_phrases in skill_taxonomy_entries():
+            if skill in bounded:
+                _update_match(direct_matches, skill, category, sentence, location, "direct", sentence_doc=sentence_doc)
 
-                for alias_phrase in TECH_PATTERN_ALIASES.get(skill, []):
-                    if alias_phrase in lowered:
-                        _update_match(direct_matches, skill, category, sentence, location, "semantic", sentence_doc=sentence_doc)
+            for alias_phrase in alias_phrases:
+                if alias_phrase in present:
+                    _update_match(direct_matches, skill, category, sentence, location, "semantic", sentence_doc=sentence_doc)
 
     semantic_matches = semantic_skill_matching(sentences)
     for match in semantic_matches:
@@ -146,14 +151,11 @@ def suggest_interview_topics(skills: list[str]) -> list[str]:
 
 
 def profile_similarity_analysis(text: str) -> list[dict]:
-    texts = [text] + list(IDEAL_PROFILE_TEXT.values())
-    labels = ["resume"] + list(IDEAL_PROFILE_TEXT.keys())
-    matrix = encode_texts(texts)
-    resume_vector = matrix[0]
-    raw_scores = []
-    for index, label in enumerate(labels[1:], start=1):
-        score = cosine_similarity(resume_vector, matrix[index])
-        raw_scores.append({"profile": label, "raw_score": score})
+    scores = precomputed_embeddings("ideal_profiles", list(IDEAL_PROFILE_TEXT.values())).similarities(encode_texts([text]))
+    raw_scores = [
+        {"profile": label, "raw_score": float(score)}
+        for label, score in zip(IDEAL_PROFILE_TEXT.keys(), scores[0] if len(scores) else [])
+    ]
 
     if not raw_scores:
         return []
@@ -171,33 +173,35 @@ def profile_similarity_analysis(text: str) -> list[dict]:
 
 def semantic_skill_matching(sentences: list[str]) -> list[dict]:
     candidates: list[dict] = []
-    skill_defs = [(skill, definition) for category in SKILL_TAXONOMY.values() for skill, definition in category.items()]
+    skill_defs = _skill_definitions()
     if not sentences or not skill_defs:
         return candidates
 
-    all_texts = sentences + [definition for _, definition in skill_defs]
-    vectors = encode_texts(all_texts)
-    sentence_vectors = vectors[:len(sentences)]
-    definition_vectors = vectors[len(sentences):]
+    definitions = [definition for _, definition in skill_defs]
+    scores = precomputed_embeddings("skill_definitions", definitions).similarities(encode_texts(sentences))
 
-    for sentence_index, sentence in enumerate(sentences):
-        location = "general"
+    mentioned: dict[int, set[str]] = {}
+    for sentence_index, def_index in np.argwhere(scores >= 0.58):
+        sentence = sentences[sentence_index]
         lowered = sentence.lower()
+        skill = skill_defs[def_index][0]
+        if sentence_index not in mentioned:
+            mentioned[sentence_index] = get_skill_matcher().matched_phrases(lowered)
+        if skill in mentioned[sentence_index]:
+            continue
+        location = "general"
         if "project" in lowered:
             location = "projects"
         elif "experience" in lowered or "intern" in lowered:
             location = "experience"
-        for def_index, (skill, _) in enumerate(skill_defs):
-            score = cosine_similarity(sentence_vectors[sentence_index], definition_vectors[def_index])
-            if score >= 0.58 and not _contains_phrase(lowered, skill):
-                candidates.append(
-                    {
-                        "skill": skill,
-                        "score": round(score, 3),
-                        "sentence": sentence,
-                        "location": location,
-                    }
-                )
+        candidates.append(
+            {
+                "skill": skill,
+                "score": round(float(scores[sentence_index, def_index]), 3),
+                "sentence": sentence,
+                "location": location,
+            }
+        )
     deduped: dict[tuple[str, str], dict] = {}
     for item in candidates:
         key = (item["skill"], item["sentence"])
@@ -397,6 +401,11 @@ def _detect_sentence_location(sentence: str, sections: dict[str, str]) -> str:
     return "general"
 
 
+@lru_cache(maxsize=1)
+def _skill_definitions() -> tuple[tuple[str, str], ...]:
+    return tuple((skill, definition) for category in SKILL_TAXONOMY.values() for skill, definition in category.items())
+
+
 def _find_skill_category(skill: str) -> str:
     for category, skills in SKILL_TAXONOMY.items():
         if skill in skills:
@@ -404,9 +413,13 @@ def _find_skill_category(skill: str) -> str:
     return "Concepts"
 
 
+@lru_cache(maxsize=2048)
+def _phrase_pattern(phrase: str) -> re.Pattern[str]:
+    return re.compile(rf"(?<![A-Za-z0-9]){re.escape(phrase)}(?![A-Za-z0-9])", flags=re.IGNORECASE)
+
+
 def _contains_phrase(text: str, phrase: str) -> bool:
-    pattern = rf"(?<![A-Za-z0-9]){re.escape(phrase).replace(r'\\ ', r'\\s+')}(?![A-Za-z0-9])"
-    return bool(re.search(pattern, text, flags=re.IGNORECASE))
+    return bool(_phrase_pattern(phrase).search(text))
 
 
 def _display(skill: str) -> str:
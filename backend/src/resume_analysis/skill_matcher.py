@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import string
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+from .skill_catalog import SKILL_ALIASES, SKILL_TAXONOMY, TECH_PATTERN_ALIASES
+
+WORD_CHARACTERS = frozenset(string.ascii_letters + string.digits)
+
+
+@dataclass(frozen=True)
+class PhraseHit:
+    phrase: str
+    start: int
+    end: int
+    bounded: bool
+
+
+class PhraseMatcher:
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases: tuple[str, ...] = tuple(dict.fromkeys(phrase for phrase in phrases if phrase))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple[int, ...]] = [()]
+        for index, phrase in enumerate(self.phrases):
+            self._insert(index, phrase)
+        self._link()
+
+    def iter_hits(self, text: str) -> Iterator[PhraseHit]:
+        goto, fail, output, phrases = self._goto, self._fail, self._output, self.phrases
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in output[node]:
+                phrase = phrases[index]
+                start = position - len(phrase) + 1
+                yield PhraseHit(phrase, start, position + 1, _is_bounded(text, start, position + 1))
+
+    def find(self, text: str) -> list[PhraseHit]:
+        return list(self.iter_hits(text))
+
+    def matched_phrases(self, text: str, *, bounded: bool = True) -> set[str]:
+        return {hit.phrase for hit in self.iter_hits(text) if hit.bounded or not bounded}
+
+    def scan(self, text: str) -> tuple[set[str], set[str]]:
+        bounded: set[str] = set()
+        present: set[str] = set()
+        for hit in self.iter_hits(text):
+            present.add(hit.phrase)
+            if hit.bounded:
+                bounded.add(hit.phrase)
+        return bounded, present
+
+    def _insert(self, index: int, phrase: str) -> None:
+        node = 0
+        for char in phrase:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = child
+        self._output[node] += (index,)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] += self._output[self._fail[child]]
+
+
+def _is_bounded(text: str, start: int, end: int) -> bool:
+    return (start == 0 or text[start - 1] not in WORD_CHARACTERS) and (
+        end == len(text) or text[end] not in WORD_CHARACTERS
+    )
+
+
+@lru_cache(maxsize=1)
+def skill_taxonomy_entries() -> tuple[tuple[str, str, tuple[str, ...]], ...]:
+    entries = []
+    for category, skills in SKILL_TAXONOMY.items():
+        for raw_skill in skills:
+            skill = SKILL_ALIASES.get(raw_skill, raw_skill)
+            entries.append((category, skill, tuple(TECH_PATTERN_ALIASES.get(skill, []))))
+    return tuple(entries)
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> PhraseMatcher:
+    vocabulary: list[str] = []
+    for _, skill, alias_phrases in skill_taxonomy_entries():
+        vocabulary.append(skill)
+        vocabulary.extend(alias_phrases)
+    for category in SKILL_TAXONOMY.values():
+        vocabulary.extend(skill.lower() for skill in category)
+    vocabulary.extend(SKILL_ALIASES.keys())
+    vocabulary.extend(SKILL_ALIASES.values())
+    for alias_phrases in TECH_PATTERN_ALIASES.values():
+        vocabulary.extend(alias_phrases)
+    return PhraseMatcher(vocabulary)
+
+
+@lru_cache(maxsize=256)
+def get_phrase_matcher(phrases: tuple[str, ...]) -> PhraseMatcher:
+    return PhraseMatcher(phrases)
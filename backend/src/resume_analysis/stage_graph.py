@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from .timing import timed
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    func: Callable[..., Any]
+    requires: tuple[str, ...] = field(default_factory=tuple)
+
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+_MAX_WORKERS: int | None = None
+
+
+def get_max_workers() -> int:
+    if _MAX_WORKERS is not None:
+        return _MAX_WORKERS
+    configured = os.getenv("RESUME_ANALYSIS_MAX_WORKERS", "").strip()
+    if configured.isdigit():
+        return max(1, int(configured))
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def set_max_workers(max_workers: int) -> None:
+    global _EXECUTOR, _MAX_WORKERS
+    with _EXECUTOR_LOCK:
+        _MAX_WORKERS = max(1, int(max_workers))
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=False)
+            _EXECUTOR = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=get_max_workers(), thread_name_prefix="resume-stage")
+        return _EXECUTOR
+
+
+def run_stage_graph(
+    stages: list[Stage],
+    initial: dict[str, Any] | None = None,
+    *,
+    targets: Iterable[str] | None = None,
+    namespace: str = "stage",
+) -> dict[str, Any]:
+    results: dict[str, Any] = dict(initial or {})
+    pending = {stage.name: stage for stage in stages if stage.name not in results}
+    _validate_graph(pending, results)
+    if targets is not None:
+        pending = _dependency_closure(pending, results, targets)
+
+    if get_max_workers() <= 1:
+        for stage in _topological_order(pending, results):
+            results[stage.name] = _call_stage(stage, results, namespace)
+        return results
+
+    executor = _get_executor()
+    running: dict[Future, Stage] = {}
+    try:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if all(dependency in results for dependency in stage.requires):
+                    del pending[name]
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, _call_stage, stage, results, namespace)] = stage
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                results[stage.name] = future.result()
+    finally:
+        for future in running:
+            future.cancel()
+    return results
+
+
+def _call_stage(stage: Stage, results: dict[str, Any], namespace: str) -> Any:
+    with timed(f"{namespace}.{stage.name}"):
+        return stage.func(**{name: results[name] for name in stage.requires})
+
+
+def _validate_graph(pending: dict[str, Stage], results: dict[str, Any]) -> None:
+    known = set(pending) | set(results)
+    for stage in pending.values():
+        missing = [name for name in stage.requires if name not in known]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {', '.join(missing)}")
+    _topological_order(pending, results)
+
+
+def required_stages(stages: list[Stage], targets: Iterable[str], available: Iterable[str] = ()) -> set[str]:
+    return set(_dependency_closure({stage.name: stage for stage in stages}, dict.fromkeys(available), targets))
+
+
+def _dependency_closure(pending: dict[str, Stage], results: dict[str, Any], targets: Iterable[str]) -> dict[str, Stage]:
+    required: dict[str, Stage] = {}
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name in required or name in results:
+            continue
+        if name not in pending:
+            raise ValueError(f"Unknown stage requested: {name}")
+        required[name] = pending[name]
+        stack.extend(pending[name].requires)
+    return {name: stage for name, stage in pending.items() if name in required}
+
+
+def _topological_order(pending: dict[str, Stage], results: dict[str, Any]) -> list[Stage]:
+    resolved = set(results)
+    remaining = dict(pending)
+    ordered: list[Stage] = []
+    while remaining:
+        ready = [stage for stage in remaining.values() if all(name in resolved for name in stage.requires)]
+        if not ready:
+            raise ValueError(f"Stage graph has a cycle between: {', '.join(sorted(remaining))}")
+        for stage in ready:
+            ordered.append(stage)
+            resolved.add(stage.name)
+            del remaining[stage.name]
+    return ordered
@@ -7,6 +7,8 @@ from pathlib import Path
 import requests
 from dotenv import load_dotenv
 
+from .timing import timed
+
 load_dotenv(Path(__file__).resolve().parents[2] / ".env")
 
 DEFAULT_GROQ_MODELS = (
@@ -54,17 +56,18 @@ def _call_groq(prompt: str) -> str:
         }
 
         try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}",
-                    "User-Agent": "smart-interview-system/1.0",
-                    "Accept": "application/json",
-                },
-                timeout=45,
-            )
+            with timed("llm.groq"):
+                response = requests.post(
+                    url,
+                    json=payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {api_key}",
+                        "User-Agent": "smart-interview-system/1.0",
+                        "Accept": "application/json",
+                    },
+                    timeout=45,
+                )
             if response.status_code >= 400:
                 detail = response.text[:1200]
                 last_error = RuntimeError(f"Groq API request failed with status {response.status_code}: {detail}")
@@ -124,17 +127,18 @@ def _call_groq_with_config(
         }
 
         try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}",
-                    "User-Agent": "smart-interview-system/1.0",
-                    "Accept": "application/json",
-                },
-                timeout=45,
-            )
+            with timed("llm.groq"):
+                response = requests.post(
+                    url,
+                    json=payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {api_key}",
+                        "User-Agent": "smart-interview-system/1.0",
+                        "Accept": "application/json",
+                    },
+                    timeout=45,
+                )
             if response.status_code >= 400:
                 detail = response.text[:1200]
                 last_error = RuntimeError(f"Groq API request failed with status {response.status_code}: {detail}")
@@ -503,8 +507,8 @@ Resume:
         raise RuntimeError(f"Groq API failed: {exc}") from exc
 
 
-def generate_suggestions(resume_text: str) -> list[str]:
+def capture_suggestions(generate, *args, **kwargs) -> dict:
     try:
-        return generate_ats_improvement_suggestions(resume_text)[:3]
-    except Exception:
-        return []
+        return {"suggestions": generate(*args, **kwargs)}
+    except Exception as exc:
+        return {"error": str(exc)}
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator
+
+HISTOGRAM_BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_histograms: dict[str, dict] = {}
+_histograms_lock = threading.Lock()
+_request_timings: ContextVar[list[dict] | None] = ContextVar("resume_request_timings", default=None)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        record_timing(
+            name,
+            wall_ms=(time.perf_counter() - wall_start) * 1000,
+            cpu_ms=(time.thread_time() - cpu_start) * 1000,
+        )
+
+
+def record_timing(name: str, *, wall_ms: float, cpu_ms: float) -> None:
+    with _histograms_lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = {
+                "count": 0,
+                "wall_ms_sum": 0.0,
+                "cpu_ms_sum": 0.0,
+                "wall_ms_max": 0.0,
+                "buckets": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1),
+            }
+            _histograms[name] = histogram
+        histogram["count"] += 1
+        histogram["wall_ms_sum"] += wall_ms
+        histogram["cpu_ms_sum"] += cpu_ms
+        histogram["wall_ms_max"] = max(histogram["wall_ms_max"], wall_ms)
+        histogram["buckets"][bisect_left(HISTOGRAM_BUCKETS_MS, wall_ms)] += 1
+
+    collector = _request_timings.get()
+    if collector is not None:
+        collector.append({"name": name, "wall_ms": wall_ms, "cpu_ms": cpu_ms})
+
+
+def start_request_timings() -> Token:
+    return _request_timings.set([])
+
+
+def finish_request_timings(token: Token) -> list[dict]:
+    entries = _request_timings.get() or []
+    _request_timings.reset(token)
+    return entries
+
+
+def current_request_timings() -> list[dict]:
+    return list(_request_timings.get() or [])
+
+
+def summarize_timings(entries: list[dict]) -> dict[str, dict]:
+    summary: dict[str, dict] = {}
+    for entry in entries:
+        item = summary.setdefault(entry["name"], {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+        item["calls"] += 1
+        item["wall_ms"] += entry["wall_ms"]
+        item["cpu_ms"] += entry["cpu_ms"]
+    return {
+        name: {"calls": item["calls"], "wall_ms": round(item["wall_ms"], 2), "cpu_ms": round(item["cpu_ms"], 2)}
+        for name, item in summary.items()
+    }
+
+
+def format_server_timing(entries: list[dict], total_ms: float | None = None) -> str:
+    parts = [f"{name};dur={item['wall_ms']}" for name, item in summarize_timings(entries).items()]
+    if total_ms is not None:
+        parts.append(f"total;dur={round(total_ms, 2)}")
+    return ", ".join(parts)
+
+
+def timing_histograms() -> dict:
+    with _histograms_lock:
+        snapshot = {name: {**item, "buckets": list(item["buckets"])} for name, item in _histograms.items()}
+
+    output: dict[str, dict] = {}
+    for name, item in sorted(snapshot.items()):
+        count = item["count"]
+        bounds = [str(bound) for bound in HISTOGRAM_BUCKETS_MS] + ["+Inf"]
+        output[name] = {
+            "count": count,
+            "wall_ms_avg": round(item["wall_ms_sum"] / count, 2) if count else 0.0,
+            "cpu_ms_avg": round(item["cpu_ms_sum"] / count, 2) if count else 0.0,
+            "wall_ms_max": round(item["wall_ms_max"], 2),
+            "wall_ms_p50": _estimate_percentile(item["buckets"], count, 0.5),
+            "wall_ms_p95": _estimate_percentile(item["buckets"], count, 0.95),
+            "wall_ms_buckets": dict(zip(bounds, item["buckets"])),
+        }
+    return {"bucket_bounds_ms": list(HISTOGRAM_BUCKETS_MS), "stages": output}
+
+
+def reset_timing_histograms() -> None:
+    with _histograms_lock:
+        _histograms.clear()
+
+
+def _estimate_percentile(buckets: list[int], count: int, quantile: float) -> float | None:
+    if not count:
+        return None
+    threshold = quantile * count
+    running = 0
+    for index, bucket_count in enumerate(buckets):
+        running += bucket_count
+        if running >= threshold:
+            return float(HISTOGRAM_BUCKETS_MS[index]) if index < len(HISTOGRAM_BUCKETS_MS) else None
+    return None
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+STORAGE_KINDS = ("float32", "float16", "int8")
+DEFAULT_STORAGE_KIND = "float16"
+INT8_LEVELS = 127.0
+DOT_BLOCK_ROWS = 1024
+
+
+def storage_kind_from_env() -> str:
+    configured = os.getenv("EMBEDDING_STORAGE", "").strip().lower()
+    return configured if configured in STORAGE_KINDS else DEFAULT_STORAGE_KIND
+
+
+def quantize_rows(matrix: np.ndarray, kind: str) -> tuple[np.ndarray, np.ndarray | None]:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if kind == "float32":
+        return np.ascontiguousarray(matrix), None
+    if kind == "float16":
+        return matrix.astype(np.float16), None
+    if kind != "int8":
+        raise ValueError(f"Unknown embedding storage kind: {kind}")
+    peaks = np.abs(matrix).max(axis=1) if matrix.size else np.zeros(len(matrix), dtype=np.float32)
+    scales = np.where(peaks > 0, peaks / INT8_LEVELS, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(matrix / scales[:, None]), -INT8_LEVELS, INT8_LEVELS).astype(np.int8)
+    return codes, scales
+
+
+def dequantize_rows(codes: np.ndarray, scales: np.ndarray | None) -> np.ndarray:
+    values = np.asarray(codes, dtype=np.float32)
+    if scales is None:
+        return values
+    return values * np.asarray(scales, dtype=np.float32)[:, None]
+
+
+@dataclass(frozen=True)
+class VectorStore:
+    kind: str
+    codes: np.ndarray
+    scales: np.ndarray | None = None
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray, kind: str) -> VectorStore:
+        codes, scales = quantize_rows(_unit_rows(matrix), kind)
+        return cls(kind, codes, scales)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def dimension(self) -> int:
+        return self.codes.shape[1] if self.codes.ndim == 2 else 0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0))
+
+    def dequantize(self) -> np.ndarray:
+        return dequantize_rows(self.codes, self.scales)
+
+    def similarities(self, queries: np.ndarray) -> np.ndarray:
+        queries = _unit_rows(queries)
+        if queries.size == 0 or len(self) == 0:
+            return np.zeros((len(queries), len(self)), dtype=float)
+        if queries.shape[1] != self.dimension:
+            raise ValueError(f"Query dimension {queries.shape[1]} does not match stored dimension {self.dimension}")
+        scores = np.empty((len(queries), len(self)), dtype=np.float32)
+        for start in range(0, len(self), DOT_BLOCK_ROWS):
+            stop = start + DOT_BLOCK_ROWS
+            block = np.asarray(self.codes[start:stop], dtype=np.float32)
+            scores[:, start:stop] = queries @ block.T
+        if self.scales is not None:
+            scores *= self.scales[None, :]
+        return scores.astype(float)
+
+    def save(self, path: Path) -> None:
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        if self.scales is not None:
+            scales_path = _scales_path(path)
+            with temp_path.open("wb") as handle:
+                np.save(handle, self.scales)
+            os.replace(temp_path, scales_path)
+        with temp_path.open("wb") as handle:
+            np.save(handle, self.codes)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, kind: str) -> VectorStore:
+        codes = np.load(path, mmap_mode="r")
+        scales = np.load(_scales_path(path)) if kind == "int8" else None
+        if codes.dtype != np.dtype(kind) or (scales is not None and len(scales) != len(codes)):
+            raise ValueError(f"Stored vectors at {path} do not match {kind}")
+        return cls(kind, codes, scales)
+
+
+def _scales_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.scales.npy")
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.size == 0:
+        return matrix
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
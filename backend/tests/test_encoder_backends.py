@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+for path in (BACKEND_DIR.parent, BACKEND_DIR):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from backend.src.resume_analysis.encoder_backends import (
+    PARITY_MIN_COSINE,
+    NumpySentenceEncoder,
+    _load_bert_weights,
+    bert_forward,
+)
+from backend.src.resume_analysis.semantic_utils import SENTENCE_MODEL_NAME
+
+SENTENCES = [
+    "Python",
+    "Built a FastAPI service that handles 10k requests per minute.",
+    "Led a team of four engineers to migrate the billing system to Kubernetes and cut hosting costs by 30%.",
+    "Bachelor of Technology in Computer Science, 2021",
+    "Designed PostgreSQL schemas, wrote Airflow DAGs for nightly ETL jobs, and tuned slow queries with EXPLAIN.",
+    "Skills: React, TypeScript, Docker, AWS, Git",
+]
+
+
+@pytest.fixture(scope="module")
+def sentence_transformer():
+    pytest.importorskip("torch")
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+    try:
+        return sentence_transformers.SentenceTransformer(SENTENCE_MODEL_NAME, device="cpu", local_files_only=True)
+    except Exception as exc:
+        pytest.skip(f"{SENTENCE_MODEL_NAME} is not available locally: {exc}")
+
+
+@pytest.fixture(scope="module")
+def exported_model_dir(sentence_transformer, tmp_path_factory):
+    pytest.importorskip("tokenizers")
+    from export_sentence_encoder import export_config, export_numpy
+
+    output = tmp_path_factory.mktemp("encoder")
+    export_config(sentence_transformer, output)
+    export_numpy(sentence_transformer, output, quantize=True)
+    return output
+
+
+def test_bert_forward_matches_torch():
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=64,
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        intermediate_size=64,
+        max_position_embeddings=16,
+    )
+    model = transformers.BertModel(config, add_pooling_layer=False).eval()
+    state = {name: tensor.detach().numpy() for name, tensor in model.state_dict().items() if tensor.is_floating_point()}
+    input_ids = np.array([[2, 10, 11, 12, 3, 0, 0], [2, 20, 21, 22, 23, 24, 3]], dtype=np.int64)
+    attention_mask = (input_ids != 0).astype(np.int64)
+    token_type_ids = np.zeros_like(input_ids)
+
+    with torch.no_grad():
+        expected = model(
+            input_ids=torch.from_numpy(input_ids),
+            attention_mask=torch.from_numpy(attention_mask),
+            token_type_ids=torch.from_numpy(token_type_ids),
+        ).last_hidden_state.numpy()
+    actual = bert_forward(
+        _load_bert_weights(state),
+        input_ids,
+        attention_mask,
+        token_type_ids,
+        config.num_attention_heads,
+        config.num_hidden_layers,
+        config.layer_norm_eps,
+    )
+
+    tokens = attention_mask.astype(bool)
+    np.testing.assert_allclose(actual[tokens], expected[tokens], atol=1e-4)
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_numpy_encoder_matches_sentence_transformer(sentence_transformer, exported_model_dir, quantize):
+    encoder = NumpySentenceEncoder(SENTENCE_MODEL_NAME, exported_model_dir, quantize=quantize)
+    expected = np.asarray(sentence_transformer.encode(SENTENCES, normalize_embeddings=True), dtype=np.float32)
+    actual = encoder.encode(SENTENCES, normalize_embeddings=True, batch_size=4)
+
+    assert actual.shape == expected.shape
+    assert np.sum(actual * expected, axis=1).min() >= PARITY_MIN_COSINE[quantize]
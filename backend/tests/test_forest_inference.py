@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR.parent) not in sys.path:
+    sys.path.append(str(BACKEND_DIR.parent))
+
+from backend.src.resume_analysis.forest_inference import PARITY_TOLERANCE, export_forest, forest_matches
+
+ensemble = pytest.importorskip("sklearn.ensemble")
+
+
+def _fit_forest(features: np.ndarray, targets: np.ndarray, **params):
+    model = ensemble.RandomForestRegressor(n_estimators=12, random_state=7, **params)
+    return model.fit(features, targets)
+
+
+def _threshold_rows(model, width: int) -> np.ndarray:
+    """Rows that sit exactly on, and one float32 step either side of, every split threshold."""
+    rows = []
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        for node in np.flatnonzero(tree.children_left >= 0):
+            threshold = np.float32(tree.threshold[node])
+            for value in (np.nextafter(threshold, np.float32(-np.inf)), threshold, np.nextafter(threshold, np.float32(np.inf))):
+                row = np.zeros(width, dtype=np.float32)
+                row[tree.feature[node]] = value
+                rows.append(row)
+    return np.asarray(rows)
+
+
+def _assert_parity(model, rows) -> None:
+    forest = export_forest(model)
+    expected = model.predict(np.asarray(rows, dtype=float))
+    np.testing.assert_allclose(forest.predict(rows), expected, rtol=0, atol=PARITY_TOLERANCE)
+    assert forest_matches(model, forest, rows)
+
+
+@pytest.mark.parametrize("max_depth", [None, 1, 4])
+def test_flat_forest_matches_sklearn_on_random_rows(max_depth):
+    rng = np.random.default_rng(0)
+    features = rng.uniform(0, 30, size=(300, 8))
+    targets = features[:, 0] * 0.3 - features[:, 3] * 0.1 + rng.normal(0, 1, size=300)
+    model = _fit_forest(features, targets, max_depth=max_depth)
+
+    _assert_parity(model, rng.uniform(-5, 35, size=(1000, 8)))
+
+
+def test_flat_forest_matches_sklearn_at_split_thresholds():
+    rng = np.random.default_rng(1)
+    features = rng.integers(0, 6, size=(200, 4)).astype(float)
+    targets = features @ np.array([1.0, -2.0, 0.5, 3.0]) + rng.normal(0, 0.1, size=200)
+    model = _fit_forest(features, targets, max_depth=6)
+
+    rows = _threshold_rows(model, features.shape[1])
+    assert len(rows)
+    _assert_parity(model, rows)
+
+
+def test_flat_forest_handles_single_leaf_trees():
+    rng = np.random.default_rng(2)
+    features = rng.uniform(0, 1, size=(50, 3))
+    model = _fit_forest(features, np.full(50, 0.42))
+
+    forest = export_forest(model)
+    assert forest.max_depth == 0
+    _assert_parity(model, rng.uniform(-1, 2, size=(20, 3)))
+
+
+def test_flat_forest_accepts_a_single_row():
+    rng = np.random.default_rng(3)
+    features = rng.uniform(0, 10, size=(100, 5))
+    model = _fit_forest(features, features.sum(axis=1))
+    row = features[0]
+
+    assert export_forest(model).predict(row).shape == (1,)
+    _assert_parity(model, row[None, :])
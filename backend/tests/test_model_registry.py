@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR.parent) not in sys.path:
+    sys.path.append(str(BACKEND_DIR.parent))
+
+from backend.src.resume_analysis import model_registry, report
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(model_registry, "_MODELS", {})
+    monkeypatch.setattr(model_registry, "MODEL_MODULES", ())
+    monkeypatch.setattr(model_registry, "_warm_up_state", {"state": "not_started", "duration_ms": None, "error": None})
+    monkeypatch.setattr(model_registry, "_warm_up_retry_at", 0.0)
+    monkeypatch.setattr(report, "build_advanced_resume_report", lambda *args, **kwargs: {})
+    return model_registry
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_lazy_mode_is_ready_once_every_model_has_loaded(registry, monkeypatch):
+    monkeypatch.setenv("MODEL_WARMUP", "off")
+    first = registry.registered_model("first")(lambda: "first")
+    second = registry.registered_model("second")(lambda: "second")
+
+    assert registry.model_registry_status()["ready"] is False
+    first()
+    assert registry.model_registry_status()["ready"] is False
+    second()
+
+    status = registry.model_registry_status()
+    assert status["ready"] is True
+    assert status["warm_up"]["state"] == "not_started"
+
+
+def test_failed_warm_up_is_retried_from_ready(registry, monkeypatch):
+    monkeypatch.setenv("MODEL_WARMUP", "background")
+    monkeypatch.setattr(registry, "WARM_UP_RETRY_SECONDS", 0.0)
+    attempts = []
+
+    def flaky_loader():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("model files missing")
+        return "model"
+
+    registry.registered_model("flaky")(flaky_loader)
+    registry.warm_up_models()
+    assert registry._warm_up_state["state"] == "failed"
+
+    assert _wait_for(lambda: registry.model_registry_status()["ready"])
+    assert registry._warm_up_state["state"] == "ready"
+    assert len(attempts) == 2
+
+
+def test_failed_warm_up_waits_for_the_retry_interval(registry, monkeypatch):
+    monkeypatch.setenv("MODEL_WARMUP", "background")
+    monkeypatch.setattr(registry, "WARM_UP_RETRY_SECONDS", 3600.0)
+
+    def broken_loader():
+        raise RuntimeError("model files missing")
+
+    registry.registered_model("broken")(broken_loader)
+    registry.warm_up_models()
+
+    assert registry.model_registry_status()["ready"] is False
+    assert registry._warm_up_state["state"] == "failed"